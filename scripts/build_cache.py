@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Build Cache
+콘텐츠 해시 기반 증분 빌드 엔진 (빌드 노드 + 빌드 매니페스트)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from build_trace import get_tracer
+
+CACHE_DIR_NAME = ".build_cache"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 1 << 20
+GLOB_CHARS = set("*?[")
+# 도구/글꼴이 없어 아무것도 만들지 않은 노드의 결과 (출력 없음으로 매니페스트에 기록)
+SKIPPED = ()
+
+
+def file_digest(path):
+    """파일 내용의 SHA-256 해시 계산"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def content_key(*parts):
+    """문자열/바이트 조각들로 캐시 키(SHA-256) 생성"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode('utf-8')
+        digest.update(len(part).to_bytes(8, 'little'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def default_cache_dir():
+    """프로젝트 루트의 빌드 캐시 디렉토리"""
+    return Path(__file__).parent.parent / CACHE_DIR_NAME
+
+
+def expand_inputs(project_dir, patterns):
+    """입력 패턴(파일, 디렉토리, glob)을 실제 파일 목록으로 확장"""
+    project_dir = Path(project_dir)
+    files = set()
+    for pattern in patterns:
+        pattern = str(pattern)
+        if GLOB_CHARS & set(pattern):
+            files.update(p for p in project_dir.glob(pattern) if p.is_file())
+            continue
+        path = project_dir / pattern
+        if path.is_dir():
+            files.update(p for p in path.rglob("*") if p.is_file())
+        elif path.is_file():
+            files.add(path)
+    return sorted(files)
+
+
+class DiskCache:
+    """이름 공간(namespace)별 콘텐츠 주소 디스크 캐시
+
+    키는 입력 내용의 해시이므로 항목이 오래되어 틀려지는 일이 없고,
+    출력 디렉토리를 비우는 전체 빌드 사이에서도 재사용됩니다.
+    """
+
+    def __init__(self, namespace, cache_dir=None):
+        self.directory = Path(cache_dir or default_cache_dir()) / namespace
+
+    def path(self, key, suffix=""):
+        """키에 해당하는 캐시 파일 경로"""
+        return self.directory / key[:2] / f"{key}{suffix}"
+
+    def get(self, key, suffix=""):
+        """캐시된 바이트 반환 (없으면 None)"""
+        try:
+            with open(self.path(key, suffix), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key, data, suffix=""):
+        """바이트를 원자적으로 저장하고 경로 반환"""
+        path = self.path(key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return path
+
+
+class BuildNode:
+    """빌드 그래프의 노드: 선언된 입력으로부터 출력을 만드는 작업
+
+    action은 생성한 출력 파일 경로 목록을 반환합니다.
+    SKIPPED(빈 목록)를 반환하면 (도구 미설치 등으로) 아무것도 만들지 않은 결과로 기록하므로,
+    도구 설치 여부를 params에 넣어 두면 입력과 도구가 그대로인 증분 빌드에서는 다시 실행하지 않습니다.
+    None을 반환하면 매니페스트에 기록하지 않아 다음 빌드에서 다시 실행합니다 (일부만 실패한 경우 등).
+    deps에 나열된 노드가 모두 끝난 뒤에 실행됩니다.
+    """
+
+    def __init__(self, name, inputs, action, params=None, deps=()):
+        self.name = name
+        self.inputs = list(inputs)
+        self.action = action
+        self.params = params or {}
+        self.deps = list(deps)
+
+    def __repr__(self):
+        return f"BuildNode({self.name!r})"
+
+
+class BuildManifest:
+    """노드별 입력 해시와 출력 목록을 기록하는 빌드 매니페스트"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.nodes = {}
+        # 상대 경로 -> [size, mtime_ns, digest]: 변경되지 않은 파일의 재해시를 피함
+        self.stat_cache = {}
+        self.load()
+
+    def load(self):
+        """매니페스트 파일 로드 (없거나 손상된 경우 빈 상태로 시작)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != MANIFEST_VERSION:
+            return
+        self.nodes = data.get("nodes", {})
+        self.stat_cache = data.get("stat_cache", {})
+
+    def save(self):
+        """매니페스트를 원자적으로 저장"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": MANIFEST_VERSION,
+            "nodes": self.nodes,
+            "stat_cache": self.stat_cache,
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def digest(self, path, key):
+        """크기/수정 시각이 같으면 캐시된 해시를 재사용"""
+        stat = path.stat()
+        cached = self.stat_cache.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        value = file_digest(path)
+        self.stat_cache[key] = [stat.st_size, stat.st_mtime_ns, value]
+        return value
+
+
+class IncrementalBuilder:
+    """매니페스트에 기록된 해시와 비교해 변경된 노드만 실행하는 빌더"""
+
+    def __init__(self, project_dir, incremental=True, cache_dir=None):
+        self.project_dir = Path(project_dir)
+        self.incremental = incremental
+        self.cache_dir = Path(cache_dir) if cache_dir else self.project_dir / CACHE_DIR_NAME
+        self.manifest = BuildManifest(self.cache_dir / MANIFEST_NAME)
+        self.executed = []
+        self.skipped = []
+        self.failed = {}
+        self._lock = threading.Lock()
+
+    def relpath(self, path):
+        """프로젝트 기준 상대 경로 (프로젝트 밖이면 절대 경로)"""
+        path = Path(path)
+        try:
+            return path.resolve().relative_to(self.project_dir.resolve()).as_posix()
+        except ValueError:
+            return str(path)
+
+    def fingerprint(self, node):
+        """노드 입력 파일들의 해시 지문"""
+        fingerprint = {}
+        for path in expand_inputs(self.project_dir, node.inputs):
+            key = self.relpath(path)
+            fingerprint[key] = self.manifest.digest(path, key)
+        return fingerprint
+
+    def is_up_to_date(self, node, fingerprint):
+        """입력 해시, 파라미터, 출력 존재 여부가 모두 일치하는지 확인"""
+        entry = self.manifest.nodes.get(node.name)
+        if not entry:
+            return False
+        if entry.get("inputs") != fingerprint or entry.get("params") != node.params:
+            return False
+        return all((self.project_dir / out).exists() for out in entry.get("outputs", []))
+
+    def run(self, node):
+        """노드 실행 (최신 상태면 건너뜀). 실행했으면 True 반환"""
+        fingerprint = self.fingerprint(node)
+        if self.incremental and self.is_up_to_date(node, fingerprint):
+            with self._lock:
+                self.skipped.append(node.name)
+            return False
+
+        with get_tracer().span(node.name, "node"):
+            outputs = node.action()
+        with self._lock:
+            self.executed.append(node.name)
+            if outputs is None:
+                self.manifest.nodes.pop(node.name, None)
+                return True
+
+            outputs = sorted({self.relpath(out) for out in outputs})
+            previous = self.manifest.nodes.get(node.name, {}).get("outputs", [])
+            self.manifest.nodes[node.name] = {
+                "inputs": fingerprint,
+                "params": node.params,
+                "outputs": outputs,
+            }
+        # 이번 실행에서 만들어지지 않은 이전 출력물(예: 예전 타임스탬프 파일) 정리
+        for stale in set(previous) - set(outputs):
+            stale_path = self.project_dir / stale
+            if stale_path.is_file():
+                stale_path.unlink()
+        return True
+
+    def run_graph(self, nodes, jobs=1):
+        """의존성 그래프(DAG)를 따라 독립적인 노드를 병렬 실행
+
+        실패한 노드에 의존하는 노드는 실행하지 않습니다. 실패한 노드 이름과 예외는
+        self.failed에 기록됩니다.
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        by_name = {node.name: node for node in nodes}
+        waiting = {}
+        dependents = {name: [] for name in by_name}
+        for node in nodes:
+            unknown = [dep for dep in node.deps if dep not in by_name]
+            if unknown:
+                raise ValueError(f"{node.name}: 알 수 없는 의존 노드 {unknown}")
+            waiting[node.name] = set(node.deps)
+            for dep in node.deps:
+                dependents[dep].append(node.name)
+
+        # 선언 순서를 유지해 오래 걸리는 노드(PDF 등)를 먼저 시작
+        ready = [node.name for node in nodes if not node.deps]
+        blocked = set()
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            running = {}
+            while ready or running:
+                for name in ready:
+                    running[pool.submit(self.run, by_name[name])] = name
+                ready = []
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        self.failed[name] = error
+                        blocked.update(self._descendants(name, dependents))
+                        continue
+                    for child in dependents[name]:
+                        waiting[child].discard(name)
+                        if not waiting[child] and child not in blocked:
+                            ready.append(child)
+
+        unfinished = [name for name, deps in waiting.items() if deps and name not in blocked]
+        if unfinished:
+            raise ValueError(f"순환 의존성이 있는 노드: {unfinished}")
+        return blocked
+
+    @staticmethod
+    def _descendants(name, dependents):
+        """name에 (직간접적으로) 의존하는 모든 노드"""
+        found = set()
+        stack = list(dependents[name])
+        while stack:
+            child = stack.pop()
+            if child not in found:
+                found.add(child)
+                stack.extend(dependents[child])
+        return found
+
+    def forget(self, names):
+        """그래프에서 사라진 노드의 기록 제거"""
+        for name in list(names):
+            self.manifest.nodes.pop(name, None)
+
+    def save(self):
+        """매니페스트 저장"""
+        self.manifest.save()
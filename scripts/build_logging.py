@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Build Logging
+명령행 실행 시에만 호출하는 로깅 설정 (모듈 import 시에는 로깅을 건드리지 않음)
+"""
+
+import atexit
+import logging
+import sys
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# configure_logging이 추가한 핸들러와 큐 리스너 (다시 설정할 때 정리)
+_installed = []
+_listener = None
+
+
+def configure_logging(level=logging.INFO, log_file=None, stream=sys.stdout, use_queue=False,
+                      fmt=LOG_FORMAT):
+    """루트 로거 설정
+
+    level: 로그 수준 (이름 또는 숫자)
+    log_file: 로그 파일 경로 (None이면 파일에 쓰지 않음)
+    stream: 콘솔 출력 스트림 (None이면 콘솔에 쓰지 않음)
+    use_queue: True이면 QueueHandler로 넘기고 별도 스레드에서 파일/콘솔에 기록
+               (로그 I/O가 렌더링 스레드를 막지 않음)
+    """
+    global _listener
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+
+    root = logging.getLogger()
+    _stop_listener()
+    for handler in _installed:
+        root.removeHandler(handler)
+        handler.close()
+    _installed.clear()
+
+    formatter = logging.Formatter(fmt)
+    handlers = []
+    if stream is not None:
+        handlers.append(logging.StreamHandler(stream))
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, mode='w', encoding='utf-8'))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    if use_queue and handlers:
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+
+        log_queue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, *handlers)
+        _listener.start()
+        handlers = [QueueHandler(log_queue)]
+
+    for handler in handlers:
+        root.addHandler(handler)
+        _installed.append(handler)
+    root.setLevel(level)
+    return root
+
+
+def _stop_listener():
+    """큐 리스너를 멈추고 남은 로그를 모두 기록"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def add_logging_arguments(parser):
+    """명령행 파서에 로깅 옵션 추가"""
+    parser.add_argument("--log-level", default="INFO",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="로그 수준 (기본값: INFO)")
+    parser.add_argument("--log-file", default=None, help="로그를 기록할 파일 (기본값: 없음)")
+    parser.add_argument("--log-queue", action="store_true",
+                        help="로그를 별도 스레드에서 기록 (QueueHandler)")
+
+
+def configure_from_args(args):
+    """add_logging_arguments로 받은 옵션으로 로깅 설정"""
+    return configure_logging(args.log_level, log_file=args.log_file, use_queue=args.log_queue)
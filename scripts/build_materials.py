@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Materials Builder
+한글학교 선생님을 위한 크롬 웹브라우저 활용 교육 자료 빌드 (증분 빌드 지원)
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from build_cache import CACHE_DIR_NAME, MANIFEST_NAME, SKIPPED, BuildNode, IncrementalBuilder, content_key
+from build_logging import add_logging_arguments, configure_from_args
+from build_pdf import PDF_ENGINES, candidate_engines
+from build_trace import get_tracer
+from generate_slides import ChromeEducationSlidesGenerator
+from minify_html import HtmlMinifier
+from prune_scripts import format_report, prune_scripts
+from sync_files import SYNC_RECORD_DIR, FileSync
+from subset_fonts import FONT_WEIGHTS
+from thumbnails import THUMBNAIL_DIR, THUMBNAIL_MANIFEST, renderer_available
+
+SCRIPTS = "scripts"
+WORKBOOK = "docs/chrome_edu_workbook.md"
+PDF_TITLE = "한글학교 선생님을 위한 크롬 웹브라우저 활용 실습 워크북"
+PDF_AUTHOR = "Chrome Education Team"
+THUMBNAILS_MANIFEST = f"output/{THUMBNAIL_DIR}/{THUMBNAIL_MANIFEST}"
+
+
+class MaterialsBuilder:
+    def __init__(self, project_dir=None, incremental=False, jobs=None, trace_file=None,
+                 pdf_engine="auto", precompress=True, minify=True):
+        if project_dir is None:
+            project_dir = Path(__file__).parent.parent
+
+        self.project_dir = Path(project_dir)
+        self.slides_dir = self.project_dir / "slides"
+        self.docs_dir = self.project_dir / "docs"
+        self.output_dir = self.project_dir / "output"
+        self.assets_images_dir = self.output_dir / "assets" / "images"
+        self.incremental = incremental
+        self.jobs = jobs or os.cpu_count() or 1
+        self.trace_file = trace_file
+        self.pdf_engine = pdf_engine
+        self.precompress = precompress
+
+        self.slides = ChromeEducationSlidesGenerator(self.project_dir)
+        self.config = self.slides.get_deck()
+        self.builder = IncrementalBuilder(self.project_dir, incremental=incremental)
+
+        # 순서 번호가 붙은 슬라이드 페이지에 차례로 적용할 HTML 변환
+        self.slide_transforms = [self.rewrite_slide_images]
+        # 페이지 변환이 모두 끝난 HTML을 저장 직전에 최소화 (파일별 절감량 기록)
+        self.minifier = HtmlMinifier() if minify else None
+        self.slides.minifier = self.minifier
+        # 자체 호스팅 CSS의 원본 Tailwind (prepare_css에서 로드)
+        self.vendor_css = None
+        # 서브셋을 만들 원본 글꼴 (prepare_fonts에서 확인)
+        self.font_sources = None
+
+    def clean(self):
+        """출력 디렉토리와 빌드 매니페스트 초기화
+
+        콘텐츠 해시로 주소가 정해지는 캐시(.build_cache/의 나머지)는 전체 빌드에서도 재사용합니다.
+        """
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        (self.project_dir / CACHE_DIR_NAME / MANIFEST_NAME).unlink(missing_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.builder = IncrementalBuilder(self.project_dir, incremental=self.incremental)
+        print("🗑️  출력 디렉토리 초기화 완료")
+
+    def check_slide_files(self):
+        """슬라이드 구성에 포함된 HTML 파일이 모두 존재하는지 확인"""
+        missing = [slide["id"] for slide in self.config["slides"]
+                   if not (self.slides_dir / f"{slide['id']}.html").is_file()]
+        for slide_id in missing:
+            print(f"❌ 슬라이드 파일이 없습니다: {slide_id}.html")
+        return not missing
+
+    # ------------------------------------------------------------------
+    # 노드 작업
+    # ------------------------------------------------------------------
+
+    def build_pdf(self):
+        """워크북 PDF 생성 (장 단위 캐시, pdf_engine: weasyprint, xelatex, auto)"""
+        from build_pdf import ENGINE_LABELS, WorkbookPDF, candidate_engines
+
+        engines = candidate_engines(self.pdf_engine)
+        if not engines:
+            needed = "weasyprint 또는 pandoc + xelatex" if self.pdf_engine == "auto" else self.pdf_engine
+            print(f"⚠️  PDF 엔진({needed})을 사용할 수 없습니다. PDF 생성을 건너뜁니다.")
+            return SKIPPED
+
+        now = datetime.now()
+        pdf_file = self.output_dir / f"chrome_edu_workbook_{now.strftime('%Y%m%d_%H%M')}.pdf"
+        # auto에서는 엔진이 실패하면(예: WeasyPrint의 Pango 라이브러리 누락) 다음 엔진으로 재시도
+        for engine in engines:
+            print(f"🔧 {ENGINE_LABELS[engine]}로 PDF 생성 중 (장 단위)...")
+            try:
+                workbook = WorkbookPDF(engine, self.builder.cache_dir, jobs=self.jobs,
+                                       render_markdown=self.slides.get_markdown_converter().render)
+                workbook.build(self.project_dir / WORKBOOK, pdf_file, PDF_TITLE, PDF_AUTHOR, now)
+            except Exception as e:
+                print(f"⚠️  {ENGINE_LABELS[engine]} 오류: {e}")
+                continue
+            print(f"✅ PDF 생성 완료: {pdf_file.name} ({workbook.summary()})")
+            return [pdf_file]
+        # 엔진 오류는 대개 환경 문제(라이브러리 누락 등)이므로 워크북이나 엔진 선택이 바뀔 때까지 다시 시도하지 않음
+        print("⚠️  PDF 생성 실패, 계속 진행합니다... (워크북이나 PDF 엔진이 바뀌면 다시 시도)")
+        return SKIPPED
+
+    def build_pptx(self):
+        """PowerPoint 프레젠테이션 생성"""
+        from generate_pptx import ChromeEducationPPTXGenerator
+
+        generator = ChromeEducationPPTXGenerator(self.project_dir)
+        return [generator.generate_presentation(self.config)]
+
+    def build_images(self):
+        """슬라이드 이미지의 반응형 WebP/AVIF 변형 생성"""
+        try:
+            from optimize_images import ImageOptimizer, collect_display_widths
+            optimizer = ImageOptimizer(self.slides_dir / "images", self.assets_images_dir,
+                                       self.builder.cache_dir)
+        except ImportError:
+            print("⚠️  Pillow가 설치되어 있지 않습니다. 이미지 최적화를 건너뜁니다.")
+            return SKIPPED
+
+        print("🖼️  이미지 최적화 중...")
+        usage = collect_display_widths(self.slides_dir.glob("*.html"))
+        return optimizer.build(usage)
+
+    def build_thumbnails(self):
+        """index.html 카드에 넣을 슬라이드 미리보기 WebP 생성 (wkhtmltoimage, HTML + 이미지 해시로 캐시)"""
+        try:
+            from thumbnails import ThumbnailRenderer
+            renderer = ThumbnailRenderer(self.slides_dir, self.output_dir / THUMBNAIL_DIR,
+                                         self.builder.cache_dir, jobs=self.jobs)
+        except ImportError:
+            print("⚠️  Pillow가 설치되어 있지 않습니다. 슬라이드 미리보기를 건너뜁니다.")
+            return SKIPPED
+
+        print("🖼️  슬라이드 미리보기 생성 중...")
+        outputs = renderer.build(slide["id"] for slide in self.config["slides"])
+        stats = renderer.stats
+        if stats["missing"]:
+            print(f"⚠️  wkhtmltoimage가 없어 {stats['missing']}개 슬라이드의 미리보기를 만들지 못했습니다. "
+                  "(wkhtmltopdf 패키지 설치 확인)")
+        if stats["failed"]:
+            print(f"⚠️  {stats['failed']}개 슬라이드의 미리보기 렌더링에 실패했습니다. (해당 카드는 글자만 표시)")
+        print(f"  ✅ 미리보기 {stats['rendered'] + stats['cached']}개 "
+              f"(새로 렌더링 {stats['rendered']}, 캐시 {stats['cached']})")
+        # 실패한 슬라이드가 있으면 매니페스트에 기록하지 않아 다음 빌드에서 다시 시도
+        return None if stats["failed"] else outputs
+
+    def rewrite_slide_images(self, html):
+        """슬라이드의 img 태그를 최적화된 이미지 변형(srcset)으로 연결"""
+        from optimize_images import load_responsive_manifest, rewrite_images
+
+        available = {p.name for p in (self.slides_dir / "images").glob("*")}
+        return rewrite_images(html, load_responsive_manifest(self.assets_images_dir),
+                              available=available)
+
+    def render_slide_page(self, index, slide_id):
+        """슬라이드를 순서 번호가 붙은 파일명으로 출력 (페이지 변환 적용)"""
+        dst = self.output_dir / f"{index:02d}_{slide_id}.html"
+        html = (self.slides_dir / f"{slide_id}.html").read_text(encoding='utf-8')
+        for transform in self.slide_transforms:
+            html = transform(html)
+        html, report = prune_scripts(html)
+        if self.minifier is not None:
+            html = self.minifier.minify(dst.name, html)
+        dst.write_text(html, encoding='utf-8')
+        summary = format_report(report)
+        print(f"  ✅ {dst.name} 생성 완료" + (f" (스크립트: {summary})" if summary else ""))
+        return [dst]
+
+    def prepare_css(self):
+        """Tailwind CSS를 로드하고, 가능하면 페이지의 CDN 링크를 자체 호스팅 CSS로 교체"""
+        from purge_css import load_vendor_css, rewrite_stylesheet_link
+
+        self.vendor_css = load_vendor_css(self.builder.cache_dir)
+        if self.vendor_css is None:
+            print("⚠️  Tailwind CSS를 내려받을 수 없습니다. CDN 링크를 그대로 사용합니다. "
+                  f"(오프라인 빌드: {CACHE_DIR_NAME}/vendor/에 tailwind.min.css를 넣어 두세요)")
+            return
+        self.slide_transforms.append(rewrite_stylesheet_link)
+        self.slides.html_filters.append(rewrite_stylesheet_link)
+
+    def build_site_css(self):
+        """생성된 페이지에서 쓰인 클래스만 남긴 assets/site.css 생성"""
+        from purge_css import SITE_CSS, build_site_css
+
+        if self.vendor_css is None:
+            return SKIPPED
+        print("🎨 사용하지 않는 CSS 제거 중...")
+        return [build_site_css(self.vendor_css, sorted(self.output_dir.glob("*.html")),
+                               self.output_dir / SITE_CSS)]
+
+    def prepare_fonts(self):
+        """글꼴 서브셋 도구와 원본 글꼴을 확인하고, 가능하면 Google Fonts 링크를 교체"""
+        try:
+            import brotli  # noqa: F401  (WOFF2 압축)
+            from fontTools import subset  # noqa: F401
+        except ImportError:
+            print("⚠️  fonttools/brotli가 설치되어 있지 않습니다. Google Fonts 링크를 그대로 사용합니다.")
+            return
+        from subset_fonts import find_source_fonts, rewrite_font_link
+
+        self.font_sources = find_source_fonts(self.project_dir)
+        if self.font_sources is None:
+            print("⚠️  Noto Sans KR/CJK 글꼴을 찾을 수 없습니다. Google Fonts 링크를 그대로 사용합니다. "
+                  "(fonts-noto-cjk 설치 또는 fonts/NotoSansKR-Regular.otf, -Bold.otf 추가)")
+            return
+        self.slide_transforms.append(rewrite_font_link)
+        self.slides.html_filters.append(rewrite_font_link)
+
+    def font_source_names(self):
+        """원본 글꼴 경로 목록 (글꼴이 바뀌면 서브셋을 다시 만들도록 노드 파라미터에 포함)"""
+        if self.font_sources is None:
+            return None
+        return [f"{path}#{number}" if number is not None else str(path)
+                for path, number in (self.font_sources[w] for w in FONT_WEIGHTS)]
+
+    def build_fonts(self):
+        """자료에 쓰인 글자만 담은 Noto Sans KR WOFF2 서브셋 생성"""
+        from subset_fonts import FontSubsetter, collect_characters
+
+        if self.font_sources is None:
+            return SKIPPED
+        print("🔤 글꼴 서브셋 생성 중...")
+        files = (sorted(self.slides_dir.glob("*.html")) + sorted(self.docs_dir.glob("*.md"))
+                 + [self.output_dir / "index.html", self.output_dir / "slides_index.html"])
+        characters = collect_characters(
+            files, [json.dumps(self.config, ensure_ascii=False)])
+        subsetter = FontSubsetter(self.font_sources, self.output_dir / "assets" / "fonts",
+                                  self.builder.cache_dir)
+        return subsetter.build(characters)
+
+    def precompress_outputs(self):
+        """output/의 압축할 만한 파일마다 .gz/.br 형제 파일 생성 (build_info.json 기록은 finish()에서)"""
+        from precompress import Precompressor
+
+        print("🗜️  결과물 미리 압축 중...")
+        precompressor = Precompressor(self.output_dir, self.builder.cache_dir, jobs=self.jobs)
+        with get_tracer().span("precompress", "build") as span:
+            summary = precompressor.compress_outputs()
+            span.set(files=len(summary["files"]))
+        total = summary["total"]
+        sizes = ", ".join(f"{encoding} {total[encoding]:,}" for encoding in summary["encodings"])
+        stats = precompressor.stats
+        print(f"  ✅ {len(summary['files'])}개 파일: {total['size']:,} → {sizes} bytes "
+              f"(새로 압축 {stats['compressed']}, 캐시 {stats['cached']}, 효과 없음 {stats['not_smaller']})")
+        return precompressor
+
+    def copy_docs(self):
+        """원본 마크다운 문서 동기화 (변경된 파일만 복사)"""
+        sync = FileSync()
+        copied = sync.sync_files(sorted(self.docs_dir.glob("*.md")), self.output_dir,
+                                 record=self.builder.cache_dir / SYNC_RECORD_DIR / "docs.json")
+        print(f"  ✅ 문서 {len(copied)}개 동기화 완료 ({sync.summary()})")
+        return copied
+
+    # ------------------------------------------------------------------
+    # 빌드 그래프
+    # ------------------------------------------------------------------
+
+    def nodes(self):
+        """빌드 노드 목록 (선언된 입력 기준으로 증분 여부 판단)"""
+        slides_src = f"{SCRIPTS}/generate_slides.py"
+        # CSS/글꼴 링크 교체, 최소화 여부가 바뀌면 페이지를 다시 생성하도록 파라미터에 포함
+        css_inputs = [f"{SCRIPTS}/purge_css.py", f"{SCRIPTS}/subset_fonts.py", f"{SCRIPTS}/minify_html.py"]
+        css_params = {
+            "self_hosted_css": self.vendor_css is not None,
+            "self_hosted_fonts": self.font_sources is not None,
+            "minify": self.minifier is not None,
+        }
+        # 슬라이드 구성은 HTML에서 파싱한 IR로 채워지므로, 그 결과가 바뀔 때만 구성을 쓰는 노드를 다시 실행
+        deck_inputs = [slides_src, f"{SCRIPTS}/slide_ir.py"]
+        deck_params = {"deck": self.deck_key()}
+        # 도구가 없어 건너뛴 노드도 기록되므로, 도구를 설치하면 다시 실행되도록 설치 여부를 파라미터에 포함
+        pillow = importlib.util.find_spec("PIL") is not None
+        # 가장 오래 걸리는 PDF와 PPTX를 먼저 시작하고 나머지 단계는 그 사이에 병렬 실행
+        nodes = [
+            # 장 HTML은 generate_slides.py의 마크다운 변환기로 만들므로 변환기가 바뀌어도 다시 생성
+            # (인쇄용 CSS PRINT_CSS는 build_pdf.py 안에 있음)
+            BuildNode("pdf", [WORKBOOK, f"{SCRIPTS}/build_pdf.py", slides_src], self.build_pdf,
+                      params={"engines": candidate_engines(self.pdf_engine)}),
+            # PPTX는 슬라이드 이미지도 넣으므로 이미지 파일이 바뀌어도 다시 생성
+            BuildNode("pptx", [f"{SCRIPTS}/generate_pptx.py", f"{SCRIPTS}/pptx_media.py",
+                               f"{SCRIPTS}/optimize_images.py", "slides/images"] + deck_inputs,
+                      self.build_pptx, params=deck_params),
+            BuildNode("slide_config", deck_inputs,
+                      lambda: [self.slides.generate_slide_config_file()], params=deck_params),
+            BuildNode("slides", ["slides/*.html", "slides/images", f"{SCRIPTS}/sync_files.py"],
+                      self.slides.copy_existing_slides),
+            BuildNode("docs", ["docs/*.md", f"{SCRIPTS}/sync_files.py"], self.copy_docs),
+            # 슬라이드 미리보기 (렌더러 설치 여부가 바뀌면 다시 실행해 빠진 미리보기를 채움)
+            BuildNode("thumbnails", ["slides/*.html", "slides/images", f"{SCRIPTS}/thumbnails.py"],
+                      self.build_thumbnails, params={"renderer": renderer_available(), "pillow": pillow}),
+            # index.html과 slides_index.html은 같은 카드 순회로 함께 생성 (카드에 미리보기 포함)
+            BuildNode("index", deck_inputs + css_inputs + [f"{SCRIPTS}/thumbnails.py", THUMBNAILS_MANIFEST],
+                      self.slides.generate_indexes, params={**css_params, **deck_params},
+                      deps=["thumbnails"]),
+            # 슬라이드 IR과 문서 본문으로 만드는 검색 색인 (index.html 검색 상자가 사용)
+            BuildNode("search", deck_inputs + ["slides/*.html", "docs/*.md", f"{SCRIPTS}/search_index.py",
+                                               f"{SCRIPTS}/build_pdf.py"],
+                      lambda: [self.slides.generate_search_index()], params=deck_params),
+        ]
+
+        nodes.append(BuildNode(
+            "images", ["slides/images", "slides/*.html", f"{SCRIPTS}/optimize_images.py"],
+            self.build_images, params={"pillow": pillow},
+        ))
+
+        page_inputs = [f"{SCRIPTS}/optimize_images.py", f"{SCRIPTS}/prune_scripts.py",
+                       "output/assets/images/responsive.json"] + css_inputs
+        for i, slide in enumerate(self.config["slides"], start=1):
+            nodes.append(BuildNode(
+                f"slide:{slide['id']}", [f"slides/{slide['id']}.html"] + page_inputs,
+                lambda i=i, slide_id=slide["id"]: self.render_slide_page(i, slide_id),
+                params={"index": i, **css_params},
+                deps=["images"],
+            ))
+
+        for md_file in sorted(self.docs_dir.glob("*.md")):
+            rel = md_file.relative_to(self.project_dir).as_posix()
+            nodes.append(BuildNode(
+                f"markdown:{md_file.stem}", [rel, slides_src] + css_inputs,
+                lambda md_file=md_file: [self.slides.convert_markdown_file(md_file)],
+                params=css_params,
+            ))
+
+        # 모든 HTML 페이지가 생성된 뒤 실제로 쓰인 클래스만 남긴 CSS 생성
+        pages = [node.name for node in nodes
+                 if node.name in ("slides", "index")
+                 or node.name.startswith(("slide:", "markdown:"))]
+        nodes.append(BuildNode(
+            "css", ["output/*.html"] + css_inputs, self.build_site_css,
+            params=css_params, deps=pages,
+        ))
+
+        # 글꼴 서브셋은 글자 집합 해시로 캐시되므로 새 글자가 생길 때만 다시 만들어짐
+        nodes.append(BuildNode(
+            "fonts",
+            ["slides/*.html", "docs/*.md", slides_src, f"{SCRIPTS}/subset_fonts.py",
+             "output/index.html", "output/slides_index.html"],
+            self.build_fonts,
+            params={"weights": list(FONT_WEIGHTS), "sources": self.font_source_names()},
+            deps=["index"],
+        ))
+
+        # 빌드 정보는 PDF/PPTX 파일명을 참조하므로 두 단계가 끝난 뒤 실행
+        nodes.append(BuildNode(
+            "build_info",
+            deck_inputs + ["output/chrome_edu_workbook_*.pdf", "output/chrome_education_slides_*.pptx"],
+            lambda: [self.slides.generate_build_info()],
+            params=deck_params,
+            deps=["pdf", "pptx"],
+        ))
+        return nodes
+
+    def deck_key(self):
+        """IR로 채운 슬라이드 구성의 해시"""
+        return content_key(json.dumps(self.config, ensure_ascii=False, sort_keys=True))
+
+    def build_graph(self, only=None):
+        """빌드 그래프를 한 번 실행하고 선행 단계 실패로 건너뛴 노드 이름 집합 반환
+
+        only에 노드 이름을 주면 그 노드만 그래프 순서대로 실행합니다. 선택하지 않은 노드에 대한
+        의존은 이미 만들어진 출력(또는 출력 없음)을 그대로 쓰는 것으로 봅니다.
+        """
+        self.builder = IncrementalBuilder(self.project_dir, incremental=self.incremental)
+        # 감시 모드에서 슬라이드 HTML이 바뀌었을 수 있으므로 IR을 다시 확인 (바뀌지 않은 파일은 캐시)
+        self.config = self.slides.get_deck(refresh=True)
+        nodes = self.nodes()
+        if only is None:
+            names = {node.name for node in nodes}
+            self.builder.forget(set(self.builder.manifest.nodes) - names)
+        else:
+            nodes = [node for node in nodes if node.name in only]
+            for node in nodes:
+                node.deps = [dep for dep in node.deps if dep in only]
+        try:
+            return self.builder.run_graph(nodes, jobs=self.jobs)
+        finally:
+            self.builder.save()
+
+    def print_outputs(self):
+        """생성된 파일 목록 출력 (미리 압축한 .gz/.br 형제 파일 제외)"""
+        print("\n📋 생성된 파일 목록:")
+        for file_path in sorted(self.output_dir.iterdir()):
+            if file_path.suffix in (".gz", ".br") and file_path.with_suffix("").exists():
+                continue
+            if file_path.is_file():
+                print(f"  📄 {file_path.name} ({file_path.stat().st_size:,} bytes)")
+
+    def run(self):
+        """전체 빌드 실행"""
+        started = time.perf_counter()
+        # 공용 tracer에는 이전 빌드(감시 모드의 재빌드 등)의 span이 남아 있으므로 이 빌드 것만 기록
+        get_tracer().reset()
+        mode = "증분" if self.incremental else "전체"
+        print(f"🚀 Chrome Education Materials Builder 시작 ({mode} 빌드, 작업 {self.jobs}개)")
+        print(f"📁 프로젝트 디렉토리: {self.project_dir}")
+
+        if not self.check_slide_files():
+            return 1
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.prepare_css()
+        self.prepare_fonts()
+        blocked = self.build_graph()
+
+        # 미리 압축은 모든 결과물이 만들어진 뒤 마지막에 실행
+        precompressor = self.precompress_outputs() if self.precompress else None
+        elapsed = time.perf_counter() - started
+        tracer = get_tracer()
+        tracer.embed(self.output_dir / "build_info.json")
+        if precompressor is not None:
+            precompressor.finish()
+        if self.trace_file:
+            print(f"📈 트레이스 저장: {tracer.write_chrome_trace(self.trace_file)}")
+        if self.minifier is not None:
+            self.minifier.print_report()
+        for name, error in self.builder.failed.items():
+            print(f"❌ {name} 단계 실패: {error}")
+        for name in sorted(blocked):
+            print(f"⏹️  {name} 단계 건너뜀 (선행 단계 실패)")
+        if not any(self.output_dir.glob("chrome_edu_workbook_*.pdf")):
+            print("⚠️  워크북 PDF가 생성되지 않았습니다. (--pdf-engine, weasyprint/xelatex 설치 확인)")
+
+        self.print_outputs()
+        print(f"\n🎉 교육 자료 생성 완료! ({elapsed:.2f}초)")
+        print(f"  ▶️  실행: {len(self.builder.executed)}개 노드")
+        print(f"  ⏭️  건너뜀: {len(self.builder.skipped)}개 노드 (변경 없음)")
+        print(f"📂 결과물 위치: {self.output_dir}")
+        print(f"🌐 슬라이드 인덱스: {self.output_dir / 'slides_index.html'}")
+        return 1 if self.builder.failed else 0
+
+
+def add_pdf_arguments(parser):
+    """PDF 엔진 선택 옵션 추가"""
+    parser.add_argument("--pdf-engine", choices=("auto",) + PDF_ENGINES, default="auto",
+                        help="워크북 PDF 엔진 (기본값: auto = weasyprint, 없으면 xelatex)")
+
+
+def add_build_arguments(parser):
+    """빌드 명령행 옵션 추가 (build_materials.py와 chrome_edu.py build 공용)"""
+    parser.add_argument("--incremental", action="store_true",
+                        help="입력 해시가 변경되지 않은 노드는 건너뜀")
+    parser.add_argument("--clean", action="store_true",
+                        help="빌드 전 output 디렉토리와 빌드 매니페스트 삭제")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="동시에 실행할 단계 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--project-dir", type=Path, default=None,
+                        help="프로젝트 디렉토리 (기본값: 스크립트 상위 디렉토리)")
+    parser.add_argument("--trace", type=Path, default=None, metavar="TRACE_JSON",
+                        help="단계별 측정값을 Chrome trace-event 형식으로 저장 (chrome://tracing, Perfetto)")
+    add_pdf_arguments(parser)
+    parser.add_argument("--no-minify", dest="minify", action="store_false",
+                        help="생성한 HTML 페이지를 최소화하지 않음 (공백, 주석 유지)")
+    parser.add_argument("--no-precompress", dest="precompress", action="store_false",
+                        help="결과물의 .gz/.br 미리 압축 파일을 만들지 않음")
+    add_logging_arguments(parser)
+    parser.add_argument("--watch", action="store_true",
+                        help="변경된 파일만 다시 빌드하고 output/을 라이브 리로드 서버로 제공")
+    parser.add_argument("--host", default="127.0.0.1", help="--watch 서버 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="--watch 서버 포트 (기본값: 8000)")
+
+
+def run_build(args):
+    """add_build_arguments로 받은 옵션으로 빌드 실행 (로깅은 호출하는 쪽에서 설정)"""
+    # --watch에서도 같은 옵션으로 빌드 (감시 모드는 항상 증분 빌드)
+    options = {"trace_file": args.trace, "pdf_engine": args.pdf_engine,
+               "precompress": args.precompress, "minify": args.minify}
+    if args.watch:
+        from dev_server import watch
+
+        return watch(args.project_dir, jobs=args.jobs, host=args.host, port=args.port,
+                     clean=args.clean, options=options)
+
+    builder = MaterialsBuilder(args.project_dir, incremental=args.incremental, jobs=args.jobs, **options)
+    if args.clean:
+        builder.clean()
+    return builder.run()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Chrome Education 교육 자료 빌드")
+    add_build_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_from_args(args)
+    return run_build(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
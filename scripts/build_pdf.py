@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Workbook PDF
+워크북 마크다운을 장(chapter) 단위 PDF 조각으로 렌더링하고 하나로 합치는 PDF 생성기
+
+- weasyprint: 마크다운 HTML을 프로세스 안에서 바로 PDF로 렌더링 (기본값, 빠름)
+- xelatex: pandoc + xelatex LaTeX 조판 (느리지만 조판 품질이 높음)
+"""
+
+import html
+import importlib.util
+import io
+import re
+import shutil
+from collections import Counter
+from pathlib import Path
+
+from build_cache import DiskCache, content_key
+from build_trace import get_tracer
+
+# auto일 때 이 순서로 사용 가능한 엔진 선택
+PDF_ENGINES = ("weasyprint", "xelatex")
+ENGINE_LABELS = {"weasyprint": "WeasyPrint", "xelatex": "pandoc + xelatex"}
+PDF_FONT = "Noto Sans CJK KR"
+# 목차에 넣을 책갈피 깊이 (장 + 절)
+TOC_DEPTH = 2
+# 조각 렌더링 방식(HTML 틀, pandoc 옵션)이 바뀌면 올려서 캐시 무효화
+FRAGMENT_FORMAT = "1"
+
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+ATX_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+
+PRINT_CSS = f"""
+@page {{
+    size: A4;
+    margin: 22mm 18mm 20mm;
+    @bottom-center {{ font-size: 9pt; color: #6b7280; }}
+}}
+body {{ font-family: '{PDF_FONT}', 'Noto Sans KR', sans-serif; font-size: 10.5pt; line-height: 1.6; color: #1f2937; }}
+h1 {{ font-size: 20pt; }}
+h2 {{ font-size: 15pt; margin-top: 0; border-bottom: 1px solid #d1d5db; }}
+h3 {{ font-size: 12.5pt; margin-top: 1.2em; }}
+h1, h2, h3, h4 {{ break-after: avoid; }}
+code {{ background-color: #f3f4f6; padding: 0.1em 0.3em; border-radius: 3px; }}
+pre {{ background-color: #f3f4f6; padding: 0.8em; white-space: pre-wrap; break-inside: avoid; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #d1d5db; padding: 0.3em 0.6em; }}
+.cover {{ page: cover; break-after: page; text-align: center; padding-top: 38%; }}
+.cover h1 {{ font-size: 24pt; margin-bottom: 1.5em; }}
+.cover p {{ margin: 0.3em 0; color: #4b5563; }}
+@page cover {{ @bottom-center {{ content: none; }} }}
+nav.toc ol {{ list-style: none; padding-left: 0; }}
+nav.toc li {{ margin: 0.25em 0; }}
+nav.toc li.depth-0 {{ font-weight: bold; margin-top: 0.6em; }}
+nav.toc li.depth-1 {{ padding-left: 1.5em; }}
+nav.toc .page {{ float: right; }}
+"""
+
+
+def engine_available(engine):
+    """엔진이 설치되어 있는지 확인 (weasyprint는 import하지 않고 설치 여부만 확인)"""
+    if engine == "weasyprint":
+        return importlib.util.find_spec("weasyprint") is not None
+    if engine == "xelatex":
+        return bool(shutil.which("pandoc") and shutil.which("xelatex"))
+    raise ValueError(f"알 수 없는 PDF 엔진: {engine}")
+
+
+def candidate_engines(requested="auto"):
+    """시도할 엔진 목록 (auto면 설치된 엔진 전부, 우선순위 순)"""
+    candidates = PDF_ENGINES if requested == "auto" else (requested,)
+    return [engine for engine in candidates if engine_available(engine)]
+
+
+def select_engine(requested="auto"):
+    """사용할 엔진 이름 (쓸 수 없으면 None)"""
+    engines = candidate_engines(requested)
+    return engines[0] if engines else None
+
+
+def engine_version(engine):
+    """캐시 키에 넣을 엔진 버전"""
+    # importlib.metadata, subprocess는 import 비용이 크므로 PDF를 만들 때만 불러옴
+    import importlib.metadata
+    import subprocess
+
+    if engine == "weasyprint":
+        return importlib.metadata.version("weasyprint")
+    result = subprocess.run(["pandoc", "--version"], capture_output=True, text=True)
+    return result.stdout.split("\n", 1)[0]
+
+
+def split_chapters(md_text):
+    """워크북 마크다운을 최상위 장 단위로 분리해 [(장 제목, 장 마크다운, 제목 수준)] 반환
+
+    두 번 이상 나오는 가장 얕은 수준의 제목을 장으로 보고, 그보다 얕은 제목(문서 제목)은
+    표지에서 다루므로 제외합니다. 첫 장 앞에 본문이 있으면 "머리말" 장으로 둡니다.
+    """
+    lines = md_text.splitlines(keepends=True)
+    headings = []
+    fence = None
+    for i, line in enumerate(lines):
+        match = FENCE_RE.match(line)
+        if match:
+            if fence is None:
+                fence = match.group(1)
+            elif match.group(1) == fence:
+                fence = None
+            continue
+        match = None if fence else ATX_HEADING_RE.match(line)
+        if match:
+            headings.append((i, len(match.group(1)), match.group(2)))
+
+    counts = Counter(level for _, level, _ in headings)
+    levels = sorted(level for level, count in counts.items() if count > 1)
+    if not levels:
+        return [("", md_text, 1)]
+    level = levels[0]
+
+    starts = [(i, text) for i, heading_level, text in headings if heading_level == level]
+    title_lines = {i for i, heading_level, _ in headings if heading_level < level}
+    chapters = []
+    preamble = "".join(line for i, line in enumerate(lines[:starts[0][0]]) if i not in title_lines)
+    if preamble.strip():
+        chapters.append(("머리말", preamble, level))
+    for (start, text), (end, _) in zip(starts, starts[1:] + [(len(lines), None)]):
+        chapters.append((text, "".join(lines[start:end]), level))
+    return chapters
+
+
+def chapter_html(body, number):
+    """장 하나의 인쇄용 HTML (쪽 번호는 "장-쪽" 형식, 제목은 PDF 책갈피가 됨)"""
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<style>{PRINT_CSS}
+@page {{ @bottom-center {{ content: "{number}-" counter(page); }} }}</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+def front_matter_html(title, author, date, toc):
+    """표지와 목차 HTML (toc: (깊이, 제목, 쪽 레이블) 목록)"""
+    items = "".join(
+        f'<li class="depth-{depth}">{html.escape(text)}<span class="page">{label}</span></li>'
+        for depth, text, label in toc
+    )
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<style>{PRINT_CSS}
+@page {{ @bottom-center {{ content: counter(page, lower-roman); }} }}</style>
+</head>
+<body>
+<section class="cover">
+<h1>{html.escape(title)}</h1>
+<p>{html.escape(author)}</p>
+<p>{date.strftime('%Y년 %m월 %d일')}</p>
+</section>
+<nav class="toc">
+<h2>목차</h2>
+<ol>{items}</ol>
+</nav>
+</body>
+</html>
+"""
+
+
+def front_matter_markdown(title, author, date, toc):
+    """xelatex 엔진용 표지와 목차 마크다운"""
+    lines = ["---", f'title: "{title}"', f'author: "{author}"',
+             f"date: \"{date.strftime('%Y년 %m월 %d일')}\"", "---", "", "\\newpage", "", "# 목차 {-}", ""]
+    for depth, text, label in toc:
+        lines.append(f"{'    ' * depth}- {text} \\dotfill {label}")
+    return "\n".join(lines) + "\n"
+
+
+def render_pandoc(markdown_text, page_format, heading_shift=0):
+    """pandoc + xelatex로 마크다운을 PDF 바이트로 렌더링 (page_format: \\thepage 정의)"""
+    import subprocess
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="chrome_edu_pdf_") as tmp:
+        pdf_file = Path(tmp) / "fragment.pdf"
+        subprocess.run([
+            "pandoc", "-f", "markdown", "-o", str(pdf_file),
+            "--pdf-engine=xelatex",
+            f"--shift-heading-level-by={heading_shift}",
+            "--variable", f"mainfont={PDF_FONT}",
+            "--variable", "lang=ko",
+            "--variable", f"header-includes=\\renewcommand{{\\thepage}}{{{page_format}}}",
+        ], input=markdown_text.encode('utf-8'), check=True, capture_output=True)
+        return pdf_file.read_bytes()
+
+
+def render_fragment(engine, source, number, heading_shift=0, base_url=None):
+    """장 하나(또는 number=None인 표지·목차)를 PDF 바이트로 렌더링 (작업자 프로세스에서도 호출)"""
+    if engine == "weasyprint":
+        from weasyprint import HTML
+
+        return HTML(string=source, base_url=base_url).write_pdf()
+    page_format = "\\roman{page}" if number is None else f"{number}-\\arabic{{page}}"
+    return render_pandoc(source, page_format, heading_shift)
+
+
+def read_outline(reader):
+    """PDF 책갈피를 (깊이, 제목, 0부터 센 쪽 번호) 목록으로 평탄화"""
+    entries = []
+
+    def walk(items, depth):
+        for item in items:
+            if isinstance(item, list):
+                walk(item, depth + 1)
+            else:
+                entries.append((depth, item.title, reader.get_destination_page_number(item)))
+
+    walk(reader.outline, 0)
+    return entries
+
+
+def merge_fragments(parts, pdf_file, title, author, date):
+    """PDF 조각을 순서대로 합치고 책갈피, 쪽 레이블, 문서 메타데이터를 다시 만듦
+
+    parts: (PdfReader, 책갈피 목록, 쪽 번호 접두어) 목록. 접두어가 None이면 로마 숫자 쪽 번호
+    """
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for reader, outline, prefix in parts:
+        start = len(writer.pages)
+        writer.append(reader, import_outline=False)
+        end = len(writer.pages) - 1
+        if prefix is None:
+            writer.set_page_label(start, end, style="/r")
+        else:
+            writer.set_page_label(start, end, style="/D", prefix=f"{prefix}-")
+
+        parents = []
+        for depth, text, page in outline:
+            del parents[depth:]
+            parents.append(writer.add_outline_item(text, start + page,
+                                                   parent=parents[-1] if parents else None))
+
+    writer.add_metadata({
+        "/Title": title,
+        "/Author": author,
+        "/Creator": "Chrome Education Materials Builder",
+        "/CreationDate": date.strftime("D:%Y%m%d%H%M%S"),
+    })
+    with open(pdf_file, 'wb') as f:
+        writer.write(f)
+    return pdf_file
+
+
+class WorkbookPDF:
+    """장 단위로 캐시하는 워크북 PDF 생성기
+
+    워크북을 최상위 장으로 나눠 장마다 PDF 조각을 만들고(엔진 + 내용 해시로 캐시) 바뀐 장만
+    병렬로 다시 렌더링한 뒤, 표지·목차·책갈피·쪽 레이블을 새로 만들어 하나로 합칩니다.
+    쪽 번호가 "장-쪽" 형식이므로 앞 장의 분량이 바뀌어도 뒤 장의 조각은 그대로 재사용됩니다.
+    """
+
+    def __init__(self, engine, cache_dir=None, jobs=1, render_markdown=None):
+        self.engine = engine
+        self.cache = DiskCache("pdf", cache_dir)
+        self.jobs = jobs
+        self.render_markdown = render_markdown
+        self.version = engine_version(engine)
+        self.stats = Counter()
+
+    def fragment_source(self, markdown_text, number):
+        """엔진에 넘길 장 원본 (weasyprint: 인쇄용 HTML, xelatex: 마크다운)"""
+        if self.engine == "weasyprint":
+            return chapter_html(self.render_markdown(markdown_text), number)
+        return markdown_text
+
+    def render_all(self, tasks):
+        """(원본, 장 번호, 제목 이동, base_url) 목록을 렌더링
+
+        WeasyPrint는 순수 Python이라 GIL을 피하려고 프로세스 풀, xelatex는 하위 프로세스라 스레드 풀 사용
+        """
+        if self.jobs <= 1 or len(tasks) <= 1:
+            return [render_fragment(self.engine, *task) for task in tasks]
+        if self.engine == "weasyprint":
+            from concurrent.futures import ProcessPoolExecutor as Executor
+        else:
+            from concurrent.futures import ThreadPoolExecutor as Executor
+        with Executor(max_workers=min(self.jobs, len(tasks))) as pool:
+            return list(pool.map(render_fragment, [self.engine] * len(tasks), *zip(*tasks)))
+
+    def cached_render(self, tasks):
+        """캐시에 없는 조각만 렌더링하고 모든 조각의 PDF 바이트 반환"""
+        keys = [content_key(FRAGMENT_FORMAT, self.engine, self.version, str(number), str(shift), source)
+                for source, number, shift, _ in tasks]
+        fragments = [self.cache.get(key, ".pdf") for key in keys]
+        missing = [i for i, data in enumerate(fragments) if data is None]
+        if missing:
+            for i, data in zip(missing, self.render_all([tasks[i] for i in missing])):
+                fragments[i] = data
+                self.cache.put(keys[i], data, ".pdf")
+        self.stats["rendered"] += len(missing)
+        self.stats["cached"] += len(tasks) - len(missing)
+        return fragments
+
+    def build(self, workbook, pdf_file, title, author, date):
+        """워크북 PDF 생성 (바뀐 장만 다시 렌더링)"""
+        from pypdf import PdfReader
+
+        workbook = Path(workbook)
+        base_url = str(workbook.parent)
+        chapters = split_chapters(workbook.read_text(encoding='utf-8'))
+        tasks = [(self.fragment_source(text, number), number, 1 - level, base_url)
+                 for number, (_, text, level) in enumerate(chapters, start=1)]
+
+        tracer = get_tracer()
+        with tracer.span("pdf:chapters", "pdf", engine=self.engine, chapters=len(tasks)) as span:
+            readers = [PdfReader(io.BytesIO(data)) for data in self.cached_render(tasks)]
+            span.set(rendered=self.stats["rendered"])
+
+        outlines = []
+        for (chapter_title, _, _), reader in zip(chapters, readers):
+            # 책갈피가 없는 조각(제목 없는 머리말 등)은 장 제목 하나만 등록
+            outlines.append(read_outline(reader) or [(0, chapter_title, 0)])
+        toc = [(depth, text, f"{number}-{page + 1}")
+               for number, outline in enumerate(outlines, start=1)
+               for depth, text, page in outline if depth < TOC_DEPTH]
+
+        with tracer.span("pdf:front_matter", "pdf"):
+            if self.engine == "weasyprint":
+                source = front_matter_html(title, author, date, toc)
+            else:
+                source = front_matter_markdown(title, author, date, toc)
+            front = PdfReader(io.BytesIO(self.cached_render([(source, None, 0, base_url)])[0]))
+
+        with tracer.span("pdf:merge", "pdf") as span:
+            parts = [(front, [(0, "목차", min(1, len(front.pages) - 1))], None)]
+            parts += [(reader, outline, number)
+                      for number, (reader, outline) in enumerate(zip(readers, outlines), start=1)]
+            merge_fragments(parts, pdf_file, title, author, date)
+            span.set(bytes_written=Path(pdf_file).stat().st_size)
+        return pdf_file
+
+    def summary(self):
+        """렌더링/캐시 재사용 조각 수 한 줄 요약"""
+        return f"렌더링 {self.stats['rendered']}개, 캐시 재사용 {self.stats['cached']}개"
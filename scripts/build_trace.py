@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Build Trace
+빌드 단계별 실행 구간(span)의 시간, CPU, 최대 메모리, 쓴 바이트 수를 기록하고
+Chrome trace-event 형식(chrome://tracing, Perfetto)으로 내보내는 계측 도구
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROC_IO = Path("/proc/self/io")
+
+
+def peak_rss_kb():
+    """프로세스 최대 RSS (KB). 측정할 수 없으면 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, Linux는 KB 단위
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def children_cpu():
+    """종료된 하위 프로세스(pandoc, xelatex 등)가 쓴 CPU 시간 합계 (초)"""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def bytes_written():
+    """프로세스가 지금까지 write 시스템 호출로 쓴 바이트 수 (Linux 외에는 None)"""
+    try:
+        with open(PROC_IO, 'rb') as f:
+            for line in f:
+                if line.startswith(b"wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+class Span:
+    """실행 구간 하나의 측정값"""
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = dict(args)
+        self.thread_id = threading.get_ident()
+        self.thread_name = threading.current_thread().name
+        self.start = 0.0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak_rss_kb = None
+        self.bytes_written = None
+
+    def set(self, **args):
+        """구간에 추가 정보 기록 (예: bytes_written=출력 파일 크기)"""
+        if "bytes_written" in args:
+            self.bytes_written = args.pop("bytes_written")
+        self.args.update(args)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "cat": self.category,
+            "wall_ms": round(self.wall * 1000, 3),
+            "cpu_ms": round(self.cpu * 1000, 3),
+            "peak_rss_kb": self.peak_rss_kb,
+            "bytes_written": self.bytes_written,
+        }
+
+
+class Tracer:
+    """스레드 안전한 span 수집기
+
+    CPU 시간은 span을 실행한 스레드의 시간과 그 사이 종료된 하위 프로세스의 시간을 더한 값입니다.
+    쓴 바이트 수는 프로세스 전체 카운터의 차이이므로 병렬로 실행된 span끼리는 겹칠 수 있습니다.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """기록한 span을 비우고 시간 기준점을 지금으로 옮김 (같은 프로세스에서 빌드를 다시 시작할 때)"""
+        with self._lock:
+            self.origin = time.perf_counter()
+            self.spans = []
+
+    @contextmanager
+    def span(self, name, category="build", **args):
+        """with 블록 실행을 한 span으로 기록"""
+        span = Span(name, category, args)
+        written = bytes_written()
+        child_cpu = children_cpu()
+        cpu = time.thread_time()
+        started = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.wall = time.perf_counter() - started
+            span.cpu = time.thread_time() - cpu + children_cpu() - child_cpu
+            span.start = started - self.origin
+            span.peak_rss_kb = peak_rss_kb()
+            if span.bytes_written is None and written is not None:
+                span.bytes_written = bytes_written() - written
+            with self._lock:
+                self.spans.append(span)
+
+    def summary(self):
+        """build_info.json에 넣을 span 목록 (시작 순서)"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+        return {
+            "total_ms": round((time.perf_counter() - self.origin) * 1000, 3),
+            "peak_rss_kb": peak_rss_kb(),
+            "spans": [span.to_dict() for span in spans],
+        }
+
+    def chrome_trace(self):
+        """Chrome trace-event 형식 사전 (완료 이벤트 "X" + 스레드 이름 메타데이터)"""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        threads = {span.thread_id: span.thread_name for span in spans}
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                  for tid, name in threads.items()]
+        for span in sorted(spans, key=lambda span: span.start):
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round(span.start * 1e6, 3),
+                "dur": round(span.wall * 1e6, 3),
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {**span.args, **{k: v for k, v in span.to_dict().items()
+                                         if k not in ("name", "cat", "wall_ms")}},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        """trace.json 저장 (chrome://tracing 또는 https://ui.perfetto.dev 에서 열기)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f, ensure_ascii=False)
+        return path
+
+    def embed(self, build_info_file):
+        """build_info.json에 "trace" 항목으로 측정값 추가 (파일이 없으면 무시)"""
+        build_info_file = Path(build_info_file)
+        try:
+            with open(build_info_file, 'r', encoding='utf-8') as f:
+                build_info = json.load(f)
+        except (OSError, ValueError):
+            return None
+        build_info["trace"] = self.summary()
+        with open(build_info_file, 'w', encoding='utf-8') as f:
+            json.dump(build_info, f, ensure_ascii=False, indent=2)
+        return build_info_file
+
+
+_tracer = Tracer()
+
+
+def get_tracer():
+    """프로세스 공용 tracer"""
+    return _tracer
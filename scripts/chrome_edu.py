@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Chrome Education CLI
+하나의 Python 프로세스에서 교육 자료 빌드 단계를 실행하는 통합 명령
+
+사용법:
+    python3 scripts/chrome_edu.py build [--incremental] [--clean] [-j N]   # 전체 빌드
+    python3 scripts/chrome_edu.py pptx [--variants variants.json -j N]   # PowerPoint만 생성
+    python3 scripts/chrome_edu.py pdf [--pdf-engine xelatex]             # 워크북 PDF만 생성
+    python3 scripts/chrome_edu.py index                                  # 인덱스 페이지, 검색 색인, build_info.json, CSS/글꼴
+    python3 scripts/chrome_edu.py serve [--port 8000]                    # 변경 감시 + 라이브 리로드 서버
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from build_logging import add_logging_arguments, configure_from_args
+from build_materials import MaterialsBuilder, add_build_arguments, add_pdf_arguments, run_build
+
+
+def add_common_arguments(parser):
+    """모든 하위 명령이 받는 옵션"""
+    parser.add_argument("--project-dir", type=Path, default=None,
+                        help="프로젝트 디렉토리 (기본값: 스크립트 상위 디렉토리)")
+    add_logging_arguments(parser)
+
+
+def command_build(args):
+    return run_build(args)
+
+
+def command_pptx(args):
+    from generate_pptx import ChromeEducationPPTXGenerator, load_variants
+
+    materials = MaterialsBuilder(args.project_dir)
+    generator = ChromeEducationPPTXGenerator(materials.project_dir)
+    if args.variants:
+        try:
+            variants = load_variants(args.variants, materials.config)
+        except ValueError as error:
+            print(f"❌ 변형 목록 오류: {error}")
+            return 1
+        generator.generate_batch(variants, jobs=args.jobs, config=materials.config)
+    else:
+        generator.generate_presentation(materials.config)
+    return 0
+
+
+def command_pdf(args):
+    materials = MaterialsBuilder(args.project_dir, pdf_engine=args.pdf_engine)
+    return 0 if materials.build_pdf() else 1
+
+
+# index 명령이 실행하는 빌드 노드 (인덱스 페이지가 링크하는 assets/site.css와 글꼴 CSS 포함)
+INDEX_NODES = ("slide_config", "index", "search", "css", "fonts", "build_info")
+
+
+def command_index(args):
+    """슬라이드 구성, 두 인덱스 페이지, 검색 색인, 빌드 정보와 페이지가 링크하는 CSS/글꼴을 같은 구성으로 생성"""
+    materials = MaterialsBuilder(args.project_dir)
+    materials.output_dir.mkdir(parents=True, exist_ok=True)
+    materials.prepare_css()
+    materials.prepare_fonts()
+    blocked = materials.build_graph(only=INDEX_NODES)
+    for name, error in materials.builder.failed.items():
+        print(f"❌ {name} 단계 실패: {error}")
+    for name in sorted(blocked):
+        print(f"⏹️  {name} 단계 건너뜀 (선행 단계 실패)")
+    return 1 if materials.builder.failed else 0
+
+
+def command_serve(args):
+    from dev_server import watch
+
+    return watch(args.project_dir, jobs=args.jobs, host=args.host, port=args.port, clean=args.clean)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="chrome-edu", description="Chrome Education 교육 자료 도구")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="전체 교육 자료 빌드 (의존성 그래프, 병렬 실행)")
+    add_build_arguments(build)
+    build.set_defaults(func=command_build)
+
+    pptx = commands.add_parser("pptx", help="PowerPoint 프레젠테이션 생성")
+    add_common_arguments(pptx)
+    pptx.add_argument("--variants", type=Path, default=None,
+                      help="학교별 변형 목록 JSON 파일 (변형 덱 일괄 생성)")
+    pptx.add_argument("-j", "--jobs", type=int, default=1, help="변형 덱 생성에 사용할 프로세스 수")
+    pptx.set_defaults(func=command_pptx)
+
+    pdf = commands.add_parser("pdf", help="실습 워크북 PDF 생성")
+    add_common_arguments(pdf)
+    add_pdf_arguments(pdf)
+    pdf.set_defaults(func=command_pdf)
+
+    index = commands.add_parser("index", help="index.html, slides_index.html, search_index.json.gz, build_info.json 생성")
+    add_common_arguments(index)
+    index.set_defaults(func=command_index)
+
+    serve = commands.add_parser("serve", help="변경 감시 재빌드와 라이브 리로드 서버")
+    add_common_arguments(serve)
+    serve.add_argument("-j", "--jobs", type=int, default=None,
+                       help="동시에 실행할 단계 수 (기본값: CPU 코어 수)")
+    serve.add_argument("--clean", action="store_true", help="시작 전 output 디렉토리 초기화")
+    serve.add_argument("--host", default="127.0.0.1", help="서버 주소 (기본값: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8000, help="서버 포트 (기본값: 8000)")
+    serve.set_defaults(func=command_serve)
+
+    args = parser.parse_args(argv)
+    configure_from_args(args)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Dev Server
+파일 변경을 감시해 바뀐 출력만 다시 빌드하고, output/을 라이브 리로드 HTTP 서버로 제공
+"""
+
+import ctypes
+import ctypes.util
+import email.utils
+import importlib
+import io
+import json
+import os
+import re
+import select
+import struct
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from build_cache import file_digest
+from build_trace import get_tracer
+
+WATCH_DIRS = ("slides", "slides/images", "docs", "scripts")
+DEBOUNCE_SECONDS = 0.03
+POLL_INTERVAL = 0.25
+KEEPALIVE_SECONDS = 15
+RELOAD_PATH = "/__livereload"
+
+# scripts/ 변경 시 다시 불러올 모듈 (의존 순서)
+SCRIPT_MODULES = (
+    "build_cache", "sync_files", "optimize_images", "purge_css", "subset_fonts",
+    "prune_scripts", "minify_html", "build_pdf", "slide_ir", "page_templates", "search_index",
+    "precompress", "thumbnails", "generate_slides", "pptx_media", "generate_pptx", "build_materials",
+)
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+LIVE_RELOAD_SCRIPT = f"""<script>
+(function () {{
+  var page = location.pathname.split('/').pop() || 'index.html';
+  new EventSource('{RELOAD_PATH}').onmessage = function (event) {{
+    var changed = JSON.parse(event.data);
+    if (changed.some(function (path) {{ return path === page || !/\\.html$/.test(path); }})) {{
+      location.reload();
+    }}
+  }};
+}})();
+</script>
+"""
+
+
+# 편집기/도구의 임시 파일: vim 쓰기 확인(4913), sed -i(sedXXXXXX), emacs 잠금(#파일#)
+TEMPORARY_NAME_RE = re.compile(r"4913|sed[A-Za-z0-9]{6}|#.*#")
+
+
+def is_temporary(name):
+    """편집기 임시 파일(.swp, ~ 백업, 숨김 파일, sed -i 작업 파일 등)인지 확인"""
+    return (name.startswith(".") or name.endswith(("~", ".swp", ".swx", ".tmp", ".bak", ".part"))
+            or TEMPORARY_NAME_RE.fullmatch(name) is not None)
+
+
+class InotifyWatcher:
+    """ctypes로 호출하는 Linux inotify 감시기"""
+
+    def __init__(self, directories):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify를 지원하지 않는 플랫폼입니다")
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        self.directories = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd >= 0:
+                self.directories[wd] = Path(directory)
+
+    def read_events(self):
+        """쌓인 이벤트를 읽어 변경된 경로 집합 반환"""
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode('utf-8', 'replace')
+                offset += length
+                if wd in self.directories and name and not is_temporary(name):
+                    changed.add(self.directories[wd] / name)
+
+    def wait(self, timeout=None):
+        """변경이 생길 때까지 기다렸다가 짧게 모아서 반환"""
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        changed = self.read_events()
+        while select.select([self.fd], [], [], DEBOUNCE_SECONDS)[0]:
+            changed |= self.read_events()
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """inotify가 없는 플랫폼(macOS, Windows)용 수정 시각 비교 감시기"""
+
+    def __init__(self, directories):
+        self.directories = [Path(directory) for directory in directories]
+        self.snapshot = self.scan()
+
+    def scan(self):
+        state = {}
+        for directory in self.directories:
+            for path in directory.glob("*"):
+                if path.is_file() and not is_temporary(path.name):
+                    stat = path.stat()
+                    state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while deadline is None or time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+            current = self.scan()
+            changed = {path for path in current.keys() | self.snapshot.keys()
+                       if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changed:
+                return changed
+        return set()
+
+    def close(self):
+        pass
+
+
+def create_watcher(directories):
+    """가능하면 inotify, 아니면 폴링 감시기 생성"""
+    try:
+        return InotifyWatcher(directories)
+    except (OSError, AttributeError):
+        return PollingWatcher(directories)
+
+
+class LiveReload:
+    """변경된 출력 경로를 열려 있는 브라우저 탭(SSE 연결)에 알리는 브로드캐스터"""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.version = 0
+        self.changed = []
+
+    def notify(self, changed):
+        with self.condition:
+            self.version += 1
+            self.changed = list(changed)
+            self.condition.notify_all()
+
+    def wait(self, version, timeout):
+        """version 이후의 변경을 기다려 (새 version, 변경 목록) 반환 (시간 초과면 변경 목록 None)"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != version, timeout)
+            if self.version == version:
+                return version, None
+            return self.version, self.changed
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    """ETag/Last-Modified 조건부 요청과 라이브 리로드를 지원하는 정적 파일 핸들러"""
+
+    live_reload = None
+
+    def do_GET(self):
+        if self.path == RELOAD_PATH:
+            self.stream_reloads()
+        else:
+            super().do_GET()
+
+    def not_modified(self, stat):
+        """If-None-Match(ETag) 또는 If-Modified-Since 조건이 맞으면 True"""
+        if "If-None-Match" in self.headers:
+            return self.etag in self.headers["If-None-Match"]
+        if "If-Modified-Since" in self.headers:
+            try:
+                since = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+            except (TypeError, ValueError):
+                return False
+            return since is not None and int(stat.st_mtime) <= since.timestamp()
+        return False
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        self.etag = None
+        if os.path.isdir(path) and self.path.split("?", 1)[0].endswith("/"):
+            path = os.path.join(path, "index.html")
+        if not os.path.isfile(path):
+            return super().send_head()
+
+        stat = os.stat(path)
+        self.etag = f'W/"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        if self.not_modified(stat):
+            self.send_response(304)
+            self.end_headers()
+            return None
+        if not path.endswith(".html"):
+            return super().send_head()
+
+        # HTML에는 라이브 리로드 스크립트를 주입 (출력 파일은 수정하지 않음)
+        html = Path(path).read_bytes()
+        marker = html.rfind(b"</body>")
+        script = LIVE_RELOAD_SCRIPT.encode('utf-8')
+        body = html[:marker] + script + html[marker:] if marker >= 0 else html + script
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Last-Modified", self.date_time_string(stat.st_mtime))
+        self.end_headers()
+        return io.BytesIO(body)
+
+    def end_headers(self):
+        if getattr(self, "etag", None):
+            self.send_header("ETag", self.etag)
+            self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+    def stream_reloads(self):
+        """Server-Sent Events로 재빌드 결과를 전송"""
+        self.etag = None
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        version = self.live_reload.version
+        try:
+            while True:
+                version, changed = self.live_reload.wait(version, KEEPALIVE_SECONDS)
+                message = ": ping\n\n" if changed is None else f"data: {json.dumps(changed)}\n\n"
+                self.wfile.write(message.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class OutputSnapshot:
+    """출력 디렉토리의 파일 상태를 기억해 재빌드 후 실제로 내용이 바뀐 파일만 찾음"""
+
+    def __init__(self, output_dir):
+        self.output_dir = Path(output_dir)
+        self.files = {}
+        self.update()
+
+    def update(self):
+        """이전 상태와 비교해 내용이 바뀌었거나 새로 생긴 파일 목록 반환 (output 기준 상대 경로)"""
+        changed, current = [], {}
+        for path in self.output_dir.rglob("*"):
+            if not path.is_file() or is_temporary(path.name):
+                continue
+            rel = path.relative_to(self.output_dir).as_posix()
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            previous = self.files.get(rel)
+            if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                current[rel] = previous
+                continue
+            digest = file_digest(path)
+            current[rel] = (stat.st_size, stat.st_mtime_ns, digest)
+            if not previous or previous[2] != digest:
+                changed.append(rel)
+        self.files = current
+        return sorted(changed)
+
+
+def reload_scripts():
+    """수정된 빌드 스크립트를 다시 불러옴 (get_slide_config 변경 반영)"""
+    for name in SCRIPT_MODULES:
+        if name in sys.modules:
+            importlib.reload(sys.modules[name])
+
+
+def create_builder(project_dir, jobs, options):
+    import build_materials
+
+    return build_materials.MaterialsBuilder(project_dir, incremental=True, jobs=jobs, **options)
+
+
+def refresh_compressed(materials, outputs):
+    """재빌드로 바뀐 파일의 .gz/.br 형제 파일을 새 내용으로 갱신 (미리 압축을 끄면 삭제)
+
+    압축을 받는 브라우저가 수정 전 페이지를 받지 않도록 합니다. 반환값은 갱신한 형제 파일 목록입니다.
+    """
+    from precompress import COMPRESSIBLE_SUFFIXES, ENCODINGS, Precompressor
+
+    suffixes = tuple(encoding["suffix"] for encoding in ENCODINGS.values())
+    files = [materials.output_dir / rel for rel in outputs
+             if rel.endswith(COMPRESSIBLE_SUFFIXES) and not rel.endswith(suffixes)]
+    files = [path for path in files if path.is_file()]
+    if materials.precompress:
+        return Precompressor(materials.output_dir, materials.builder.cache_dir,
+                             jobs=materials.jobs).compress_files(files)[1]
+    for path in files:
+        for suffix in suffixes:
+            path.with_name(path.name + suffix).unlink(missing_ok=True)
+    return []
+
+
+def watch(project_dir=None, jobs=None, host="127.0.0.1", port=8000, clean=False, options=None):
+    """초기 빌드 후 변경을 감시하며 재빌드하고 output/을 제공
+
+    options는 MaterialsBuilder에 그대로 넘기는 빌드 옵션입니다 (pdf_engine, minify, precompress, trace_file).
+    """
+    options = dict(options or {})
+    materials = create_builder(project_dir, jobs, options)
+    if clean:
+        materials.clean()
+    materials.run()
+
+    snapshot = OutputSnapshot(materials.output_dir)
+    live_reload = LiveReload()
+    handler = partial(type("Handler", (DevRequestHandler,), {"live_reload": live_reload}),
+                      directory=str(materials.output_dir))
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    directories = [materials.project_dir / d for d in WATCH_DIRS if (materials.project_dir / d).is_dir()]
+    watcher = create_watcher(directories)
+    kind = "inotify" if isinstance(watcher, InotifyWatcher) else "폴링"
+    print(f"\n👀 변경 감시 중 ({kind}): {', '.join(WATCH_DIRS)}")
+    print(f"🌐 http://{host}:{port}/ (종료: Ctrl+C)")
+
+    try:
+        while True:
+            changed = watcher.wait()
+            if not changed:
+                continue
+            started = time.perf_counter()
+            names = ", ".join(sorted(p.name for p in changed))
+            if any(p.parent.name == "scripts" and p.suffix == ".py" for p in changed):
+                reload_scripts()
+                materials = create_builder(project_dir, jobs, options)
+                materials.prepare_css()
+                materials.prepare_fonts()
+            if not materials.check_slide_files():
+                continue
+            get_tracer().reset()
+            try:
+                materials.build_graph()
+            except Exception as e:
+                print(f"❌ 재빌드 실패: {e}")
+                continue
+            for name, error in materials.builder.failed.items():
+                print(f"❌ {name} 단계 실패: {error}")
+            if materials.trace_file:
+                # 트레이스 파일은 마지막 재빌드의 span만 담음
+                get_tracer().write_chrome_trace(materials.trace_file)
+            outputs = snapshot.update()
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"🔁 {names} → 노드 {len(materials.builder.executed)}개 재빌드, "
+                  f"파일 {len(outputs)}개 변경 ({elapsed:.0f} ms)")
+            if outputs:
+                live_reload.notify(outputs)
+            # 개발 서버는 원본 파일을 제공하므로 알림 뒤에 형제 파일 갱신 (다른 서버로 output/을 볼 때를 위해)
+            if refresh_compressed(materials, outputs):
+                snapshot.update()
+    except KeyboardInterrupt:
+        print("\n👋 감시 종료")
+    finally:
+        watcher.close()
+        server.shutdown()
+    return 0
@@ -4,31 +4,274 @@ Chrome Education PPTX Generator
 한글학교 선생님을 위한 크롬 웹브라우저 활용 교육 PowerPoint 생성기
 """
 
+import copy
+import json
 import logging
+import re
 import sys
+import time
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 
-from pptx import Presentation
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
-from pptx.util import Pt
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('pptx_generator.log', mode='w'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from build_trace import get_tracer
 
+# 로깅은 명령행 실행(main)에서만 설정하며, 라이브러리로 쓸 때는 호출하는 쪽의 설정을 따름.
+# python-pptx와 그림 준비(pptx_media, Pillow)는 import 비용이 크므로 프레젠테이션을 만들 때 처음 불러옴
 logger = logging.getLogger(__name__)
 
+# 역할별 텍스트 스타일: (글자 크기 pt, 색상 이름, 굵게, 정렬 PP_ALIGN 이름). None이면 템플릿 기본값 유지
+STYLE_SPECS = {
+    "title": (None, "blue", None, None),
+    "cover_title": (48, "blue", True, "CENTER"),
+    "cover_subtitle": (28, "red", True, "CENTER"),
+    "cover_description": (20, "dark_gray", None, "CENTER"),
+    "cover_date": (16, "green", None, "CENTER"),
+    "item": (18, "dark_gray", None, None),
+    "item_compact": (16, "dark_gray", None, None),
+    "closing": (18, "green", None, None),
+}
+
+# 템플릿에 한 번만 정의하는 문단 스타일: (레이아웃 번호, placeholder idx, 문단 수준) -> (역할, 들여쓰기 수준)
+#   레이아웃 None은 슬라이드 마스터의 txStyles (idx 0: titleStyle, 1: bodyStyle)
+#   들여쓰기 수준: 글머리/들여쓰기를 가져올 수준 (강조 문단은 수준 0과 같은 모양에 글자 서식만 다름)
+EMPHASIS_LEVEL = 2
+THEME_STYLES = {
+    (None, 0, 0): ("title", 0),
+    (None, 1, 1): ("item", 1),
+    (None, 1, EMPHASIS_LEVEL): ("closing", 0),
+    (0, 0, 0): ("cover_title", 0),
+    (0, 1, 0): ("cover_subtitle", 0),
+    (0, 1, 1): ("cover_description", 0),
+    (0, 1, 2): ("cover_date", 0),
+}
+# 템플릿 스타일을 물려받고 일부만 다른 역할 (다른 값만 글자 단위로 지정)
+STYLE_BASES = {"item_compact": "item"}
+
+# 슬라이드 유형(type) -> 렌더링 메서드
+SLIDE_RENDERERS = {
+    "title": "render_title_slide",
+    "content": "render_content_slide",
+    "contact": "render_content_slide",
+}
+
+# 변형 이름은 출력 파일명(chrome_education_slides_{name}.pptx)에 그대로 들어가므로 경로 문자 금지
+VARIANT_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+# 색상 정의 (Chrome 브랜드 컬러, RGB)
+BRAND_COLORS = {
+    'blue': (66, 133, 244),        # Chrome Blue
+    'red': (234, 67, 53),          # Chrome Red
+    'yellow': (251, 188, 5),       # Chrome Yellow
+    'green': (52, 168, 83),        # Chrome Green
+    'dark_gray': (60, 64, 67),     # Dark Gray
+    'light_gray': (241, 243, 244)  # Light Gray
+}
+
+# 브랜드 색상을 넣을 테마 색 슬롯 (글자 색은 테마 색을 참조하므로 색상을 바꾸면 테마만 바뀜)
+THEME_COLOR_SLOTS = {
+    'blue': ("accent1", "ACCENT_1"),
+    'red': ("accent2", "ACCENT_2"),
+    'yellow': ("accent3", "ACCENT_3"),
+    'green': ("accent4", "ACCENT_4"),
+    'dark_gray': ("dk2", "DARK_2"),
+    'light_gray': ("lt2", "LIGHT_2"),
+}
+ALIGN_XML = {"LEFT": "l", "CENTER": "ctr", "RIGHT": "r", "JUSTIFY": "just"}
+
+# 기본 템플릿을 직렬화한 바이트 {테마 스타일 사용 여부: 바이트} (프로세스당 한 번만 로드)
+_template_bytes = {}
+
+
+def widen_template(prs):
+    """4:3 기본 템플릿을 HTML 슬라이드와 같은 16:9(13.33in × 7.5in)로 바꾸고 마스터/레이아웃 도형을 가로로 늘림"""
+    from pptx_media import SLIDE_HEIGHT_EMU, SLIDE_WIDTH_EMU
+
+    scale = SLIDE_WIDTH_EMU / prs.slide_width
+    for part in [prs.slide_master, *prs.slide_layouts]:
+        for shape in part.shapes:
+            # 위치를 직접 지정한 도형만 (마스터에서 물려받는 레이아웃 도형은 마스터를 따라감)
+            if shape._element.xpath("./p:spPr/a:xfrm"):
+                shape.left, shape.width = round(shape.left * scale), round(shape.width * scale)
+    prs.slide_width, prs.slide_height = SLIDE_WIDTH_EMU, SLIDE_HEIGHT_EMU
+
+
+def set_theme_colors(prs):
+    """브랜드 색상을 테마의 색 슬롯(accent1 등)에 기록"""
+    from lxml import etree
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.oxml.ns import qn
+
+    theme = prs.slide_master.part.part_related_by(RT.THEME)
+    root = etree.fromstring(theme.blob)
+    scheme = root.find(f".//{qn('a:clrScheme')}")
+    scheme.set("name", "Chrome Education")
+    for name, (slot, _) in THEME_COLOR_SLOTS.items():
+        element = scheme.find(qn(f"a:{slot}"))
+        element.clear()
+        etree.SubElement(element, qn("a:srgbClr"), val="%02X%02X%02X" % BRAND_COLORS[name])
+    theme._blob = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def define_level_style(styles, level, indent_level, spec):
+    """목록 스타일(txStyles, lstStyle)의 수준 하나에 역할 스타일 정의"""
+    from lxml import etree
+    from pptx.oxml.ns import qn
+
+    tag = qn(f"a:lvl{level + 1}pPr")
+    pPr = styles.find(tag)
+    if indent_level != level:
+        # 다른 수준의 글머리/들여쓰기를 그대로 가져옴
+        source = styles.find(qn(f"a:lvl{indent_level + 1}pPr"))
+        if source is not None:
+            copied = copy.deepcopy(source)
+            copied.tag = tag
+            if pPr is not None:
+                pPr.addprevious(copied)
+                styles.remove(pPr)
+            else:
+                styles.append(copied)
+            pPr = copied
+    if pPr is None:
+        pPr = etree.SubElement(styles, tag)
+
+    size, color, bold, alignment = spec
+    if alignment is not None:
+        pPr.set("algn", ALIGN_XML[alignment])
+    defRPr = pPr.find(qn("a:defRPr"))
+    if defRPr is None:
+        defRPr = etree.SubElement(pPr, qn("a:defRPr"))
+    if size is not None:
+        defRPr.set("sz", str(size * 100))
+    if bold is not None:
+        defRPr.set("b", "1" if bold else "0")
+    if color is not None:
+        for fill in defRPr.findall(qn("a:solidFill")):
+            defRPr.remove(fill)
+        fill = etree.Element(qn("a:solidFill"))
+        etree.SubElement(fill, qn("a:schemeClr"), val=THEME_COLOR_SLOTS[color][0])
+        line = defRPr.find(qn("a:ln"))
+        defRPr.insert(0 if line is None else 1, fill)
+
+
+def define_text_styles(prs):
+    """THEME_STYLES를 슬라이드 마스터의 txStyles와 레이아웃 placeholder의 lstStyle에 한 번만 정의"""
+    from pptx.oxml.ns import qn
+
+    master_styles = prs.slide_master._element.find(qn("p:txStyles"))
+    # 다른 수준을 복사하는 깊은 수준부터 정의 (복사 원본에 역할 서식이 들어가기 전에 복사)
+    for (layout, idx, level), (role, indent_level) in sorted(THEME_STYLES.items(), key=lambda item: -item[0][2]):
+        if layout is None:
+            styles = master_styles.find(qn("p:titleStyle" if idx == 0 else "p:bodyStyle"))
+        else:
+            placeholder = next(ph for ph in prs.slide_layouts[layout].placeholders
+                               if ph.placeholder_format.idx == idx)
+            styles = placeholder._element.txBody.find(qn("a:lstStyle"))
+        define_level_style(styles, level, indent_level, STYLE_SPECS[role])
+
+
+def load_template_bytes(theme_styles=True):
+    """기본 프레젠테이션 템플릿(16:9)을 한 번만 만들어 바이트로 캐시
+
+    theme_styles: 브랜드 색상과 역할별 텍스트 스타일을 테마/마스터/레이아웃에 정의
+    """
+    if theme_styles not in _template_bytes:
+        from pptx import Presentation
+
+        prs = Presentation()
+        widen_template(prs)
+        if theme_styles:
+            set_theme_colors(prs)
+            define_text_styles(prs)
+        buffer = BytesIO()
+        prs.save(buffer)
+        _template_bytes[theme_styles] = buffer.getvalue()
+    return _template_bytes[theme_styles]
+
+
+def apply_variant(config, variant):
+    """학교별 변형(variant)의 슬라이드 내용 덮어쓰기를 적용한 구성 정보 반환
+
+    variant 예시::
+
+        {
+            "name": "la_korean_school",
+            "title": "LA 한국학교 교사 연수",
+            "date": "2026년 3월 7일",
+            "slides": {
+                "qa_contact": {"items": ["담당: 김선생님 (kim@example.org)"]},
+                "korean_edu_tools": {"items": ["스터디코리안넷", "세종학당"]}
+            }
+        }
+    """
+    config = copy.deepcopy(config)
+    slides = {slide["id"]: slide for slide in config["slides"]}
+    title_slide = next((slide for slide in config["slides"] if slide["type"] == "title"), None)
+
+    if title_slide is not None:
+        for key, content_key in (("title", "main_title"), ("subtitle", "subtitle"),
+                                 ("description", "description"), ("date", "date")):
+            if key in variant:
+                title_slide["content"][content_key] = variant[key]
+
+    for slide_id, overrides in variant.get("slides", {}).items():
+        if slide_id not in slides:
+            raise KeyError(f"알 수 없는 슬라이드 id: {slide_id}")
+        slides[slide_id]["content"].update(overrides)
+    return config
+
+
+def check_variants(variants, config):
+    """변형 목록 전체를 렌더링 전에 확인 (아니면 어느 변형이 잘못됐는지 담은 ValueError)
+
+    이름이 모두 있고 파일명에 쓸 수 있으며([A-Za-z0-9_-]+) 서로 다른지, 덮어쓸 슬라이드 id가
+    config에 모두 있는지 확인합니다.
+    """
+    if not isinstance(variants, list):
+        raise ValueError("변형 목록은 JSON 배열이어야 합니다")
+    slide_ids = {slide["id"] for slide in config["slides"]}
+    seen = set()
+    for number, variant in enumerate(variants, start=1):
+        if not isinstance(variant, dict):
+            raise ValueError(f"{number}번째 변형이 JSON 객체가 아닙니다")
+        name = variant.get("name")
+        if not isinstance(name, str) or not VARIANT_NAME_RE.fullmatch(name):
+            raise ValueError(f"변형 이름은 영문, 숫자, _, -만 사용할 수 있습니다: {name!r}")
+        if name in seen:
+            raise ValueError(f"변형 이름이 중복되었습니다: {name!r}")
+        seen.add(name)
+        overrides = variant.get("slides", {})
+        if not isinstance(overrides, dict):
+            raise ValueError(f"{name}: slides는 슬라이드 id별 내용 객체여야 합니다")
+        unknown = sorted(set(overrides) - slide_ids)
+        if unknown:
+            raise ValueError(f"{name}: 알 수 없는 슬라이드 id: {', '.join(unknown)}")
+        for slide_id, content in overrides.items():
+            if not isinstance(content, dict):
+                raise ValueError(f"{name}: {slide_id} 슬라이드 내용은 JSON 객체여야 합니다")
+
+
+def load_variants(variants_file, config):
+    """변형 목록 JSON 파일을 읽어 확인한 목록 반환 (읽을 수 없거나 잘못되면 ValueError)"""
+    try:
+        with open(variants_file, 'r', encoding='utf-8') as f:
+            variants = json.load(f)
+    except OSError as error:
+        raise ValueError(f"변형 목록 파일을 읽을 수 없습니다: {error}") from error
+    except json.JSONDecodeError as error:
+        raise ValueError(f"변형 목록 JSON 오류 ({variants_file}): {error}") from error
+    check_variants(variants, config)
+    return variants
+
+
+def resize(shape, width):
+    """레이아웃에서 물려받은 위치는 그대로 두고 폭만 바꿈 (위치/크기 네 값을 함께 지정)"""
+    shape.left, shape.top, shape.width, shape.height = shape.left, shape.top, width, shape.height
+
 
 class ChromeEducationPPTXGenerator:
-    def __init__(self, project_dir=None):
+    def __init__(self, project_dir=None, theme_styles=True):
+        """theme_styles: 텍스트 스타일을 템플릿에 한 번 정의하고 다른 값만 글자마다 지정 (False면 모두 글자마다, 비교용)"""
         if project_dir is None:
             project_dir = Path(__file__).parent.parent
         
@@ -36,6 +279,7 @@ class ChromeEducationPPTXGenerator:
         logger.info(f"📂 프로젝트 디렉토리: {project_dir}")
         
         self.project_dir = Path(project_dir)
+        self.images_dir = self.project_dir / "slides" / "images"
         # 출력 디렉토리 설정 및 생성
         self.output_dir = Path(self.project_dir) / "output"
         logger.info(f"📁 출력 디렉토리 경로: {self.output_dir}")
@@ -47,19 +291,30 @@ class ChromeEducationPPTXGenerator:
         else:
             logger.info("✅ 출력 디렉토리 이미 존재함")
         
+        self.theme_styles = theme_styles
+        self.colors = self.compile_colors()
+        self.styles = self.compile_styles()
+        # 레이아웃별 제목/본문 위치 (모든 덱이 같은 템플릿이므로 생성기당 한 번만 조회)
+        self.boxes = {}
+        
         # 기본 프레젠테이션 생성 (템플릿 사용 시 문제가 있어서 기본 생성으로 변경)
         logger.info("📊 기본 프레젠테이션 템플릿으로 생성")
-        self.prs = Presentation()
+        self.new_presentation()
+    
+    def new_presentation(self):
+        """캐시된 기본 템플릿으로 빈 프레젠테이션 준비"""
+        from pptx import Presentation
+
+        self.prs = Presentation(BytesIO(load_template_bytes(self.theme_styles)))
         
-        # 색상 정의 (Chrome 브랜드 컬러)
-        self.colors = {
-            'blue': RGBColor(66, 133, 244),        # Chrome Blue
-            'red': RGBColor(234, 67, 53),          # Chrome Red
-            'yellow': RGBColor(251, 188, 5),       # Chrome Yellow
-            'green': RGBColor(52, 168, 83),        # Chrome Green
-            'dark_gray': RGBColor(60, 64, 67),     # Dark Gray
-            'light_gray': RGBColor(241, 243, 244)  # Light Gray
+        # 슬라이드 유형별 레이아웃은 한 번만 조회
+        self.layouts = {
+            "title": self.get_safe_layout(0),    # Title Slide
+            "content": self.get_safe_layout(1),  # Title and Content
         }
+        # 슬라이드 id별 그림 배치와 덱 전체에서 공유하는 그림 바이트 (render_deck에서 준비)
+        self.pictures = {}
+        self.media = {}
     
     def get_safe_layout(self, preferred_index):
         """안전한 레이아웃 선택"""
@@ -85,420 +340,286 @@ class ChromeEducationPPTXGenerator:
         
         return title, content
     
-    def add_title_slide(self):
-        """타이틀 슬라이드 추가 - HTML 내용 정확히 반영"""
-        slide_layout = self.get_safe_layout(0)  # Title Slide
-        slide = self.prs.slides.add_slide(slide_layout)
+    def compile_colors(self):
+        """색상 이름 -> 글자 색 값 (테마 스타일을 쓰면 테마 색 참조, 아니면 RGB)"""
+        if self.theme_styles:
+            from pptx.enum.dml import MSO_THEME_COLOR
+
+            return {name: getattr(MSO_THEME_COLOR, member) for name, (_, member) in THEME_COLOR_SLOTS.items()}
+        from pptx.dml.color import RGBColor
+
+        return {name: RGBColor(*rgb) for name, rgb in BRAND_COLORS.items()}
+    
+    def compile_styles(self):
+        """역할별로 템플릿에서 물려받는 값과 다른 값만 python-pptx 값으로 미리 변환
+
+        반환: {역할: (문단 수준, 크기, 색, 굵게, 정렬, 물려받는 색상 이름)} (같은 값은 None)
+        """
+        from pptx.enum.text import PP_ALIGN
+        from pptx.util import Pt
+
+        levels = {role: level for (_, _, level), (role, _) in THEME_STYLES.items()}
+        styles = {}
+        for role, spec in STYLE_SPECS.items():
+            base = STYLE_BASES.get(role, role)
+            inherited = STYLE_SPECS[base] if self.theme_styles and base in levels else (None,) * 4
+            size, color, bold, alignment = (value if value != parent else None
+                                            for value, parent in zip(spec, inherited))
+            styles[role] = (levels.get(base) if self.theme_styles else None,
+                            Pt(size) if size is not None else None,
+                            self.colors[color] if color is not None else None,
+                            bold,
+                            getattr(PP_ALIGN, alignment) if alignment else None,
+                            inherited[1])
+        return styles
+    
+    def set_color(self, font, color):
+        if self.theme_styles:
+            font.color.theme_color = color
+        else:
+            font.color.rgb = color
+    
+    def apply_style(self, paragraph, role, color=None):
+        """역할 스타일 중 템플릿과 다른 값만 문단의 글자(run)에 지정 (color: 역할 색 대신 쓸 색상 이름)"""
+        level, size, role_color, bold, alignment, inherited_color = self.styles[role]
+        if color is not None:
+            role_color = self.colors[color] if color != inherited_color else None
+        if level:
+            paragraph.level = level
+        if alignment is not None:
+            paragraph.alignment = alignment
+        if size is None and role_color is None and bold is None:
+            return
+        for run in paragraph.runs:
+            font = run.font
+            if size is not None:
+                font.size = size
+            if role_color is not None:
+                self.set_color(font, role_color)
+            if bold is not None:
+                font.bold = bold
+    
+    def layout_boxes(self, layout):
+        """레이아웃의 (제목, 본문) placeholder 위치 (각각 left, top, width, height, 없으면 None)"""
+        boxes = {placeholder.placeholder_format.idx: (placeholder.left, placeholder.top,
+                                                      placeholder.width, placeholder.height)
+                 for placeholder in layout.placeholders}
+        return boxes.get(0), boxes.get(1)
+    
+    def place_pictures(self, spec):
+        """슬라이드 IR의 이미지 배치 목록 [{path, alt, role, left, top, width, height}] (EMU)
+
+        - 로고 같은 작은 이미지(ICON_MAX_WIDTH px 이하): HTML과 같은 크기로 제목 옆 (타이틀 슬라이드는 제목 위 가운데)
+        - 그 밖의 이미지: 본문 오른쪽 절반에 비율을 유지해 배치 (본문 텍스트는 왼쪽 절반)
+        """
+        from pptx_media import EMU_PER_PX, ICON_MAX_WIDTH, PICTURE_GAP, TOP_MARGIN, fit, slide_pictures
+
+        pictures = slide_pictures(spec, self.images_dir)
+        if not pictures:
+            return []
+        is_title = SLIDE_RENDERERS.get(spec.get("type")) == "render_title_slide"
+        kind = "title" if is_title else "content"
+        if kind not in self.boxes:
+            self.boxes[kind] = self.layout_boxes(self.layouts[kind])
+        title, body = self.boxes[kind]
+        icons = [picture for picture in pictures if is_title or picture["width"] <= ICON_MAX_WIDTH]
+        figures = [picture for picture in pictures if picture not in icons]
+        placements = []
+
+        if title is not None and icons:
+            left, top, width, height = title
+            if is_title:
+                # 타이틀 슬라이드: 제목 위 빈 공간의 가운데
+                band_top, band_height = TOP_MARGIN, top - TOP_MARGIN - PICTURE_GAP
+            else:
+                # 내용 슬라이드: 제목 상자의 오른쪽 끝 (제목은 그 왼쪽으로 줄어듦)
+                band_top, band_height = top, height
+            sizes = [fit(picture["path"], picture["width"] * EMU_PER_PX, band_height) for picture in icons]
+            total = sum(w for w, _ in sizes) + PICTURE_GAP * (len(sizes) - 1)
+            x = left + (width - total) // 2 if is_title else left + width - total
+            for picture, (w, h) in zip(icons, sizes):
+                placements.append(dict(picture, role="cover" if is_title else "icon", left=x,
+                                       top=band_top + (band_height - h) // 2, width=w, height=h))
+                x += w + PICTURE_GAP
+
+        if body is not None and figures:
+            left, top, width, height = body
+            half = (width - PICTURE_GAP) // 2
+            share = (height - PICTURE_GAP * (len(figures) - 1)) // len(figures)
+            for i, picture in enumerate(figures):
+                w, h = fit(picture["path"], min(half, picture["width"] * EMU_PER_PX), share)
+                placements.append(dict(picture, role="figure", left=left + width - half + (half - w) // 2,
+                                       top=top + i * (share + PICTURE_GAP) + (share - h) // 2,
+                                       width=w, height=h))
+        return placements
+    
+    def prepare_pictures(self, slides):
+        """덱 전체의 그림 배치를 먼저 정하고 이미지마다 가장 큰 배치에 맞춰 한 번만 축소"""
+        from pptx_media import deck_media
+
+        self.pictures = {spec["id"]: self.place_pictures(spec) for spec in slides}
+        self.media = deck_media(placement for placements in self.pictures.values()
+                                for placement in placements)
+    
+    def add_pictures(self, slide, spec, title=None, body=None):
+        """준비한 그림을 슬라이드에 추가하고, 그림과 겹치지 않도록 제목/본문 상자를 줄임"""
+        from pptx_media import PICTURE_GAP
+
+        placements = self.pictures.get(spec["id"], [])
+        for placement in placements:
+            # 같은 바이트는 python-pptx가 하나의 미디어 파트로 저장 (여러 슬라이드가 공유)
+            picture = slide.shapes.add_picture(BytesIO(self.media[placement["path"]]), placement["left"],
+                                               placement["top"], placement["width"], placement["height"])
+            picture._element.nvPicPr.cNvPr.set("descr", placement["alt"])
+
+        icons = [placement["left"] for placement in placements if placement["role"] == "icon"]
+        if title is not None and icons:
+            resize(title, width=min(icons) - PICTURE_GAP - title.left)
+        if body is not None and any(placement["role"] == "figure" for placement in placements):
+            resize(body, width=(body.width - PICTURE_GAP) // 2)
+    
+    def render_title_slide(self, spec):
+        """타이틀 슬라이드 렌더링"""
+        slide = self.prs.slides.add_slide(self.layouts["title"])
+        content = spec["content"]
         
-        # 직접 title과 subtitle 접근
         title = slide.shapes.title
         subtitle = slide.placeholders[1] if len(slide.placeholders) > 1 else None
         
         if title:
-            title.text = "수업을 쉽게, 자료를 예쁘게,\n협업을 효율적으로"
-            title.text_frame.paragraphs[0].font.size = Pt(48)
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['blue']
-            title.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-            title.text_frame.paragraphs[0].font.bold = True
+            title.text = content["main_title"]
+            self.apply_style(title.text_frame.paragraphs[0], "cover_title")
         
         if subtitle:
-            subtitle.text = "— 디지털 도구 완전정복\n\n한글학교 선생님을 위한 크롬 웹브라우저 활용 교육"
-            
-            # 첫 번째 줄 (부제목)
-            subtitle.text_frame.paragraphs[0].text = "— 디지털 도구 완전정복"
-            subtitle.text_frame.paragraphs[0].font.size = Pt(28)
-            subtitle.text_frame.paragraphs[0].font.color.rgb = self.colors['red']
-            subtitle.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-            subtitle.text_frame.paragraphs[0].font.bold = True
+            tf = subtitle.text_frame
+            tf.text = f"— {content['subtitle']}"
+            self.apply_style(tf.paragraphs[0], "cover_subtitle")
             
-            # 두 번째 줄 (설명)
-            p = subtitle.text_frame.add_paragraph()
-            p.text = "한글학교 선생님을 위한 크롬 웹브라우저 활용 교육"
-            p.font.size = Pt(20)
-            p.font.color.rgb = self.colors['dark_gray']
-            p.alignment = PP_ALIGN.CENTER
-            
-            # 날짜 추가
-            p = subtitle.text_frame.add_paragraph()
-            p.text = datetime.now().strftime("%Y년 %m월 %d일")
-            p.font.size = Pt(16)
-            p.font.color.rgb = self.colors['green']
-            p.alignment = PP_ALIGN.CENTER
-        
+            date_text = content.get("date") or datetime.now().strftime("%Y년 %m월 %d일")
+            for text, role in ((content["description"], "cover_description"),
+                               (date_text, "cover_date")):
+                p = tf.add_paragraph()
+                p.text = text
+                self.apply_style(p, role)
+        
+        self.add_pictures(slide, spec)
         return slide
     
-    def add_overview_slide(self):
-        """강의 개요 슬라이드 추가 - HTML 내용 정확히 반영"""
-        slide_layout = self.get_safe_layout(1)  # Title and Content
-        slide = self.prs.slides.add_slide(slide_layout)
+    def render_content_slide(self, spec):
+        """제목 + 소제목 + 항목 목록 슬라이드 렌더링 (content/contact 공통)"""
+        slide = self.prs.slides.add_slide(self.layouts["content"])
+        content = spec["content"]
+        item_role = "item_compact" if spec.get("item_style") == "compact" else "item"
         
-        title, content = self.get_placeholders(slide)
+        title, body = self.get_placeholders(slide)
+        self.add_pictures(slide, spec, title, body)
         
         if title:
-            title.text = "강의 개요"
-            title.text_frame.paragraphs[0].font.size = Pt(36)
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['blue']
-            title.text_frame.paragraphs[0].font.bold = True
+            title.text = spec["title"]
+            self.apply_style(title.text_frame.paragraphs[0], "title", spec.get("accent", "blue"))
         
-        if not content:
+        if not body:
             return slide
-            
-        tf = content.text_frame
-        tf.clear()  # 기존 내용 삭제
         
-        # 교육 과정 정보
-        p = tf.add_paragraph()
-        p.text = "교육 과정 정보"
-        p.font.size = Pt(24)
-        p.font.color.rgb = self.colors['red']
-        p.font.bold = True
+        tf = body.text_frame
+        tf.text = content.get("heading", "")
         
-        # 정보 항목들
-        info_items = [
-            ("목표", "크롬 웹브라우저를 활용하여 한글교육의 효율성을 높이고 디지털 교육 도구를 마스터하기"),
-            ("대상", "한글학교 교사 및 한국어 교육자"),
-            ("구성", "총 10차시 (기초 3차시, 중급 4차시, 고급 3차시)"),
-            ("방식", "이론 학습 + 실습 + 실제 적용 시나리오")
-        ]
-        
-        for title_text, desc in info_items:
+        for item in content.get("items", []):
             p = tf.add_paragraph()
-            p.text = f"• {title_text}: {desc}"
-            p.font.size = Pt(16)
-            p.font.color.rgb = self.colors['dark_gray']
-        
-        return slide
-    
-    def add_basic_features_slide(self):
-        """기초 단계 슬라이드 추가"""
-        slide_layout = self.get_safe_layout(1)
-        slide = self.prs.slides.add_slide(slide_layout)
-        
-        title, content = self.get_placeholders(slide)
-        
-        if title:
-            title.text = "기초 단계: 크롬 브라우저 기본 기능"
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['green']
-        
-        if not content:
-            return slide
-            
-        tf = content.text_frame
-        tf.text = "핵심 기능"
-        
-        features = [
-            "프로필 관리 및 설정 최적화",
-            "즐겨찾기와 북마크 체계적 관리",
-            "필수 단축키 마스터",
-            "탭 그룹 활용법",
-            "검색 및 번역 기능 활용"
-        ]
-        
-        for feature in features:
-            p = tf.add_paragraph()
-            p.text = feature
+            p.text = item
             p.level = 1
-            p.font.size = Pt(18)
-            p.font.color.rgb = self.colors['dark_gray']
-        
-        return slide
-    
-    def add_extensions_slide(self):
-        """확장프로그램 슬라이드 추가"""
-        slide_layout = self.get_safe_layout(1)
-        slide = self.prs.slides.add_slide(slide_layout)
-        
-        title, content = self.get_placeholders(slide)
+            self.apply_style(p, item_role)
         
-        if title:
-            title.text = "중급 단계: 교육자를 위한 확장프로그램"
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['yellow']
-        
-        if not content:
-            return slide
-            
-        tf = content.text_frame
-        tf.text = "추천 확장프로그램"
-        
-        extensions = [
-            "Fireshot - 웹페이지 전체 캡처",
-            "Google Keep - 메모 및 웹 스크랩",
-            "Video Speed Controller - 동영상 속도 조절",
-            "Mote - 음성 피드백 도구",
-            "Brisk Teaching - AI 교사 어시스턴트"
-        ]
-        
-        for extension in extensions:
+        closing = content.get("closing")
+        if closing:
+            tf.add_paragraph()
             p = tf.add_paragraph()
-            p.text = extension
-            p.level = 1
-            p.font.size = Pt(18)
-            p.font.color.rgb = self.colors['dark_gray']
+            p.text = closing
+            self.apply_style(p, "closing")
         
         return slide
     
-    def add_korean_tools_slide(self):
-        """한글교육 도구 슬라이드 추가"""
-        slide_layout = self.get_safe_layout(1)
-        slide = self.prs.slides.add_slide(slide_layout)
-        
-        title, content = self.get_placeholders(slide)
-        
-        if title:
-            title.text = "중급 단계: 한글교육 특화 웹도구"
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['red']
-        
-        if not content:
-            return slide
-            
-        tf = content.text_frame
-        tf.text = "한글교육 전용 사이트"
-        
-        tools = [
-            "스터디코리안넷 - 종합 한국어 학습 플랫폼",
-            "한국어교수학습샘터 - 교사용 자료 제공",
-            "NAKS 온라인 자료실 - 한글학교 교육 자료",
-            "한글또박또박 - 한글 쓰기 연습",
-            "세종학당 - 온라인 한국어 강좌"
-        ]
-        
-        for tool in tools:
-            p = tf.add_paragraph()
-            p.text = tool
-            p.level = 1
-            p.font.size = Pt(18)
-            p.font.color.rgb = self.colors['dark_gray']
-        
-        return slide
+    def render_slide(self, spec):
+        """슬라이드 유형(type)에 맞는 렌더러로 슬라이드 하나 생성"""
+        renderer = SLIDE_RENDERERS.get(spec.get("type"), "render_content_slide")
+        return getattr(self, renderer)(spec)
     
-    def add_workspace_slide(self):
-        """구글 워크스페이스 슬라이드 추가"""
-        slide_layout = self.get_safe_layout(1)
-        slide = self.prs.slides.add_slide(slide_layout)
-        
-        title, content = self.get_placeholders(slide)
-        
-        if title:
-            title.text = "고급 단계: 구글 워크스페이스 연동"
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['blue']
-        
-        if not content:
-            return slide
-            
-        tf = content.text_frame
-        tf.text = "협업 도구 활용"
-        
-        workspace_tools = [
-            "구글 클래스룸 - 온라인 학급 관리",
-            "구글 문서/슬라이드 - 실시간 공동 편집",
-            "구글 드라이브 - 클라우드 자료 관리",
-            "구글 미트 - 화상 수업 진행",
-            "구글 폼 - 설문 및 퀴즈 제작"
-        ]
-        
-        for tool in workspace_tools:
-            p = tf.add_paragraph()
-            p.text = tool
-            p.level = 1
-            p.font.size = Pt(18)
-            p.font.color.rgb = self.colors['dark_gray']
-        
-        return slide
+    def load_slide_config(self):
+        """HTML 인덱스와 같은 슬라이드 구성 정보 로드 (슬라이드 HTML의 IR로 제목 등을 채움)"""
+        from generate_slides import ChromeEducationSlidesGenerator
+        return ChromeEducationSlidesGenerator(self.project_dir).get_deck()
     
-    def add_ai_tools_slide(self):
-        """AI 도구 슬라이드 추가"""
-        slide_layout = self.get_safe_layout(1)
-        slide = self.prs.slides.add_slide(slide_layout)
-        
-        title, content = self.get_placeholders(slide)
-        
-        if title:
-            title.text = "고급 단계: AI 도구 활용"
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['green']
-        
-        if not content:
-            return slide
-            
-        tf = content.text_frame
-        tf.text = "AI 기반 교육 도구"
-        
-        ai_tools = [
-            "ChatGPT - 교육 자료 생성 및 아이디어 제공",
-            "Canva AI - 시각적 자료 자동 제작",
-            "Brisk Teaching - AI 퀴즈 및 과제 생성",
-            "음성 인식/합성 - 발음 교정 및 듣기 자료",
-            "번역 도구 - 다국어 학습자 지원"
-        ]
-        
-        for tool in ai_tools:
-            p = tf.add_paragraph()
-            p.text = tool
-            p.level = 1
-            p.font.size = Pt(18)
-            p.font.color.rgb = self.colors['dark_gray']
-        
-        return slide
+    def render_deck(self, config, log_level=logging.INFO):
+        """슬라이드 구성 정보를 순서대로 한 번 순회하며 슬라이드 생성"""
+        slides = config["slides"]
+        tracer = get_tracer()
+        with tracer.span("pictures", "pptx") as span:
+            self.prepare_pictures(slides)
+            span.set(media=len(self.media), bytes=sum(len(data) for data in self.media.values()))
+        for i, spec in enumerate(slides, start=1):
+            logger.log(log_level, f"{i}. {spec['title']} 슬라이드 생성 중...")
+            with tracer.span(f"slide:{spec['id']}", "pptx", type=spec["type"]):
+                self.render_slide(spec)
+        logger.debug(f"슬라이드 {len(slides)}개 생성 완료")
     
-    def add_practice_slide(self):
-        """실습 시나리오 슬라이드 추가"""
-        slide_layout = self.get_safe_layout(1)
-        slide = self.prs.slides.add_slide(slide_layout)
-        
-        title, content = self.get_placeholders(slide)
-        
-        if title:
-            title.text = "실습 시나리오"
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['red']
-        
-        if not content:
-            return slide
-            
-        tf = content.text_frame
-        tf.text = "단계별 실습 과제"
-        
-        scenarios = [
-            "기초: 새 학기 준비 - 프로필 설정 및 북마크 정리",
-            "중급: 효율적인 수업 자료 준비 - 웹 스크랩 및 퀴즈 생성",
-            "중급: 온라인 수업 진행 - 화면 공유 및 상호작용",
-            "고급: 학급 관리 시스템 구축 - 클래스룸 활용",
-            "고급: 협업 프로젝트 진행 - 워크스페이스 연동"
-        ]
-        
-        for scenario in scenarios:
-            p = tf.add_paragraph()
-            p.text = scenario
-            p.level = 1
-            p.font.size = Pt(16)
-            p.font.color.rgb = self.colors['dark_gray']
-        
-        return slide
-    
-    def add_resources_slide(self):
-        """참고 자료 슬라이드 추가"""
-        slide_layout = self.get_safe_layout(1)
-        slide = self.prs.slides.add_slide(slide_layout)
-        
-        title, content = self.get_placeholders(slide)
-        
-        if title:
-            title.text = "추가 자료 및 참고 링크"
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['yellow']
-        
-        if not content:
-            return slide
-            
-        tf = content.text_frame
-        tf.text = "유용한 링크"
-        
-        resources = [
-            "Google Chrome 도움말 - support.google.com/chrome",
-            "Chrome 웹 스토어 - chrome.google.com/webstore",
-            "Google Workspace for Education - edu.google.com",
-            "스터디코리안넷 - study.korean.net",
-            "재미한국학교협의회 - www.naks.org"
-        ]
-        
-        for resource in resources:
-            p = tf.add_paragraph()
-            p.text = resource
-            p.level = 1
-            p.font.size = Pt(16)
-            p.font.color.rgb = self.colors['dark_gray']
-        
-        return slide
+    def generate_variant(self, config, variant, output_dir):
+        """변형 하나를 새 프레젠테이션으로 렌더링해 저장"""
+        check_variants([variant], config)
+        self.new_presentation()
+        self.render_deck(apply_variant(config, variant), log_level=logging.DEBUG)
+        output_file = Path(output_dir) / f"chrome_education_slides_{variant['name']}.pptx"
+        self.prs.save(str(output_file))
+        return output_file
     
-    def add_contact_slide(self):
-        """연락처 슬라이드 추가"""
-        slide_layout = self.get_safe_layout(1)
-        slide = self.prs.slides.add_slide(slide_layout)
-        
-        title, content = self.get_placeholders(slide)
-        
-        if title:
-            title.text = "질문 및 연락처"
-            title.text_frame.paragraphs[0].font.color.rgb = self.colors['blue']
-        
-        if not content:
-            return slide
-            
-        tf = content.text_frame
-        tf.text = "지원 및 문의"
-        
-        contacts = [
-            "GitHub 저장소: github.com/linuxsw/chrome_lecture_for_korean_teacher",
-            "이슈 및 질문: GitHub Issues 활용",
-            "토론 및 피드백: GitHub Discussions 참여",
-            "개발자: Seungweon Park (linuxsw@gmail.com)"
-        ]
-        
-        for contact in contacts:
-            p = tf.add_paragraph()
-            p.text = contact
-            p.level = 1
-            p.font.size = Pt(16)
-            p.font.color.rgb = self.colors['dark_gray']
-        
-        # 감사 메시지 추가
-        p = tf.add_paragraph()
-        p.text = ""
-        p = tf.add_paragraph()
-        p.text = "🌟 더 나은 한글교육을 위한 여러분의 디지털 여정을 응원합니다! 🌟"
-        p.font.size = Pt(18)
-        p.font.color.rgb = self.colors['green']
+    def generate_batch(self, variants, jobs=1, config=None):
+        """여러 학교별 변형 덱을 한 프로세스(또는 프로세스 풀)에서 생성
+
+        python-pptx import, 기본 템플릿, 스타일 표는 프로세스마다 한 번만 준비하고
+        모든 덱에서 재사용합니다.
+        """
+        if config is None:
+            config = self.load_slide_config()
+        # 프로세스 풀에 넘기기 전에 모든 변형을 확인 (같은 이름이면 서로 덮어쓰고, 작업자 예외는 추적이 어려움)
+        check_variants(variants, config)
+        
+        output_dir = self.output_dir / "variants"
+        output_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"🏫 변형 덱 {len(variants)}개 생성 시작 (작업 {jobs}개)")
+        
+        started = time.perf_counter()
+        if jobs > 1 and len(variants) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            chunksize = max(1, len(variants) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                                     initargs=(str(self.project_dir), config, str(output_dir))) as pool:
+                outputs = [Path(path) for path in pool.map(_render_batch_variant, variants,
+                                                             chunksize=chunksize)]
+        else:
+            outputs = [self.generate_variant(config, variant, output_dir) for variant in variants]
+        elapsed = time.perf_counter() - started
         
-        return slide
+        rate = len(outputs) / elapsed if elapsed > 0 else float("inf")
+        logger.info(f"✅ 변형 덱 {len(outputs)}개 생성 완료: {elapsed:.2f}초 ({rate:.1f} decks/s)")
+        return outputs
     
-    def generate_presentation(self):
+    def generate_presentation(self, config=None):
         """전체 프레젠테이션 생성"""
         logger.info("🚀 Chrome Education PPTX Generator 시작")
         
         try:
-            logger.info("1. 타이틀 슬라이드 생성 중...")
-            self.add_title_slide()
-            logger.debug("타이틀 슬라이드 생성 완료")
-            
-            logger.info("2. 개요 슬라이드 생성 중...")
-            self.add_overview_slide()
-            logger.debug("개요 슬라이드 생성 완료")
-            
-            logger.info("3. 기본 기능 슬라이드 생성 중...")
-            self.add_basic_features_slide()
-            logger.debug("기본 기능 슬라이드 생성 완료")
-            
-            logger.info("4. 확장프로그램 슬라이드 생성 중...")
-            self.add_extensions_slide()
-            logger.debug("확장프로그램 슬라이드 생성 완료")
-            
-            logger.info("5. 한글교육 도구 슬라이드 생성 중...")
-            self.add_korean_tools_slide()
-            logger.debug("한글교육 도구 슬라이드 생성 완료")
-            
-            logger.info("6. 워크스페이스 슬라이드 생성 중...")
-            self.add_workspace_slide()
-            logger.debug("워크스페이스 슬라이드 생성 완료")
-            
-            logger.info("7. AI 도구 슬라이드 생성 중...")
-            self.add_ai_tools_slide()
-            logger.debug("AI 도구 슬라이드 생성 완료")
-            
-            logger.info("8. 실습 슬라이드 생성 중...")
-            self.add_practice_slide()
-            logger.debug("실습 슬라이드 생성 완료")
-            
-            logger.info("9. 자료 슬라이드 생성 중...")
-            self.add_resources_slide()
-            logger.debug("자료 슬라이드 생성 완료")
-            
-            logger.info("10. 연락처 슬라이드 생성 중...")
-            self.add_contact_slide()
-            logger.debug("연락처 슬라이드 생성 완료")
+            if config is None:
+                config = self.load_slide_config()
+            self.render_deck(config)
             
             # 날짜와 시간이 포함된 파일명 생성
             timestamp = datetime.now().strftime("%Y%m%d_%H%M")
             output_file = self.output_dir / f"chrome_education_slides_{timestamp}.pptx"
             
             logger.info(f"💾 프레젠테이션 저장 중: {output_file}")
-            self.prs.save(str(output_file))
+            with get_tracer().span("prs.save", "pptx") as span:
+                self.prs.save(str(output_file))
+                span.set(bytes_written=output_file.stat().st_size)
             
             logger.info(f"✅ PowerPoint 프레젠테이션 생성 완료: {output_file}")
             logger.info(f"📊 총 슬라이드 수: {len(self.prs.slides)}")
@@ -511,6 +632,50 @@ class ChromeEducationPPTXGenerator:
             logger.exception("상세 오류:")
             raise
 
-if __name__ == "__main__":
+# 프로세스 풀 작업자별 상태 (initializer에서 한 번만 준비)
+_batch_worker = None
+
+
+def _init_batch_worker(project_dir, config, output_dir):
+    """작업자 프로세스마다 생성기와 템플릿을 한 번만 준비"""
+    global _batch_worker
+    logging.getLogger().setLevel(logging.WARNING)
+    _batch_worker = (ChromeEducationPPTXGenerator(project_dir), config, output_dir)
+
+
+def _render_batch_variant(variant):
+    """작업자 프로세스에서 변형 덱 하나 생성"""
+    generator, config, output_dir = _batch_worker
+    return str(generator.generate_variant(config, variant, output_dir))
+
+
+def main(argv=None):
+    import argparse
+
+    from build_logging import add_logging_arguments, configure_from_args
+
+    parser = argparse.ArgumentParser(description="Chrome Education PowerPoint 생성")
+    parser.add_argument("--variants", type=Path, default=None,
+                        help="학교별 변형 목록 JSON 파일 (변형 덱 일괄 생성)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="변형 덱 생성에 사용할 프로세스 수")
+    add_logging_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_from_args(args)
+    
     generator = ChromeEducationPPTXGenerator()
-    generator.generate_presentation()
+    if args.variants:
+        config = generator.load_slide_config()
+        try:
+            variants = load_variants(args.variants, config)
+        except ValueError as error:
+            logger.error(f"❌ 변형 목록 오류: {error}")
+            return 1
+        generator.generate_batch(variants, jobs=args.jobs, config=config)
+    else:
+        generator.generate_presentation()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,18 +4,23 @@ Chrome Education Slides Generator
 한글학교 선생님을 위한 크롬 웹브라우저 활용 교육 슬라이드 생성기
 """
 
+import html
 import json
-import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
 
-import markdown
+from build_cache import CACHE_DIR_NAME, DiskCache, content_key
+from build_trace import get_tracer
+from page_templates import (INDEX_PAGE_SIZE, LAZY_SCRIPT, CompiledTemplate, lazy_sections_html,
+                            page_name, page_ranges, pager_html, paginate)
 
 
-def convert_markdown_to_html(md_content):
-    """마크다운을 HTML로 변환"""
-    html = markdown.markdown(md_content, extensions=['extra', 'codehilite'])
-    return f'''<!DOCTYPE html>
+MARKDOWN_EXTENSIONS = ['extra', 'codehilite']
+MARKDOWN_EXTENSION_CONFIGS = {}
+
+# 마크다운 문서 페이지 틀 (본문 앞/뒤를 미리 만들어 두고 변환 결과만 끼워 넣음)
+MARKDOWN_PAGE_HEAD = '''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -24,237 +29,70 @@ def convert_markdown_to_html(md_content):
     <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
     <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;700&display=swap" rel="stylesheet">
     <style>
-        body {{ font-family: 'Noto Sans KR', sans-serif; }}
-        .markdown-body {{ max-width: 800px; margin: 2rem auto; padding: 2rem; }}
-        .markdown-body h1 {{ font-size: 2rem; font-weight: bold; margin-bottom: 1rem; }}
-        .markdown-body h2 {{ font-size: 1.5rem; font-weight: bold; margin-top: 2rem; margin-bottom: 1rem; }}
-        .markdown-body p {{ margin-bottom: 1rem; line-height: 1.6; }}
-        .markdown-body ul {{ list-style-type: disc; margin-left: 2rem; margin-bottom: 1rem; }}
-        .markdown-body code {{ background-color: #f3f4f6; padding: 0.2rem 0.4rem; border-radius: 0.25rem; }}
+        body { font-family: 'Noto Sans KR', sans-serif; }
+        .markdown-body { max-width: 800px; margin: 2rem auto; padding: 2rem; }
+        .markdown-body h1 { font-size: 2rem; font-weight: bold; margin-bottom: 1rem; }
+        .markdown-body h2 { font-size: 1.5rem; font-weight: bold; margin-top: 2rem; margin-bottom: 1rem; }
+        .markdown-body p { margin-bottom: 1rem; line-height: 1.6; }
+        .markdown-body ul { list-style-type: disc; margin-left: 2rem; margin-bottom: 1rem; }
+        .markdown-body code { background-color: #f3f4f6; padding: 0.2rem 0.4rem; border-radius: 0.25rem; }
     </style>
 </head>
 <body class="bg-gray-50">
     <div class="markdown-body bg-white rounded-lg shadow-lg">
-        {html}
+        '''
+MARKDOWN_PAGE_TAIL = '''
     </div>
 </body>
 </html>'''
 
+# 인덱스 카드 머리 색상 (슬라이드 유형별)
+INDEX_CARD_COLORS = {
+    "title": "bg-gradient-to-r from-blue-500 to-purple-500",
+    "content": "bg-gradient-to-r from-green-500 to-blue-500",
+    "contact": "bg-gradient-to-r from-orange-500 to-red-500"
+}
+DEFAULT_CARD_COLOR = "bg-gradient-to-r from-gray-500 to-gray-600"
 
+# 인덱스 카드와 페이지 틀 (모듈을 불러올 때 한 번만 나눠 둠)
+PRESENTATION_CARD = CompiledTemplate('''
+            <div class="slide-card bg-white rounded-xl shadow-lg overflow-hidden">
+                <div class="{color} p-4">
+                    <div class="flex items-center justify-between">
+                        <span class="text-white font-bold">슬라이드 {number}</span>
+                        <i class="fas fa-presentation text-white text-xl"></i>
+                    </div>
+                </div>
+{thumbnail}                <div class="p-6">
+                    <h3 class="text-lg font-bold text-gray-800 mb-3">{title}</h3>
+                    <div class="flex justify-between items-center">
+                        <span class="text-sm text-gray-500 capitalize">{type}</span>
+                        <a href="{href}" target="_blank" 
+                           class="bg-blue-500 text-white px-4 py-2 rounded-lg hover:bg-blue-600 transition-colors inline-flex items-center">
+                            <i class="fas fa-eye mr-2"></i>보기
+                        </a>
+                    </div>
+                </div>
+            </div>
+''')
+LIST_CARD = CompiledTemplate('''            <div class="slide-card bg-white rounded-lg shadow-md p-6 hover:shadow-lg">
+                <h3 class="text-lg font-bold text-gray-800 mb-2">{title}</h3>
+                <p class="text-gray-600 mb-4">슬라이드 {position}</p>
+                <a href="{href}" target="_blank"
+                   class="inline-block bg-blue-500 text-white px-4 py-2 rounded hover:bg-blue-600 transition-colors">
+                    보기
+                </a>
+            </div>
+''')
 
-class ChromeEducationSlidesGenerator:
-    def __init__(self, project_dir=None):
-        if project_dir is None:
-            project_dir = Path(__file__).parent.parent
-        
-        self.project_dir = Path(project_dir)
-        self.slides_dir = self.project_dir / "slides"
-        self.assets_dir = self.project_dir / "assets"
-        self.output_dir = self.project_dir / "output"
-        self.src_dir = self.project_dir / "src"
-        
-        # 디렉토리 생성
-        self.output_dir.mkdir(exist_ok=True)
-        self.src_dir.mkdir(exist_ok=True)
-    
-    def get_slide_config(self):
-        """슬라이드 구성 정보 반환"""
-        return {
-            "title": "수업을 쉽게, 자료를 예쁘게, 협업을 효율적으로 — 디지털 도구 완전정복",
-            "subtitle": "한글학교 선생님을 위한 크롬 웹브라우저 활용 교육",
-            "slides": [
-                {
-                    "id": "title_slide",
-                    "title": "타이틀 슬라이드",
-                    "type": "title",
-                    "content": {
-                        "main_title": "수업을 쉽게, 자료를 예쁘게, 협업을 효율적으로",
-                        "subtitle": "디지털 도구 완전정복",
-                        "description": "한글학교 선생님을 위한 크롬 웹브라우저 활용 교육"
-                    }
-                },
-                {
-                    "id": "course_overview",
-                    "title": "강의 개요",
-                    "type": "content",
-                    "content": {
-                        "sections": [
-                            "교육 목표 및 대상",
-                            "기초-중급-고급 단계별 구성",
-                            "실습 중심의 학습 방법",
-                            "지속적인 학습을 위한 커뮤니티"
-                        ]
-                    }
-                },
-                {
-                    "id": "basic_features",
-                    "title": "기초 단계: 크롬 브라우저 기본 기능",
-                    "type": "content",
-                    "content": {
-                        "features": [
-                            "프로필 관리",
-                            "북마크 활용",
-                            "단축키 활용",
-                            "기본 설정 최적화"
-                        ]
-                    }
-                },
-                {
-                    "id": "extensions_intro",
-                    "title": "중급 단계: 교육자를 위한 확장프로그램",
-                    "type": "content",
-                    "content": {
-                        "extensions": [
-                            "Fireshot - 웹페이지 캡처",
-                            "Google Keep - 메모 및 스크랩",
-                            "Video Speed Controller - 동영상 속도 조절",
-                            "Mote - 음성 피드백"
-                        ]
-                    }
-                },
-                {
-                    "id": "korean_edu_tools",
-                    "title": "중급 단계: 한글교육 특화 웹도구",
-                    "type": "content",
-                    "content": {
-                        "tools": [
-                            "스터디코리안넷",
-                            "한국어교수학습샘터",
-                            "NAKS 온라인 자료실",
-                            "한글또박또박"
-                        ]
-                    }
-                },
-                {
-                    "id": "advanced_collab",
-                    "title": "고급 단계: 구글 워크스페이스 연동",
-                    "type": "content",
-                    "content": {
-                        "workspace_tools": [
-                            "구글 클래스룸",
-                            "구글 문서/슬라이드",
-                            "구글 드라이브",
-                            "구글 미트"
-                        ]
-                    }
-                },
-                {
-                    "id": "ai_tools",
-                    "title": "고급 단계: AI 도구 활용",
-                    "type": "content",
-                    "content": {
-                        "ai_tools": [
-                            "Brisk Teaching - AI 교사 어시스턴트",
-                            "ChatGPT - 교육 자료 생성",
-                            "Canva AI - 시각적 자료 제작",
-                            "음성 인식/합성 도구"
-                        ]
-                    }
-                },
-                {
-                    "id": "practice_scenarios",
-                    "title": "실습 시나리오",
-                    "type": "content",
-                    "content": {
-                        "scenarios": [
-                            "새 학기 준비 (기초)",
-                            "효율적인 수업 자료 준비 (중급)",
-                            "온라인 수업 진행 (중급)",
-                            "학급 관리 시스템 구축 (고급)"
-                        ]
-                    }
-                },
-                {
-                    "id": "resources",
-                    "title": "추가 자료 및 참고 링크",
-                    "type": "content",
-                    "content": {
-                        "resources": [
-                            "크롬 브라우저 공식 자료",
-                            "한글교육 자료",
-                            "디지털 교육 도구",
-                            "교사 커뮤니티"
-                        ]
-                    }
-                },
-                {
-                    "id": "qa_contact",
-                    "title": "질문 및 연락처",
-                    "type": "contact",
-                    "content": {
-                        "contact_info": [
-                            "이메일: support@koreanedu.org",
-                            "전화: 02-123-4567",
-                            "웹사이트: www.koreanedu.org"
-                        ]
-                    }
-                }
-            ]
-        }
-    
-    def generate_slide_config_file(self):
-        """슬라이드 구성 파일 생성"""
-        config = self.get_slide_config()
-        config_file = self.src_dir / "slide_config.json"
-        
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
-        
-        print(f"✅ 슬라이드 구성 파일 생성: {config_file}")
-        return config_file
-    
-    def copy_existing_slides(self):
-        """기존 슬라이드 파일들을 output 디렉토리로 복사"""
-        if self.slides_dir.exists():
-            print("📋 기존 슬라이드 파일 복사 중...")
-            
-            # HTML 파일들 복사
-            for html_file in self.slides_dir.glob("*.html"):
-                shutil.copy2(html_file, self.output_dir)
-                print(f"  ✅ {html_file.name} 복사 완료")
-            
-            # 이미지 디렉토리가 있다면 복사
-            images_dir = self.slides_dir / "images"
-            if images_dir.exists():
-                output_images_dir = self.output_dir / "images"
-                if output_images_dir.exists():
-                    shutil.rmtree(output_images_dir)
-                shutil.copytree(images_dir, output_images_dir)
-                print("  ✅ 이미지 디렉토리 복사 완료")
-    
-    def convert_markdown_files(self):
-        """마크다운 파일들을 HTML로 변환"""
-        docs_dir = self.project_dir / "docs"
-        if docs_dir.exists():
-            print("📄 마크다운 파일 HTML 변환 중...")
-            
-            for md_file in docs_dir.glob("*.md"):
-                try:
-                    with open(md_file, 'r', encoding='utf-8') as f:
-                        md_content = f.read()
-                    
-                    html_content = convert_markdown_to_html(md_content)
-                    html_file = self.output_dir / f"{md_file.stem}.html"
-                    
-                    with open(html_file, 'w', encoding='utf-8') as f:
-                        f.write(html_content)
-                    
-                    print(f"  ✅ {md_file.name} → {html_file.name} 변환 완료")
-                except Exception as e:
-                    print(f"  ⚠️ {md_file.name} 변환 실패: {e}")
-    
-    def generate_presentation_index(self):
-        """프레젠테이션 인덱스 HTML 생성"""
-        config = self.get_slide_config()
-        
-        current_date = datetime.now().strftime("%Y년 %m월 %d일 %H:%M")
-        
-        html_content = f'''<!DOCTYPE html>
+# 페이지 틀 (cards: 이 페이지의 카드, more: 뒤쪽 카드 묶음과 페이지 이동 막대, lazy_script: 지연 로딩 스크립트,
+#            search_box/search_script: 검색 상자와 검색 스크립트)
+PRESENTATION_INDEX_PAGE = CompiledTemplate('''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{config["title"]}</title>
+    <title>{page_title}</title>
     <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css" rel="stylesheet">
     <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;700&display=swap" rel="stylesheet">
@@ -314,9 +152,9 @@ class ChromeEducationSlidesGenerator:
                 <i class="fab fa-chrome text-6xl text-blue-500 mr-4"></i>
                 <div>
                     <h1 class="text-4xl font-bold chrome-colors mb-2">
-                        {config["title"]}
+                        {title}
                     </h1>
-                    <p class="text-xl text-gray-600">{config["subtitle"]}</p>
+                    <p class="text-xl text-gray-600">{subtitle}</p>
                 </div>
             </div>
             <div class="bg-white rounded-lg shadow-md p-6 max-w-2xl mx-auto">
@@ -328,44 +166,11 @@ class ChromeEducationSlidesGenerator:
             </div>
         </div>
         
-        <!-- 슬라이드 목록 -->
-        <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6 mb-12">
-'''
-        
-        # 슬라이드 카드 생성
-        for i, slide in enumerate(config["slides"]):
-            level_colors = {
-                "title": "bg-gradient-to-r from-blue-500 to-purple-500",
-                "content": "bg-gradient-to-r from-green-500 to-blue-500",
-                "contact": "bg-gradient-to-r from-orange-500 to-red-500"
-            }
-            
-            card_color = level_colors.get(slide["type"], "bg-gradient-to-r from-gray-500 to-gray-600")
-            
-            html_content += f'''
-            <div class="slide-card bg-white rounded-xl shadow-lg overflow-hidden">
-                <div class="{card_color} p-4">
-                    <div class="flex items-center justify-between">
-                        <span class="text-white font-bold">슬라이드 {i+1:02d}</span>
-                        <i class="fas fa-presentation text-white text-xl"></i>
-                    </div>
-                </div>
-                <div class="p-6">
-                    <h3 class="text-lg font-bold text-gray-800 mb-3">{slide["title"]}</h3>
-                    <div class="flex justify-between items-center">
-                        <span class="text-sm text-gray-500 capitalize">{slide["type"]}</span>
-                        <a href="{i+1:02d}_{slide["id"]}.html" target="_blank" 
-                           class="bg-blue-500 text-white px-4 py-2 rounded-lg hover:bg-blue-600 transition-colors inline-flex items-center">
-                            <i class="fas fa-eye mr-2"></i>보기
-                        </a>
-                    </div>
-                </div>
-            </div>
-'''
-        
-        html_content += f'''
+{search_box}        <!-- 슬라이드 목록 -->
+        <div id="slide-cards" class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6 mb-12">
+{cards}
         </div>
-        
+{more}        
         <!-- 추가 자료 섹션 -->
         <div class="bg-white rounded-xl shadow-lg p-8">
             <h2 class="text-2xl font-bold text-center text-gray-800 mb-8">
@@ -416,19 +221,511 @@ class ChromeEducationSlidesGenerator:
             </p>
         </div>
     </div>
-</body>
-</html>'''
+{lazy_script}{search_script}</body>
+</html>''')
+
+SLIDES_INDEX_PAGE = CompiledTemplate('''<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{page_title}</title>
+    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
+    <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;700&display=swap" rel="stylesheet">
+    <style>
+        body {{ font-family: 'Noto Sans KR', sans-serif; }}
+        .slide-card:hover {{ transform: translateY(-2px); transition: all 0.3s ease; }}
+    </style>
+</head>
+<body class="bg-gray-100">
+    <div class="container mx-auto px-4 py-8">
+        <h1 class="text-4xl font-bold text-center text-blue-600 mb-8">
+            수업을 쉽게, 자료를 예쁘게, 협업을 효율적으로<br>
+            <span class="text-2xl text-gray-700">디지털 도구 완전정복</span>
+        </h1>
+
+        <div id="slide-cards" class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+{cards}        </div>
+{more}
+        <div class="mt-12 text-center">
+            <h2 class="text-2xl font-bold text-gray-800 mb-4">추가 자료</h2>
+            <div class="flex justify-center space-x-4">
+                <a href="../docs/chrome_edu_workbook.pdf" target="_blank"
+                   class="bg-green-500 text-white px-6 py-3 rounded-lg hover:bg-green-600 transition-colors">
+                    📚 실습 워크북 (PDF)
+                </a>
+                <a href="../docs/chrome_education_research.md" target="_blank"
+                   class="bg-purple-500 text-white px-6 py-3 rounded-lg hover:bg-purple-600 transition-colors">
+                    📋 조사 자료
+                </a>
+                <a href="../docs/curriculum_design.md" target="_blank"
+                   class="bg-orange-500 text-white px-6 py-3 rounded-lg hover:bg-orange-600 transition-colors">
+                    📖 커리큘럼 설계
+                </a>
+            </div>
+        </div>
+    </div>
+{lazy_script}</body>
+</html>
+''')
+
+
+class MarkdownConverter:
+    """마크다운 → HTML 페이지 변환기
+
+    Markdown 인스턴스(확장, Pygments lexer 포함)는 한 번만 만들고 문서마다 reset()으로
+    재사용합니다. cache가 주어지면 원본 해시 + 확장 설정을 키로 렌더링 결과를 디스크에 저장해
+    바뀌지 않은 문서는 다시 렌더링하지 않습니다.
+    """
+
+    def __init__(self, extensions=None, extension_configs=None, cache=None):
+        import markdown
+
+        self.extensions = list(extensions or MARKDOWN_EXTENSIONS)
+        self.extension_configs = dict(extension_configs or MARKDOWN_EXTENSION_CONFIGS)
+        self.md = markdown.Markdown(extensions=self.extensions,
+                                    extension_configs=self.extension_configs)
+        self.cache = cache
+        self.config_key = json.dumps({
+            "markdown": markdown.__version__,
+            "extensions": self.extensions,
+            "extension_configs": self.extension_configs,
+            "page": content_key(MARKDOWN_PAGE_HEAD, MARKDOWN_PAGE_TAIL),
+        }, sort_keys=True, default=str)
+        # Markdown 인스턴스는 스레드 안전하지 않으므로 병렬 빌드에서 직렬화
+        self._lock = threading.Lock()
+
+    def render(self, md_content):
+        """마크다운 본문만 HTML로 변환"""
+        with self._lock:
+            self.md.reset()
+            return self.md.convert(md_content)
+
+    def convert(self, md_content):
+        """마크다운을 완성된 HTML 페이지로 변환 (캐시 사용)"""
+        key = content_key(self.config_key, md_content)
+        if self.cache is not None:
+            cached = self.cache.get(key, ".html")
+            if cached is not None:
+                return cached.decode('utf-8')
+
+        page = MARKDOWN_PAGE_HEAD + self.render(md_content) + MARKDOWN_PAGE_TAIL
+        if self.cache is not None:
+            self.cache.put(key, page.encode('utf-8'), ".html")
+        return page
+
+
+_default_converter = None
+
+
+def convert_markdown_to_html(md_content):
+    """마크다운을 HTML로 변환"""
+    global _default_converter
+    if _default_converter is None:
+        _default_converter = MarkdownConverter()
+    return _default_converter.convert(md_content)
+
+
+class ChromeEducationSlidesGenerator:
+    def __init__(self, project_dir=None):
+        if project_dir is None:
+            project_dir = Path(__file__).parent.parent
+        
+        self.project_dir = Path(project_dir)
+        self.slides_dir = self.project_dir / "slides"
+        self.assets_dir = self.project_dir / "assets"
+        self.output_dir = self.project_dir / "output"
+        self.src_dir = self.project_dir / "src"
         
-        index_file = self.output_dir / "index.html"
-        with open(index_file, 'w', encoding='utf-8') as f:
+        self.cache_dir = self.project_dir / CACHE_DIR_NAME
+        # 마크다운 변환기, 슬라이드 IR 캐시는 처음 필요할 때 만듦 (build_info 등 가벼운 명령의 import 비용 절약)
+        self._markdown = None
+        self._slide_ir = None
+        self._deck = None
+        # index.html / slides_index.html 한 페이지의 카드 수 (넘치면 index_002.html ... 로 나눔)
+        self.index_page_size = INDEX_PAGE_SIZE
+        # 생성하는 HTML 페이지에 저장 직전 차례로 적용할 변환 (html -> html)
+        self.html_filters = []
+        # 필터를 적용한 뒤 마지막으로 페이지를 최소화할 HtmlMinifier (None이면 그대로 저장)
+        self.minifier = None
+        
+        # 디렉토리 생성
+        self.output_dir.mkdir(exist_ok=True)
+        self.src_dir.mkdir(exist_ok=True)
+    
+    def get_markdown_converter(self):
+        """디스크 캐시를 쓰는 마크다운 변환기 (처음 필요할 때 한 번 생성)"""
+        if self._markdown is None:
+            self._markdown = MarkdownConverter(cache=DiskCache("markdown", self.cache_dir))
+        return self._markdown
+    
+    def get_slide_ir(self):
+        """슬라이드 HTML IR 캐시 (처음 필요할 때 한 번 생성)"""
+        if self._slide_ir is None:
+            from slide_ir import SlideIRCache
+
+            self._slide_ir = SlideIRCache(self.cache_dir)
+        return self._slide_ir
+    
+    def write_html(self, path, html_content):
+        """html_filters를 적용해 HTML 페이지 저장 (minifier가 있으면 마지막에 최소화)"""
+        for html_filter in self.html_filters:
+            html_content = html_filter(html_content)
+        if self.minifier is not None:
+            html_content = self.minifier.minify(Path(path).name, html_content)
+        with open(path, 'w', encoding='utf-8') as f:
             f.write(html_content)
+        return path
+    
+    def get_deck(self, refresh=False):
+        """슬라이드 HTML의 IR로 빠진 값(제목, 타이틀 슬라이드 문구 등)을 채운 슬라이드 구성
+
+        한 번 만든 결과를 재사용하며, refresh=True이면 HTML을 다시 확인합니다 (내용이 같은 파일은 캐시 사용).
+        """
+        if self._deck is None or refresh:
+            from slide_ir import resolve_slide
+
+            config = self.get_slide_config()
+            slide_ir = self.get_slide_ir()
+            slides = [resolve_slide(slide, slide_ir.load(self.slides_dir / f"{slide['id']}.html"))
+                      for slide in config["slides"]]
+            self._deck = dict(config, slides=slides)
+        return self._deck
+
+    def get_slide_config(self):
+        """슬라이드 구성 정보 반환
+
+        HTML에 이미 있는 값(슬라이드 제목, 타이틀 슬라이드 문구)은 적지 않고 get_deck에서 IR로 채웁니다.
+        여기에 적은 값은 IR보다 우선합니다 (예: 발표용으로 요약한 항목 목록).
+        """
+        return {
+            "title": "수업을 쉽게, 자료를 예쁘게, 협업을 효율적으로 — 디지털 도구 완전정복",
+            "subtitle": "한글학교 선생님을 위한 크롬 웹브라우저 활용 교육",
+            "slides": [
+                {
+                    "id": "title_slide",
+                    "title": "타이틀 슬라이드",
+                    "type": "title",
+                    "accent": "blue"
+                },
+                {
+                    "id": "course_overview",
+                    "type": "content",
+                    "accent": "blue",
+                    "item_style": "compact",
+                    "content": {
+                        "heading": "교육 과정 정보",
+                        "items": [
+                            "목표: 크롬 웹브라우저를 활용하여 한글교육의 효율성을 높이고 디지털 교육 도구를 마스터하기",
+                            "대상: 한글학교 교사 및 한국어 교육자",
+                            "구성: 총 10차시 (기초 3차시, 중급 4차시, 고급 3차시)",
+                            "방식: 이론 학습 + 실습 + 실제 적용 시나리오"
+                        ]
+                    }
+                },
+                {
+                    "id": "basic_features",
+                    "type": "content",
+                    "accent": "green",
+                    "content": {
+                        "heading": "핵심 기능",
+                        "items": [
+                            "프로필 관리 및 설정 최적화",
+                            "즐겨찾기와 북마크 체계적 관리",
+                            "필수 단축키 마스터",
+                            "탭 그룹 활용법",
+                            "검색 및 번역 기능 활용"
+                        ]
+                    }
+                },
+                {
+                    "id": "extensions_intro",
+                    "type": "content",
+                    "accent": "yellow",
+                    "content": {
+                        "heading": "추천 확장프로그램",
+                        "items": [
+                            "Fireshot - 웹페이지 전체 캡처",
+                            "Google Keep - 메모 및 웹 스크랩",
+                            "Video Speed Controller - 동영상 속도 조절",
+                            "Mote - 음성 피드백 도구",
+                            "Brisk Teaching - AI 교사 어시스턴트"
+                        ]
+                    }
+                },
+                {
+                    "id": "korean_edu_tools",
+                    "type": "content",
+                    "accent": "red",
+                    "content": {
+                        "heading": "한글교육 전용 사이트",
+                        "items": [
+                            "스터디코리안넷 - 종합 한국어 학습 플랫폼",
+                            "한국어교수학습샘터 - 교사용 자료 제공",
+                            "NAKS 온라인 자료실 - 한글학교 교육 자료",
+                            "한글또박또박 - 한글 쓰기 연습",
+                            "세종학당 - 온라인 한국어 강좌"
+                        ]
+                    }
+                },
+                {
+                    "id": "advanced_collab",
+                    "type": "content",
+                    "accent": "blue",
+                    "content": {
+                        "heading": "협업 도구 활용",
+                        "items": [
+                            "구글 클래스룸 - 온라인 학급 관리",
+                            "구글 문서/슬라이드 - 실시간 공동 편집",
+                            "구글 드라이브 - 클라우드 자료 관리",
+                            "구글 미트 - 화상 수업 진행",
+                            "구글 폼 - 설문 및 퀴즈 제작"
+                        ]
+                    }
+                },
+                {
+                    "id": "ai_tools",
+                    "type": "content",
+                    "accent": "green",
+                    "content": {
+                        "heading": "AI 기반 교육 도구",
+                        "items": [
+                            "ChatGPT - 교육 자료 생성 및 아이디어 제공",
+                            "Canva AI - 시각적 자료 자동 제작",
+                            "Brisk Teaching - AI 퀴즈 및 과제 생성",
+                            "음성 인식/합성 - 발음 교정 및 듣기 자료",
+                            "번역 도구 - 다국어 학습자 지원"
+                        ]
+                    }
+                },
+                {
+                    "id": "practice_scenarios",
+                    "type": "content",
+                    "accent": "red",
+                    "item_style": "compact",
+                    "content": {
+                        "heading": "단계별 실습 과제",
+                        "items": [
+                            "기초: 새 학기 준비 - 프로필 설정 및 북마크 정리",
+                            "중급: 효율적인 수업 자료 준비 - 웹 스크랩 및 퀴즈 생성",
+                            "중급: 온라인 수업 진행 - 화면 공유 및 상호작용",
+                            "고급: 학급 관리 시스템 구축 - 클래스룸 활용",
+                            "고급: 협업 프로젝트 진행 - 워크스페이스 연동"
+                        ]
+                    }
+                },
+                {
+                    "id": "resources",
+                    "type": "content",
+                    "accent": "yellow",
+                    "item_style": "compact",
+                    "content": {
+                        "heading": "유용한 링크",
+                        "items": [
+                            "Google Chrome 도움말 - support.google.com/chrome",
+                            "Chrome 웹 스토어 - chrome.google.com/webstore",
+                            "Google Workspace for Education - edu.google.com",
+                            "스터디코리안넷 - study.korean.net",
+                            "재미한국학교협의회 - www.naks.org"
+                        ]
+                    }
+                },
+                {
+                    "id": "qa_contact",
+                    "type": "contact",
+                    "accent": "blue",
+                    "item_style": "compact",
+                    "content": {
+                        "heading": "지원 및 문의",
+                        "items": [
+                            "GitHub 저장소: github.com/linuxsw/chrome_lecture_for_korean_teacher",
+                            "이슈 및 질문: GitHub Issues 활용",
+                            "토론 및 피드백: GitHub Discussions 참여",
+                            "개발자: Seungweon Park (linuxsw@gmail.com)"
+                        ],
+                        "closing": "🌟 더 나은 한글교육을 위한 여러분의 디지털 여정을 응원합니다! 🌟"
+                    }
+                }
+            ]
+        }
+    
+    def generate_slide_config_file(self):
+        """슬라이드 구성 파일 생성 (IR로 채운 값 포함)"""
+        from slide_ir import strip_ir
+
+        config = strip_ir(self.get_deck())
+        config_file = self.src_dir / "slide_config.json"
+        
+        with open(config_file, 'w', encoding='utf-8') as f:
+            json.dump(config, f, ensure_ascii=False, indent=2)
+        
+        print(f"✅ 슬라이드 구성 파일 생성: {config_file}")
+        return config_file
+    
+    def copy_existing_slides(self):
+        """기존 슬라이드 파일들을 output 디렉토리로 동기화 (변경된 파일만 복사)"""
+        from sync_files import SYNC_RECORD_DIR, FileSync
+
+        copied = []
+        if self.slides_dir.exists():
+            print("📋 기존 슬라이드 파일 복사 중...")
+            sync = FileSync()
+            
+            # HTML 파일들 복사 (원본에서 사라진 슬라이드의 복사본은 삭제)
+            copied.extend(sync.sync_files(sorted(self.slides_dir.glob("*.html")), self.output_dir,
+                                          record=self.cache_dir / SYNC_RECORD_DIR / "slides.json"))
+            
+            # 이미지 디렉토리가 있다면 동기화 (원본에서 사라진 이미지만 삭제)
+            images_dir = self.slides_dir / "images"
+            if images_dir.exists():
+                copied.extend(sync.sync_tree(images_dir, self.output_dir / "images"))
+            print(f"  ✅ 슬라이드 {len(copied)}개 파일 동기화 완료 ({sync.summary()})")
+        return copied
+    
+    def convert_markdown_file(self, md_file):
+        """마크다운 파일 하나를 HTML로 변환"""
+        md_file = Path(md_file)
+        with open(md_file, 'r', encoding='utf-8') as f:
+            md_content = f.read()
         
-        print(f"✅ 프레젠테이션 인덱스 생성: {index_file}")
+        html_content = self.get_markdown_converter().convert(md_content)
+        html_file = self.output_dir / f"{md_file.stem}.html"
+        self.write_html(html_file, html_content)
+        
+        print(f"  ✅ {md_file.name} → {html_file.name} 변환 완료")
+        return html_file
+    
+    def convert_markdown_files(self):
+        """마크다운 파일들을 HTML로 변환"""
+        converted = []
+        docs_dir = self.project_dir / "docs"
+        if docs_dir.exists():
+            print("📄 마크다운 파일 HTML 변환 중...")
+            
+            for md_file in docs_dir.glob("*.md"):
+                try:
+                    converted.append(self.convert_markdown_file(md_file))
+                except Exception as e:
+                    print(f"  ⚠️ {md_file.name} 변환 실패: {e}")
+        return converted
+    
+    def index_cards(self, config, thumbnails=None):
+        """index.html과 slides_index.html의 슬라이드 카드 목록 (슬라이드 목록 한 번 순회, 슬라이드마다 하나)
+
+        thumbnails: 슬라이드 id별 미리보기 (thumbnails.json, 있는 슬라이드만 index.html 카드에 이미지 표시)
+        """
+        from thumbnails import thumbnail_html
+
+        thumbnails = thumbnails or {}
+        presentation_cards, list_cards = [], []
+        for i, slide in enumerate(config["slides"]):
+            number = f"{i+1:02d}"
+            values = {
+                "number": number,
+                "position": i + 1,
+                "href": f'{number}_{slide["id"]}.html',
+                "color": INDEX_CARD_COLORS.get(slide["type"], DEFAULT_CARD_COLOR),
+                "title": html.escape(slide["title"], quote=False),
+                "type": slide["type"],
+                "thumbnail": thumbnail_html(thumbnails.get(slide["id"]), html.escape(f'{slide["title"]} 미리보기')),
+            }
+            presentation_cards.append(PRESENTATION_CARD.render(values))
+            list_cards.append(LIST_CARD.render(values))
+        return presentation_cards, list_cards
+
+    def generate_indexes(self):
+        """index.html과 slides_index.html을 같은 구성과 카드 순회로 함께 생성 (나눈 페이지 포함)"""
+        from thumbnails import load_thumbnail_manifest
+
+        config = self.get_deck()
+        presentation_cards, list_cards = self.index_cards(config, load_thumbnail_manifest(self.output_dir))
+        return (self.generate_presentation_index(config, presentation_cards)
+                + self.generate_slides_index(config, list_cards))
+
+    def write_index_pages(self, stem, template, values, cards):
+        """카드를 index_page_size개씩 나눠 stem.html, stem_002.html ... 로 저장
+
+        첫 페이지에는 첫 묶음만 넣고 뒤쪽 묶음은 화면 가까이 왔을 때 해당 페이지에서 가져오며,
+        모든 페이지에 페이지 이동 막대를 넣습니다. 이전 빌드에서 남은 페이지는 삭제합니다.
+        """
+        pages = paginate(cards, self.index_page_size)
+        names = [page_name(stem, number) for number in range(1, len(pages) + 1)]
+        ranges = page_ranges(len(cards), self.index_page_size, len(pages))
+
+        files = []
+        for number, page_cards in enumerate(pages, start=1):
+            page_values = dict(values, cards="".join(page_cards), more="", lazy_script="")
+            if len(pages) > 1:
+                page_values["page_title"] = f'{values["page_title"]} ({number}/{len(pages)})'
+                page_values["more"] = pager_html(names, number)
+                if number == 1:
+                    page_values["more"] = lazy_sections_html(names[1:], ranges[1:]) + page_values["more"]
+                    page_values["lazy_script"] = LAZY_SCRIPT
+            files.append(self.write_html(self.output_dir / names[number - 1], template.render(page_values)))
+
+        for stale in self.output_dir.glob(f"{stem}_[0-9][0-9][0-9].html"):
+            if stale.name not in names:
+                stale.unlink()
+        return files
+
+    def generate_presentation_index(self, config=None, cards=None):
+        """프레젠테이션 인덱스 HTML 생성 (저장한 페이지 목록 반환, 첫 항목이 index.html)"""
+        from search_index import SEARCH_BOX, SEARCH_SCRIPT
+        from thumbnails import load_thumbnail_manifest
+
+        if config is None:
+            config = self.get_deck()
+        if cards is None:
+            cards = self.index_cards(config, load_thumbnail_manifest(self.output_dir))[0]
+
+        values = {
+            "page_title": config["title"],
+            "title": config["title"],
+            "subtitle": config["subtitle"],
+            "current_date": datetime.now().strftime("%Y년 %m월 %d일 %H:%M"),
+            "search_box": SEARCH_BOX,
+            "search_script": SEARCH_SCRIPT,
+        }
+        files = self.write_index_pages("index", PRESENTATION_INDEX_PAGE, values, cards)
+
+        print(f"✅ 프레젠테이션 인덱스 생성: {files[0]} ({len(files)}페이지)")
+        return files
+    
+    def generate_slides_index(self, config=None, cards=None):
+        """슬라이드 목록 페이지(slides_index.html) 생성 (저장한 페이지 목록 반환)"""
+        if config is None:
+            config = self.get_deck()
+        if cards is None:
+            cards = self.index_cards(config)[1]
+
+        files = self.write_index_pages("slides_index", SLIDES_INDEX_PAGE,
+                                       {"page_title": config["subtitle"]}, cards)
+
+        print(f"✅ 슬라이드 목록 생성: {files[0]} ({len(files)}페이지)")
+        return files
+
+    def generate_search_index(self):
+        """슬라이드 IR과 docs/*.md 본문으로 한글 검색 색인(search_index.json.gz) 생성"""
+        from search_index import SEARCH_INDEX, build_index, doc_documents, slide_documents, write_index
+
+        config = self.get_deck()
+        documents = list(slide_documents(config)) + list(doc_documents(self.project_dir / "docs"))
+        index = build_index(documents)
+        index_file = self.output_dir / SEARCH_INDEX
+        raw_size, compressed_size = write_index(index, index_file)
+
+        print(f"✅ 검색 색인 생성: {index_file} (문서 {len(index['docs'])}개, 토큰 {len(index['terms']):,}개, "
+              f"{raw_size:,} → {compressed_size:,} bytes)")
         return index_file
+
+    def find_latest_output(self, pattern):
+        """output 디렉토리에서 패턴과 일치하는 가장 최근 파일명 반환"""
+        matches = sorted(self.output_dir.glob(pattern))
+        return matches[-1].name if matches else None
     
     def generate_build_info(self):
         """빌드 정보 파일 생성"""
-        config = self.get_slide_config()
+        config = self.get_deck()
         
         current_date = datetime.now()
         timestamp = current_date.strftime("%Y%m%d_%H%M")
@@ -436,9 +733,9 @@ class ChromeEducationSlidesGenerator:
         # 실제 생성된 파일들 확인
         generated_files = ["index.html", "slide_config.json"]
         
-        # 타임스탬프가 포함된 파일명들 추가
-        pdf_file = f"chrome_edu_workbook_{timestamp}.pdf"
-        pptx_file = f"chrome_education_slides_{timestamp}.pptx"
+        # 타임스탬프가 포함된 파일명들 추가 (증분 빌드에서는 이전에 생성된 파일을 그대로 사용)
+        pdf_file = self.find_latest_output("chrome_edu_workbook_*.pdf") or f"chrome_edu_workbook_{timestamp}.pdf"
+        pptx_file = self.find_latest_output("chrome_education_slides_*.pptx") or f"chrome_education_slides_{timestamp}.pptx"
         
         generated_files.extend([pdf_file, pptx_file])
         generated_files.extend([f"{i+1:02d}_{slide['id']}.html" for i, slide in enumerate(config["slides"])])
@@ -451,6 +748,17 @@ class ChromeEducationSlidesGenerator:
             "subtitle": config["subtitle"],
             "slides_count": len(config["slides"]),
             "slides": [slide["id"] for slide in config["slides"]],
+            # 슬라이드 HTML에서 파싱한 IR 요약
+            "slides_detail": [
+                {
+                    "id": slide["id"],
+                    "title": slide["title"],
+                    "type": slide["type"],
+                    "sections": len(slide["ir"]["sections"]),
+                    "images": [image["src"] for image in slide["ir"]["images"]],
+                }
+                for slide in config["slides"]
+            ],
             "generated_files": generated_files
         }
         
@@ -461,30 +769,37 @@ class ChromeEducationSlidesGenerator:
         print(f"✅ 빌드 정보 생성: {build_file}")
         return build_file
     
-    def run(self):
-        """전체 생성 프로세스 실행"""
+    def run(self, trace_file=None):
+        """전체 생성 프로세스 실행 (trace_file을 주면 단계별 측정값을 Chrome trace 형식으로 저장)"""
         print("🚀 Chrome Education Slides Generator 시작")
         print(f"📁 프로젝트 디렉토리: {self.project_dir}")
         
-        # 1. 슬라이드 구성 파일 생성
-        self.generate_slide_config_file()
-        
-        # 2. 기존 슬라이드 파일 복사
-        self.copy_existing_slides()
-        
-        # 3. 마크다운 파일들을 HTML로 변환
-        self.convert_markdown_files()
-        
-        # 4. 프레젠테이션 인덱스 생성
-        self.generate_presentation_index()
+        tracer = get_tracer()
+        stages = [
+            # 1. 슬라이드 구성 파일 생성
+            self.generate_slide_config_file,
+            # 2. 기존 슬라이드 파일 복사
+            self.copy_existing_slides,
+            # 3. 마크다운 파일들을 HTML로 변환
+            self.convert_markdown_files,
+            # 4. 프레젠테이션 인덱스와 슬라이드 목록 생성
+            self.generate_indexes,
+            # 5. 검색 색인 생성
+            self.generate_search_index,
+            # 6. 빌드 정보 생성
+            self.generate_build_info,
+        ]
+        for stage in stages:
+            with tracer.span(stage.__name__, "slides"):
+                stage()
+        build_file = tracer.embed(self.output_dir / "build_info.json")
         
-        # 5. 빌드 정보 생성
-        self.generate_build_info()
-        
-        # 5. 결과 출력
+        # 7. 결과 출력
         print("\n🎉 슬라이드 생성 완료!")
         print(f"📂 결과물 위치: {self.output_dir}")
         print(f"🌐 프레젠테이션 인덱스: {self.output_dir}/index.html")
+        if trace_file:
+            print(f"📈 트레이스 저장: {tracer.write_chrome_trace(trace_file)}")
         
         # 생성된 파일 목록
         print("\n📋 생성된 파일 목록:")
@@ -492,8 +807,15 @@ class ChromeEducationSlidesGenerator:
             if file_path.is_file():
                 size = file_path.stat().st_size
                 print(f"  📄 {file_path.name} ({size:,} bytes)")
+        return build_file
 
 if __name__ == "__main__":
-    generator = ChromeEducationSlidesGenerator()
-    generator.run()
+    import argparse
 
+    parser = argparse.ArgumentParser(description="Chrome Education HTML 슬라이드 생성")
+    parser.add_argument("--trace", type=Path, default=None, metavar="TRACE_JSON",
+                        help="단계별 측정값을 Chrome trace-event 형식으로 저장 (chrome://tracing, Perfetto)")
+    args = parser.parse_args()
+    
+    generator = ChromeEducationSlidesGenerator()
+    generator.run(trace_file=args.trace)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Chrome Education HTML Minifier
+생성한 HTML 페이지를 한 번 훑어 공백, 주석, 인라인 <style>/<script>를 줄이는 최소화 도구
+
+- 공백: HTML 공백 문자(스페이스, 탭, 줄바꿈)만 하나로 합치므로 한글과 다른 문자는 바이트 그대로 유지
+- 블록 요소 사이의 공백뿐인 텍스트는 삭제, <pre>/<textarea> 내용은 그대로
+- 주석 삭제 (<!--[if ...]> 조건부 주석은 유지)
+- <style>: CSS 주석과 구두점 주변 공백 삭제, <script>: 줄 앞뒤 공백, 빈 줄, 한 줄 주석만 삭제
+"""
+
+import re
+import threading
+
+TOKEN_RE = re.compile(r"""
+    (?P<comment><!--.*?-->)
+  | (?P<raw>(?P<open><(?P<rawtag>pre|textarea|script|style)\b(?:"[^"]*"|'[^']*'|[^'">])*>)
+            (?P<body>.*?)(?P<close></(?P=rawtag)\s*>))
+  | (?P<tag><[a-zA-Z/!?](?:"[^"]*"|'[^']*'|[^'">])*>)
+  | (?P<text>[^<]+|<)
+""", re.DOTALL | re.IGNORECASE | re.VERBOSE)
+TAG_NAME_RE = re.compile(r"<[/]?([a-zA-Z0-9!?-]+)")
+TAG_SPACE_RE = re.compile(r"""("[^"]*"|'[^']*')|[ \t\n\r\f]+""")
+# HTML 공백 문자만 (str.split()과 달리 NBSP, 전각 공백 등은 건드리지 않음)
+WHITESPACE_RE = re.compile(r"[ \t\n\r\f]+")
+HTML_SPACE = " \t\n\r\f"
+CSS_TOKEN_RE = re.compile(r"""
+    (?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')
+  | (?P<comment>/\*.*?\*/[ \t\n\r\f]*)
+  | [ \t\n\r\f]*;[ \t\n\r\f]*(?=})
+  | [ \t\n\r\f]*(?P<punct>[{};,>])[ \t\n\r\f]*
+  | (?P<colon>:)[ \t\n\r\f]+
+  | [ \t\n\r\f]+
+""", re.DOTALL | re.VERBOSE)
+
+# 앞뒤 공백이 화면에 영향을 주지 않는 요소 (둘 사이의 공백뿐인 텍스트는 삭제)
+BLOCK_TAGS = frozenset("""
+    !doctype html head body meta link title style script base noscript
+    div p h1 h2 h3 h4 h5 h6 ul ol li dl dt dd section header footer nav main article aside
+    table thead tbody tfoot tr td th caption colgroup col form fieldset legend figure figcaption
+    blockquote pre hr br canvas svg iframe video audio source option select
+""".split())
+
+
+def tag_name(tag):
+    """태그 이름 (소문자, 조건부 주석 등은 None)"""
+    match = TAG_NAME_RE.match(tag)
+    return match.group(1).lower() if match else None
+
+
+def minify_tag(tag):
+    """태그 안의 속성 사이 공백을 하나로 (따옴표 안의 값은 그대로)"""
+    tag = TAG_SPACE_RE.sub(lambda match: match.group(1) or " ", tag)
+    return tag[:-2] + ">" if tag.endswith(" >") else tag
+
+
+def _css_token(match):
+    if match.group("string"):
+        return match.group("string")
+    if match.group("punct") or match.group("colon"):
+        return match.group("punct") or match.group("colon")
+    if match.group("comment") or ";" in match.group(0):
+        return ""
+    return " "
+
+
+def minify_css(css):
+    """CSS 주석과 { } ; , > 주변, : 뒤의 공백 삭제, 나머지 공백은 하나로 (문자열은 그대로)"""
+    return CSS_TOKEN_RE.sub(_css_token, css).strip(HTML_SPACE)
+
+
+def minify_js(script):
+    """줄 앞뒤 공백, 빈 줄, 한 줄 주석만 삭제
+
+    줄바꿈은 남기므로 자동 세미콜론 삽입에 영향이 없습니다. 여러 줄에 걸친 문자열
+    (템플릿 리터럴, 줄 끝 \\)이 있으면 내용이 바뀔 수 있으므로 그대로 둡니다.
+    """
+    if "`" in script or "\\\n" in script:
+        return script
+    lines = (line.strip(HTML_SPACE + "\v") for line in script.split("\n"))
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def _flush_text(buffer, previous, following):
+    """모아 둔 텍스트의 공백을 합치고, 블록 요소에 붙은 앞뒤 공백은 삭제"""
+    text = WHITESPACE_RE.sub(" ", "".join(buffer))
+    buffer.clear()
+    if previous is None or previous in BLOCK_TAGS:
+        text = text.lstrip(" ")
+    if following is None or following in BLOCK_TAGS:
+        text = text.rstrip(" ")
+    return text
+
+
+def iter_minified(html):
+    """HTML을 앞에서부터 한 번 훑으며 최소화한 조각을 차례로 반환"""
+    buffer = []
+    previous = None
+    for match in TOKEN_RE.finditer(html):
+        if match.group("text") is not None:
+            buffer.append(match.group("text"))
+            continue
+        token = match.group(0)
+        if match.group("comment") is not None:
+            if not token.startswith("<!--[if"):
+                # 주석 앞뒤 텍스트는 이어서 공백을 합침
+                continue
+            name, piece = "!--", token
+        elif match.group("raw") is not None:
+            name = match.group("rawtag").lower()
+            body = match.group("body")
+            if name == "style":
+                body = minify_css(body)
+            elif name == "script":
+                body = minify_js(body)
+            piece = (minify_tag(match.group("open")) if name not in ("pre", "textarea")
+                     else match.group("open")) + body + match.group("close")
+        else:
+            name, piece = tag_name(token), minify_tag(token)
+
+        if buffer:
+            text = _flush_text(buffer, previous, name)
+            if text:
+                yield text
+        yield piece
+        previous = name
+
+    if buffer:
+        text = _flush_text(buffer, previous, None)
+        if text:
+            yield text
+
+
+def minify_html(html):
+    """최소화한 HTML 문자열"""
+    return "".join(iter_minified(html))
+
+
+class HtmlMinifier:
+    """페이지를 최소화하고 파일별 크기 변화를 기록 (여러 빌드 스레드에서 함께 사용)"""
+
+    def __init__(self):
+        self.results = []
+        self._lock = threading.Lock()
+
+    def minify(self, name, html):
+        """name 페이지를 최소화한 HTML (크기 변화 기록)"""
+        minified = minify_html(html)
+        before, after = len(html.encode('utf-8')), len(minified.encode('utf-8'))
+        with self._lock:
+            self.results.append((name, before, after))
+        return minified
+
+    def summary(self):
+        """(파일 수, 최소화 전 바이트, 최소화 후 바이트)"""
+        with self._lock:
+            results = list(self.results)
+        return (len(results), sum(before for _, before, _ in results),
+                sum(after for _, _, after in results))
+
+    def print_report(self):
+        """파일별 절감량과 합계 출력"""
+        with self._lock:
+            results = sorted(self.results)
+        if not results:
+            return
+        count, before, after = self.summary()
+        print(f"🧹 HTML 최소화: {count}개 파일 {before:,} → {after:,} bytes ({percent(before, after)})")
+        for name, file_before, file_after in results:
+            print(f"  - {name}: {file_before:,} → {file_after:,} bytes ({percent(file_before, file_after)})")
+
+
+def percent(before, after):
+    """줄어든 비율 문자열"""
+    return f"-{(before - after) / before * 100:.1f}%" if before else "0%"
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Image Optimizer
+슬라이드 이미지를 실제 표시 크기에 맞춘 WebP/AVIF 변형으로 변환하고 srcset으로 연결
+"""
+
+import json
+import re
+from pathlib import Path
+
+from build_cache import DiskCache, content_key, file_digest
+
+# 슬라이드는 1280×720 .slide-container 안에 그려지며, 폭이 지정되지 않은(100%) 이미지는
+# 두 단 레이아웃의 한 칸(슬라이드 폭의 절반)을 차지합니다.
+SLIDE_WIDTH = 1280
+DEFAULT_DISPLAY_WIDTH = SLIDE_WIDTH // 2
+PIXEL_DENSITIES = (1, 2)
+
+# 형식별 인코딩 설정 (캐시 키에 포함되므로 바꾸면 다시 인코딩됨)
+ENCODINGS = {
+    "avif": {"quality": 55, "speed": 6},
+    "webp": {"quality": 80, "method": 4},
+}
+RESPONSIVE_MANIFEST = "responsive.json"
+
+IMG_TAG_RE = re.compile(r"<img\b[^>]*>", re.IGNORECASE | re.DOTALL)
+ATTR_RE = re.compile(r"""([\w:-]+)\s*=\s*("[^"]*"|'[^']*')""", re.DOTALL)
+STYLE_BLOCK_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.IGNORECASE | re.DOTALL)
+CLASS_RULE_RE = re.compile(r"\.([\w-]+)\s*\{([^}]*)\}")
+WIDTH_PX_RE = re.compile(r"(?<![\w-])width\s*:\s*(\d+)px")
+
+
+def parse_attributes(tag):
+    """태그 문자열에서 속성 사전 추출"""
+    return {name.lower(): value[1:-1] for name, value in ATTR_RE.findall(tag)}
+
+
+def image_name(src):
+    """img src를 slides/images 안의 파일명으로 정규화
+
+    일부 슬라이드는 작성 당시의 절대 경로(/home/.../images/x.png)를 참조하므로 파일명만 사용합니다.
+    """
+    if not src or "://" in src or src.startswith("data:"):
+        return None
+    if "/images/" not in f"/{src}":
+        return None
+    return src.rsplit("/", 1)[-1]
+
+
+def class_widths(html):
+    """페이지 <style>에서 클래스별 고정 폭(px) 추출"""
+    widths = {}
+    for block in STYLE_BLOCK_RE.findall(html):
+        for name, body in CLASS_RULE_RE.findall(block):
+            match = WIDTH_PX_RE.search(body)
+            if match:
+                widths[name] = int(match.group(1))
+    return widths
+
+
+def display_width(attrs, widths):
+    """img 태그가 페이지에서 차지하는 CSS 폭(px)"""
+    match = WIDTH_PX_RE.search(attrs.get("style", ""))
+    if match:
+        return int(match.group(1))
+    for name in attrs.get("class", "").split():
+        if name in widths:
+            return widths[name]
+    return DEFAULT_DISPLAY_WIDTH
+
+
+def collect_display_widths(html_files):
+    """모든 슬라이드에서 이미지별 표시 폭 집합 수집"""
+    usage = {}
+    for html_file in html_files:
+        html = Path(html_file).read_text(encoding='utf-8')
+        widths = class_widths(html)
+        for tag in IMG_TAG_RE.findall(html):
+            attrs = parse_attributes(tag)
+            name = image_name(attrs.get("src"))
+            if name:
+                usage.setdefault(name, set()).add(display_width(attrs, widths))
+    return usage
+
+
+def available_formats():
+    """설치된 Pillow가 인코딩할 수 있는 형식 (선호 순서)"""
+    from PIL import features
+
+    return [fmt for fmt in ENCODINGS if features.check(fmt)]
+
+
+class ImageOptimizer:
+    """이미지별 반응형 변형을 만들고 콘텐츠 해시로 캐시하는 변환기"""
+
+    def __init__(self, images_dir, output_dir, cache_dir=None):
+        import PIL
+
+        self.images_dir = Path(images_dir)
+        self.output_dir = Path(output_dir)
+        self.cache = DiskCache("images", cache_dir)
+        self.formats = available_formats()
+        self.pil_version = PIL.__version__
+
+    def target_widths(self, source_width, display_widths):
+        """표시 폭 × 화면 밀도에 해당하는 폭 목록 (원본보다 크게 만들지 않음)"""
+        widths = {min(source_width, width * density)
+                  for width in display_widths for density in PIXEL_DENSITIES}
+        return sorted(widths)
+
+    def encode(self, image, width, fmt):
+        """지정한 폭과 형식으로 이미지 인코딩"""
+        from io import BytesIO
+
+        from PIL import Image
+
+        if image.width != width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+        buffer = BytesIO()
+        image.save(buffer, format=fmt.upper(), **ENCODINGS[fmt])
+        return buffer.getvalue()
+
+    def optimize(self, name, display_widths):
+        """이미지 하나의 변형을 생성 (캐시에 있으면 재사용)"""
+        from PIL import Image, ImageOps
+
+        source = self.images_dir / name
+        source_digest = file_digest(source)
+        image = None
+        with Image.open(source) as opened:
+            source_width = opened.width
+        variants = []
+        for width in self.target_widths(source_width, display_widths):
+            for fmt in self.formats:
+                key = content_key(source_digest, str(width), fmt,
+                                  json.dumps(ENCODINGS[fmt], sort_keys=True), self.pil_version)
+                data = self.cache.get(key, f".{fmt}")
+                if data is None:
+                    if image is None:
+                        # exif_transpose는 읽어 들인 사본을 반환하므로 원본 파일은 바로 닫음
+                        with Image.open(source) as opened:
+                            image = ImageOps.exif_transpose(opened)
+                        if image.mode not in ("RGB", "RGBA"):
+                            image = image.convert("RGBA")
+                    data = self.encode(image, width, fmt)
+                    self.cache.put(key, data, f".{fmt}")
+                filename = f"{Path(name).stem}.{key[:10]}.{width}w.{fmt}"
+                variants.append({"width": width, "format": fmt, "file": filename, "bytes": len(data)})
+                target = self.output_dir / filename
+                if not target.exists() or target.stat().st_size != len(data):
+                    target.write_bytes(data)
+        return {"original_bytes": source.stat().st_size, "variants": variants}
+
+    def build(self, usage):
+        """사용 중인 모든 이미지의 변형과 responsive.json 생성"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        manifest = {}
+        for name in sorted(usage):
+            if (self.images_dir / name).is_file():
+                manifest[name] = self.optimize(name, usage[name])
+
+        # 내용이 같으면 다시 쓰지 않음 (슬라이드 페이지 노드의 입력이므로 수정 시각 유지)
+        manifest_file = self.output_dir / RESPONSIVE_MANIFEST
+        data = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True)
+        if not manifest_file.is_file() or manifest_file.read_text(encoding='utf-8') != data:
+            manifest_file.write_text(data, encoding='utf-8')
+
+        outputs = [manifest_file]
+        for name, entry in manifest.items():
+            outputs.extend(self.output_dir / variant["file"] for variant in entry["variants"])
+            smallest = min(variant["bytes"] for variant in entry["variants"])
+            print(f"  🖼️  {name}: {entry['original_bytes']:,} → {smallest:,} bytes (최소 변형)")
+        return outputs
+
+
+def load_responsive_manifest(assets_images_dir):
+    """responsive.json 로드 (이미지 최적화 단계가 실행되지 않았으면 빈 사전)"""
+    try:
+        with open(Path(assets_images_dir) / RESPONSIVE_MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _srcset(entry, fmt, base_url):
+    return ", ".join(f"{base_url}/{variant['file']} {variant['width']}w"
+                     for variant in entry["variants"] if variant["format"] == fmt)
+
+
+def rewrite_images(html, manifest, base_url="assets/images", available=None):
+    """img 태그의 src를 images/<파일명>으로 정리하고 최적화된 변형을 srcset으로 연결
+
+    AVIF 변형이 있으면 <picture style="display: contents">로 감싸 레이아웃은 그대로 둡니다.
+    available: 원본 이미지 파일명 집합 (정리한 src가 실제로 존재하는지 확인용)
+    """
+    widths = class_widths(html)
+
+    def replace(match):
+        tag = match.group(0)
+        attrs = parse_attributes(tag)
+        src = attrs.get("src")
+        name = image_name(src)
+        if not name or (available is not None and name not in available):
+            return tag
+
+        local_src = f"images/{name}"
+        if src != local_src:
+            tag = tag.replace(f'"{src}"', f'"{local_src}"', 1).replace(f"'{src}'", f"'{local_src}'", 1)
+
+        entry = manifest.get(name)
+        if not entry or "srcset" in attrs:
+            return tag
+
+        sizes = f"{display_width(attrs, widths)}px"
+        webp = _srcset(entry, "webp", base_url)
+        if webp:
+            closing = " />" if tag.endswith("/>") else ">"
+            body = tag[:-len(closing.strip())].rstrip()
+            tag = f'{body} srcset="{webp}" sizes="{sizes}"{closing}'
+
+        avif = _srcset(entry, "avif", base_url)
+        if avif:
+            tag = (f'<picture style="display: contents">'
+                   f'<source type="image/avif" srcset="{avif}" sizes="{sizes}">{tag}</picture>')
+        return tag
+
+    return IMG_TAG_RE.sub(replace, html)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Page Templates
+한 번 나눠 둔(미리 컴파일한) HTML 틀과 인덱스 페이지 나누기 도구
+
+틀은 모듈을 불러올 때 한 번만 리터럴 조각과 필드로 나누고, 렌더링할 때는 값만 끼워
+한 번의 join으로 문자열을 만듭니다. 카드가 수천 개여도 문자열 이어 붙이기가 반복되지 않습니다.
+"""
+
+import string
+
+# 첫 페이지(index.html)와 나눈 페이지마다 넣을 카드 수
+INDEX_PAGE_SIZE = 60
+# 페이지 이동 막대에서 현재 페이지 앞뒤로 보여 줄 페이지 수
+PAGER_WINDOW = 2
+
+
+class CompiledTemplate:
+    """str.format 형식({name}, 중괄호는 {{ }})의 틀
+
+    필드는 이름만 지원하며(형식 지정자 없음) render()는 조각 목록을 복사해 값을 채운 뒤 join합니다.
+    """
+
+    def __init__(self, source):
+        self.pieces = []
+        self.slots = []
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            if literal:
+                self.pieces.append(literal)
+            if field is None:
+                continue
+            if not field.isidentifier() or spec or conversion:
+                raise ValueError(f"지원하지 않는 틀 필드: {{{field}}}")
+            self.slots.append((len(self.pieces), field))
+            self.pieces.append("")
+        self.fields = {field for _, field in self.slots}
+
+    def render(self, values):
+        """values(사전)의 값을 채운 문자열"""
+        pieces = self.pieces[:]
+        for index, field in self.slots:
+            pieces[index] = str(values[field])
+        return "".join(pieces)
+
+
+def paginate(items, page_size):
+    """page_size개씩 나눈 목록 (항목이 없어도 빈 페이지 하나)"""
+    if page_size is None or page_size <= 0:
+        return [list(items)]
+    pages = [items[start:start + page_size] for start in range(0, len(items), page_size)]
+    return pages or [[]]
+
+
+def page_name(stem, number):
+    """페이지 파일 이름 (1쪽은 stem.html, 이후는 stem_002.html ...)"""
+    return f"{stem}.html" if number == 1 else f"{stem}_{number:03d}.html"
+
+
+def page_ranges(total, page_size, pages):
+    """페이지별 (첫 번호, 마지막 번호) 목록 (1부터)"""
+    return [(start + 1, min(start + page_size, total))
+            for start in range(0, page_size * pages, page_size)]
+
+
+LAZY_SECTION = CompiledTemplate('''        <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6 mb-12" data-cards-src="{href}">
+            <a href="{href}" class="col-span-full text-center text-blue-600 hover:underline py-4">
+                슬라이드 {first}–{last} 보기
+            </a>
+        </div>
+''')
+
+PAGER_LINK = CompiledTemplate('''            <a href="{href}" class="px-3 py-1 rounded {style}">{label}</a>
+''')
+PAGER_CURRENT = "bg-blue-500 text-white"
+PAGER_OTHER = "bg-white text-blue-600 shadow hover:bg-blue-50"
+
+# 첫 페이지의 뒤쪽 카드 묶음을 화면 가까이 왔을 때 해당 페이지에서 가져와 채우는 스크립트
+LAZY_SCRIPT = '''    <script>
+        (function () {
+            if (!('IntersectionObserver' in window) || !window.fetch || !window.DOMParser) return;
+            const observer = new IntersectionObserver(entries => {
+                entries.forEach(entry => {
+                    if (!entry.isIntersecting) return;
+                    const section = entry.target;
+                    observer.unobserve(section);
+                    fetch(section.dataset.cardsSrc)
+                        .then(response => response.text())
+                        .then(text => {
+                            const page = new DOMParser().parseFromString(text, 'text/html');
+                            const cards = page.getElementById('slide-cards');
+                            if (cards) section.innerHTML = cards.innerHTML;
+                        })
+                        .catch(() => {});  // 가져오지 못하면 페이지 링크를 그대로 둠
+                });
+            }, { rootMargin: '600px' });
+            document.querySelectorAll('[data-cards-src]').forEach(section => observer.observe(section));
+        })();
+    </script>
+'''
+
+
+def lazy_sections_html(names, ranges):
+    """첫 페이지에 넣을 뒤쪽 페이지 카드 묶음 자리 (스크립트가 없으면 페이지 링크로 동작)"""
+    return "".join(LAZY_SECTION.render({"href": name, "first": first, "last": last})
+                   for name, (first, last) in zip(names, ranges))
+
+
+def pager_html(names, current):
+    """처음/끝과 현재 페이지 주변만 보여 주는 페이지 이동 막대 (페이지 수와 무관한 크기)"""
+    count = len(names)
+    shown = sorted({1, count} | set(range(max(1, current - PAGER_WINDOW),
+                                         min(count, current + PAGER_WINDOW) + 1)))
+    parts = ['        <nav class="flex flex-wrap justify-center items-center gap-2 mb-12">\n']
+    if current > 1:
+        parts.append(PAGER_LINK.render({"href": names[current - 2], "style": PAGER_OTHER, "label": "이전"}))
+    previous = 0
+    for number in shown:
+        if number - previous > 1:
+            parts.append('            <span class="text-gray-500">…</span>\n')
+        style = PAGER_CURRENT if number == current else PAGER_OTHER
+        parts.append(PAGER_LINK.render({"href": names[number - 1], "style": style, "label": number}))
+        previous = number
+    if current < count:
+        parts.append(PAGER_LINK.render({"href": names[current], "style": PAGER_OTHER, "label": "다음"}))
+    parts.append('        </nav>\n')
+    return "".join(parts)
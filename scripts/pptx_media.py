@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Chrome Education PPTX Media
+슬라이드 이미지를 PPTX 슬라이드에서 차지하는 크기로 한 번만 줄여 두는 미디어 준비 도구
+
+- 크기: 1280px 슬라이드 = 13.33in이므로 CSS px ÷ 96 = 인치, 차지하는 인치 × PICTURE_PPI 픽셀로 축소
+- 한 덱 안에서 같은 이미지는 가장 크게 쓰인 크기로 한 번만 만들어 모든 슬라이드가 같은 바이트를
+  쓰므로, python-pptx가 내용 해시로 하나의 미디어 파트(ppt/media/imageN)에 저장
+- 디코딩한 원본과 축소 결과는 프로세스 안에 보관하므로 일괄 생성(변형 덱)에서 덱마다 다시 만들지 않음
+"""
+
+import math
+from io import BytesIO
+from pathlib import Path
+
+from optimize_images import SLIDE_WIDTH, image_name
+
+# 16:9 슬라이드 크기 (13.333in × 7.5in, HTML 슬라이드 1280×720과 같은 비율)
+EMU_PER_INCH = 914400
+SLIDE_WIDTH_EMU = 12192000
+SLIDE_HEIGHT_EMU = 6858000
+EMU_PER_PX = SLIDE_WIDTH_EMU // SLIDE_WIDTH
+# 슬라이드에 넣는 그림의 해상도 (PowerPoint 그림 압축 기본값과 같은 220ppi)
+PICTURE_PPI = 220
+JPEG_QUALITY = 85
+# 이 폭(CSS px) 이하의 이미지는 로고/아이콘으로 보고 제목 옆에 배치
+ICON_MAX_WIDTH = 200
+# 그림 배치 여백 (EMU)
+PICTURE_GAP = EMU_PER_INCH * 3 // 10
+TOP_MARGIN = EMU_PER_INCH * 4 // 10
+# PowerPoint가 그대로 넣을 수 있는 형식 (그 밖의 형식은 PNG/JPEG로 변환)
+EMBEDDABLE_FORMATS = ("PNG", "JPEG")
+
+# 디코딩한 원본 {(경로, 수정 시각, 크기): (PIL 이미지, 원본 형식)}과 축소 결과 {(원본 키, 폭): 바이트}
+_decoded = {}
+_scaled = {}
+
+
+def slide_pictures(spec, images_dir):
+    """슬라이드 IR의 이미지 중 slides/images에 있는 파일 목록 [{path, width(px), alt}]"""
+    pictures = []
+    for image in spec.get("ir", {}).get("images", []):
+        name = image_name(image["src"])
+        path = Path(images_dir) / name if name else None
+        if path is not None and path.is_file():
+            pictures.append({"path": path, "width": image.get("width", ICON_MAX_WIDTH),
+                             "alt": image["alt"]})
+    return pictures
+
+
+def source_key(path):
+    stat = Path(path).stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def decode(path):
+    """원본 이미지를 한 번만 디코딩 (EXIF 회전 적용) → (PIL 이미지, 원본 형식)"""
+    key = source_key(path)
+    if key not in _decoded:
+        from PIL import Image, ImageOps
+
+        with Image.open(path) as opened:
+            source_format = opened.format
+            image = ImageOps.exif_transpose(opened)
+            image.load()
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        _decoded[key] = (image, source_format)
+    return _decoded[key]
+
+
+def image_size(path):
+    """원본 이미지의 (폭, 높이) 픽셀"""
+    return decode(path)[0].size
+
+
+def target_pixels(width_emu, source_width):
+    """슬라이드에서 width_emu를 차지할 때 필요한 픽셀 폭 (원본보다 크게 만들지 않음)"""
+    return min(source_width, math.ceil(width_emu / EMU_PER_INCH * PICTURE_PPI))
+
+
+def scaled_picture(path, width):
+    """폭 width 픽셀로 줄인 그림 바이트 (투명도가 있으면 PNG, 없으면 JPEG)
+
+    원본이 PNG/JPEG이고 이미 그 폭 이하이거나 다시 인코딩해도 작아지지 않으면 원본 바이트를 그대로 씁니다.
+    """
+    key = (source_key(path), width)
+    if key in _scaled:
+        return _scaled[key]
+
+    from PIL import Image
+
+    image, source_format = decode(path)
+    original = Path(path).read_bytes() if source_format in EMBEDDABLE_FORMATS else None
+    if original is not None and image.width <= width:
+        data = original
+    else:
+        if image.width > width:
+            image = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+        buffer = BytesIO()
+        if image.mode == "RGBA" and image.getextrema()[3][0] < 255:
+            image.save(buffer, format="PNG", optimize=True)
+        else:
+            image.convert("RGB").save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+        data = buffer.getvalue()
+        if original is not None and len(original) <= len(data):
+            data = original
+    _scaled[key] = data
+    return data
+
+
+def fit(path, max_width, max_height):
+    """원본 비율을 유지하며 max_width × max_height(EMU) 안에 들어가는 (폭, 높이)"""
+    source_width, source_height = image_size(path)
+    scale = min(max_width / source_width, max_height / source_height)
+    return int(source_width * scale), int(source_height * scale)
+
+
+def deck_media(placements):
+    """덱 전체의 그림 배치 목록으로 이미지마다 한 번만 축소한 바이트 {경로: 바이트}
+
+    같은 이미지가 여러 크기로 쓰이면 가장 큰 배치에 맞춰 하나만 만들고 모든 슬라이드가 공유합니다.
+    """
+    widest = {}
+    for placement in placements:
+        path = placement["path"]
+        widest[path] = max(widest.get(path, 0), placement["width"])
+    return {path: scaled_picture(path, target_pixels(width, image_size(path)[0]))
+            for path, width in widest.items()}
+
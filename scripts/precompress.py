@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Precompressor
+output/의 압축할 만한 파일마다 .gz, .br 형제 파일을 미리 만들어 두는 마지막 빌드 단계
+
+웹 서버(nginx gzip_static/brotli_static 등)나 교실용 미러가 요청마다 압축하지 않고
+미리 만든 파일을 그대로 보낼 수 있습니다. 압축 결과는 원본 해시로 캐시합니다.
+"""
+
+import gzip
+import importlib.util
+import json
+import threading
+from collections import Counter
+from pathlib import Path
+
+from build_cache import DiskCache, content_key
+
+# 이미지, 글꼴, PDF, PPTX, .gz 파일은 이미 압축되어 있으므로 제외
+COMPRESSIBLE_SUFFIXES = (".html", ".css", ".js", ".json", ".md", ".svg", ".txt", ".xml")
+# 형식별 설정 (캐시 키에 포함되므로 바꾸면 다시 압축됨)
+ENCODINGS = {
+    "gzip": {"suffix": ".gz", "level": 9},
+    "br": {"suffix": ".br", "quality": 11},
+}
+# 마지막에 따로 압축하는 파일 (다른 파일의 압축 크기를 기록한 뒤)
+BUILD_INFO = "build_info.json"
+SIBLINGS_FILE = "siblings.json"
+
+
+def available_encodings():
+    """사용할 수 있는 압축 형식 (brotli 모듈이 없으면 gzip만)"""
+    if importlib.util.find_spec("brotli") is None:
+        return ["gzip"]
+    return list(ENCODINGS)
+
+
+def compress(data, encoding):
+    """같은 입력이면 같은 바이트를 내는 압축 (gzip 헤더의 시각은 0)"""
+    options = ENCODINGS[encoding]
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=options["level"], mtime=0)
+    import brotli
+
+    return brotli.compress(data, quality=options["quality"])
+
+
+class Precompressor:
+    """output 디렉토리의 파일을 병렬로 미리 압축
+
+    zlib과 brotli는 압축하는 동안 GIL을 놓으므로 스레드 풀로 여러 코어를 사용합니다.
+    압축해도 작아지지 않는 형식은 형제 파일을 만들지 않으며(있으면 삭제), 지난 실행에서
+    만든 형제 파일 중 원본이 사라진 것도 삭제합니다.
+    """
+
+    def __init__(self, output_dir, cache_dir=None, jobs=1, encodings=None):
+        self.output_dir = Path(output_dir)
+        self.cache = DiskCache("precompress", cache_dir)
+        self.jobs = max(1, jobs or 1)
+        self.encodings = list(encodings or available_encodings())
+        self.stats = Counter()
+        self.sizes = {}
+        self.siblings = []
+        self._lock = threading.Lock()
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def candidates(self):
+        """압축할 파일 목록 (build_info.json 제외)"""
+        return sorted(path for path in self.output_dir.rglob("*")
+                      if path.is_file() and path.suffix in COMPRESSIBLE_SUFFIXES
+                      and path.name != BUILD_INFO)
+
+    def compressed(self, data, encoding):
+        """압축 결과 (원본 해시 + 형식 설정이 같으면 캐시 사용)"""
+        key = content_key(encoding, json.dumps(ENCODINGS[encoding], sort_keys=True), data)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.count("cached")
+            return cached
+        result = compress(data, encoding)
+        self.cache.put(key, result)
+        self.count("compressed")
+        return result
+
+    def compress_file(self, path):
+        """파일 하나의 형제 파일 생성 → (원본/형식별 크기 사전, 만든 형제 파일 목록)"""
+        data = path.read_bytes()
+        sizes = {"size": len(data)}
+        siblings = []
+        for encoding in self.encodings:
+            sibling = path.with_name(path.name + ENCODINGS[encoding]["suffix"])
+            result = self.compressed(data, encoding)
+            if len(result) >= len(data):
+                sibling.unlink(missing_ok=True)
+                sizes[encoding] = None
+                self.count("not_smaller")
+                continue
+            try:
+                unchanged = sibling.stat().st_size == len(result) and sibling.read_bytes() == result
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                sibling.write_bytes(result)
+                self.count("written")
+            sizes[encoding] = len(result)
+            siblings.append(sibling)
+        return sizes, siblings
+
+    def compress_files(self, files):
+        """파일 목록을 병렬로 압축 → {상대 경로: 크기 사전}, 만든 형제 파일 목록"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        files = list(files)
+        sizes, siblings = {}, []
+        with ThreadPoolExecutor(max_workers=min(self.jobs, max(1, len(files)))) as pool:
+            for path, (file_sizes, file_siblings) in zip(files, pool.map(self.compress_file, files)):
+                sizes[path.relative_to(self.output_dir).as_posix()] = file_sizes
+                siblings.extend(file_siblings)
+        return sizes, siblings
+
+    def remove_stale(self, siblings):
+        """지난 실행에서 만들었지만 이번에는 만들지 않은 형제 파일 삭제"""
+        record = self.cache.directory / SIBLINGS_FILE
+        current = sorted(path.relative_to(self.output_dir).as_posix() for path in siblings)
+        try:
+            previous = json.loads(record.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            previous = []
+        for name in set(previous) - set(current):
+            (self.output_dir / name).unlink(missing_ok=True)
+            self.count("removed")
+        record.parent.mkdir(parents=True, exist_ok=True)
+        record.write_text(json.dumps(current, ensure_ascii=False), encoding='utf-8')
+
+    def summary(self, sizes):
+        """build_info.json에 넣을 압축 결과 (파일별 크기와 형식별 합계)"""
+        totals = {"size": sum(item["size"] for item in sizes.values())}
+        for encoding in self.encodings:
+            # 압축하지 않은 파일은 원본 크기 그대로 전송되는 것으로 계산
+            totals[encoding] = sum(item[encoding] or item["size"] for item in sizes.values())
+        return {"encodings": self.encodings, "total": totals, "files": sizes}
+
+    def compress_outputs(self):
+        """build_info.json을 뺀 모든 파일 압축 (압축 크기 기록은 finish()에서)"""
+        self.sizes, self.siblings = self.compress_files(self.candidates())
+        return self.summary(self.sizes)
+
+    def finish(self):
+        """압축 크기를 build_info.json에 기록하고 build_info.json도 압축한 뒤 남은 형제 파일 정리"""
+        siblings = list(self.siblings)
+        build_info_file = self.output_dir / BUILD_INFO
+        if build_info_file.exists():
+            with open(build_info_file, 'r', encoding='utf-8') as f:
+                build_info = json.load(f)
+            build_info["compressed"] = self.summary(self.sizes)
+            with open(build_info_file, 'w', encoding='utf-8') as f:
+                json.dump(build_info, f, ensure_ascii=False, indent=2)
+            siblings.extend(self.compress_file(build_info_file)[1])
+        self.remove_stale(siblings)
+        return build_info_file
+
+    def build(self):
+        """모든 파일을 압축하고 압축 크기를 build_info.json에 기록"""
+        summary = self.compress_outputs()
+        self.finish()
+        return summary
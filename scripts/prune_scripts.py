@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Script Pruner
+슬라이드에서 쓰지 않는 외부 라이브러리(d3, Chart.js) 스크립트를 제거하고 나머지는 defer로 로드
+"""
+
+import re
+
+# 라이브러리별 CDN 주소, 사용 여부를 판단할 코드 패턴, 대략적인 파일 크기 (압축 전, bytes)
+SCRIPT_LIBRARIES = {
+    "d3": {
+        "src": re.compile(r"^https://d3js\.org/d3(?:\.v\d+)?(?:\.min)?\.js$"),
+        "usage": re.compile(r"\bd3\s*\."),
+        "bytes": 280_000,
+    },
+    "chart.js": {
+        "src": re.compile(r"^https://cdn\.jsdelivr\.net/npm/chart\.js(?:@[^/]+)?(?:/.*)?$"),
+        "usage": re.compile(r"\bnew\s+Chart\s*\(|\bChart\s*\."),
+        "bytes": 205_000,
+    },
+}
+
+EXTERNAL_SCRIPT_RE = re.compile(
+    r"""[ \t]*<script\b([^>]*?)\bsrc\s*=\s*["']([^"']+)["']([^>]*)>\s*</script>[ \t]*\n?""",
+    re.IGNORECASE,
+)
+INLINE_SCRIPT_RE = re.compile(r"<script\b(?![^>]*\bsrc\s*=)[^>]*>(.*?)</script>",
+                              re.IGNORECASE | re.DOTALL)
+EVENT_ATTR_RE = re.compile(r"""\bon\w+\s*=\s*("[^"]*"|'[^']*')""", re.IGNORECASE)
+# DOMContentLoaded/load 핸들러 함수의 여는 중괄호까지 (핸들러를 이름으로 넘기면 본문을 알 수 없으므로 제외)
+DEFERRED_HANDLER_RE = re.compile(r"""
+    (?:\b(?:window|document)\.addEventListener\(\s*(["'])(?:DOMContentLoaded|load)\1\s*,\s*
+     | \bwindow\.onload\s*=\s*)
+    (?:async\s+)?(?:function\b[^(]*\([^)]*\)|\([^)]*\)\s*=>|[\w$]+\s*=>)\s*\{
+""", re.VERBOSE)
+
+
+def library_for(src):
+    """스크립트 주소에 해당하는 라이브러리 이름 (알 수 없으면 None)"""
+    for name, library in SCRIPT_LIBRARIES.items():
+        if library["src"].match(src):
+            return name
+    return None
+
+
+def _block_end(code, start):
+    """start의 '{'와 짝이 맞는 '}' 다음 위치 (문자열, 주석 안의 괄호는 무시, 짝이 없으면 None)"""
+    depth, i = 0, start
+    while i < len(code):
+        ch = code[i]
+        if ch in "\"'`":
+            i += 1
+            while i < len(code) and code[i] != ch:
+                i += 2 if code[i] == "\\" else 1
+        elif code.startswith("//", i):
+            i = code.find("\n", i)
+            if i < 0:
+                return None
+        elif code.startswith("/*", i):
+            i = code.find("*/", i + 2)
+            if i < 0:
+                return None
+            i += 1
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return None
+
+
+def deferred_ranges(code):
+    """DOMContentLoaded/load 핸들러 본문의 (시작, 끝) 위치 목록"""
+    ranges = []
+    for match in DEFERRED_HANDLER_RE.finditer(code):
+        end = _block_end(code, match.end() - 1)
+        if end is not None:
+            ranges.append((match.end() - 1, end))
+    return ranges
+
+
+def _inside(position, ranges):
+    """position이 ranges 중 하나에 들어 있으면 True"""
+    return any(start <= position < end for start, end in ranges)
+
+
+def library_usage(html):
+    """페이지 코드에서 라이브러리별 사용 여부와 defer 가능 여부
+
+    반환값: {이름: "unused" | "deferred" | "sync"}
+    인라인 스크립트의 라이브러리 사용이 모두 DOMContentLoaded/load 핸들러 본문 안에 있을 때만
+    defer로 옮겨도 안전합니다. 하나라도 본문 밖(최상위 코드, 핸들러 밖의 함수 등)에 있으면 그대로
+    동기 로드합니다.
+    """
+    scripts = INLINE_SCRIPT_RE.findall(html)
+    handlers = [value[1:-1] for value in EVENT_ATTR_RE.findall(html)]
+    usage = {}
+    for name, library in SCRIPT_LIBRARIES.items():
+        using = [code for code in scripts if library["usage"].search(code)]
+        if not using and not any(library["usage"].search(code) for code in handlers):
+            usage[name] = "unused"
+        elif all(_inside(match.start(), deferred_ranges(code))
+                 for code in using for match in library["usage"].finditer(code)):
+            # 이벤트 핸들러는 사용자 입력 시점에 실행되므로 defer와 무관
+            usage[name] = "deferred"
+        else:
+            usage[name] = "sync"
+    return usage
+
+
+def prune_scripts(html):
+    """쓰지 않는 라이브러리 스크립트를 제거하고 나머지는 defer로 변경
+
+    반환값: (변경된 html, {"removed": [...], "deferred": [...], "bytes": 제거된 크기 추정치})
+    이 페이지가 모르는 외부 스크립트를 함께 불러오면 그 스크립트가 라이브러리를 쓸 수 있으므로
+    페이지를 그대로 둡니다.
+    """
+    report = {"removed": [], "deferred": [], "bytes": 0}
+    tags = EXTERNAL_SCRIPT_RE.findall(html)
+    if not tags or any(library_for(src) is None for _, src, _ in tags):
+        return html, report
+    usage = library_usage(html)
+
+    def replace(match):
+        before, src, after = match.group(1), match.group(2), match.group(3)
+        name = library_for(src)
+        state = usage[name]
+        if state == "unused":
+            report["removed"].append(name)
+            report["bytes"] += SCRIPT_LIBRARIES[name]["bytes"]
+            return ""
+        tag = match.group(0)
+        if state == "deferred" and not re.search(r"\b(?:defer|async)\b", before + after):
+            report["deferred"].append(name)
+            end = match.end(3) - match.start(0)
+            return f"{tag[:end]} defer{tag[end:]}"
+        return tag
+
+    return EXTERNAL_SCRIPT_RE.sub(replace, html), report
+
+
+def format_report(report):
+    """정리 결과 한 줄 요약 (변경이 없으면 빈 문자열)"""
+    parts = []
+    if report["removed"]:
+        parts.append(f"{', '.join(report['removed'])} 제거 (약 {report['bytes'] // 1000:,}KB)")
+    if report["deferred"]:
+        parts.append(f"{', '.join(report['deferred'])} defer")
+    if not parts:
+        return ""
+    blocking = len(report["removed"]) + len(report["deferred"])
+    return f"{', '.join(parts)} → 렌더링 차단 요청 {blocking}개 감소"
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Chrome Education CSS Purger
+생성된 HTML에서 실제로 쓰인 Tailwind 클래스만 남긴 자체 호스팅 CSS 생성
+"""
+
+import re
+import urllib.request
+from pathlib import Path
+
+from build_cache import default_cache_dir
+
+TAILWIND_VERSION = "2.2.19"
+TAILWIND_URL = f"https://cdn.jsdelivr.net/npm/tailwindcss@{TAILWIND_VERSION}/dist/tailwind.min.css"
+SITE_CSS = "assets/site.css"
+
+CLASS_ATTR_RE = re.compile(r"""\bclass\s*=\s*("[^"]*"|'[^']*')""", re.IGNORECASE)
+SELECTOR_CLASS_RE = re.compile(r"\.((?:\\[0-9a-fA-F]{1,6}\s?|\\.|[\w-])+)")
+CSS_ESCAPE_RE = re.compile(r"\\([0-9a-fA-F]{1,6}\s?|.)")
+HEX_RE = re.compile(r"[0-9a-fA-F]{1,6}")
+KEYFRAMES_RE = re.compile(r"@(?:-webkit-)?keyframes\s+([\w-]+)")
+TAILWIND_LINK_RE = re.compile(
+    r"""(<link\b[^>]*?\bhref\s*=\s*["'])https://cdn\.jsdelivr\.net/npm/tailwindcss@[^"']+(["'][^>]*>)""",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def load_vendor_css(cache_dir=None, timeout=20):
+    """Tailwind CSS를 한 번만 내려받아 빌드 캐시에 보관 (오프라인이고 캐시도 없으면 None)"""
+    vendor_file = Path(cache_dir or default_cache_dir()) / "vendor" / f"tailwind-{TAILWIND_VERSION}.min.css"
+    if vendor_file.is_file():
+        return vendor_file.read_text(encoding='utf-8')
+    try:
+        with urllib.request.urlopen(TAILWIND_URL, timeout=timeout) as response:
+            css = response.read().decode('utf-8')
+    except (OSError, ValueError):
+        return None
+    vendor_file.parent.mkdir(parents=True, exist_ok=True)
+    vendor_file.write_text(css, encoding='utf-8')
+    return css
+
+
+def collect_classes(html_files):
+    """HTML 파일들의 class 속성에 쓰인 클래스 이름 집합"""
+    classes = set()
+    for html_file in html_files:
+        html = Path(html_file).read_text(encoding='utf-8')
+        for value in CLASS_ATTR_RE.findall(html):
+            classes.update(value[1:-1].split())
+    return classes
+
+
+def _unescape(name):
+    """CSS 이스케이프(\\:, \\/, \\32 등)를 풀어 HTML class 이름으로 변환"""
+    def replace(match):
+        value = match.group(1)
+        if HEX_RE.fullmatch(value.strip()):
+            return chr(int(value.strip(), 16))
+        return value
+    return CSS_ESCAPE_RE.sub(replace, name)
+
+
+def _skip_string(css, i):
+    """따옴표 문자열 끝 다음 위치"""
+    quote = css[i]
+    i += 1
+    while i < len(css) and css[i] != quote:
+        i += 2 if css[i] == "\\" else 1
+    return i + 1
+
+
+def parse_blocks(css):
+    """CSS를 (prelude, body) 목록으로 분리. body가 None이면 ';'로 끝나는 at-rule"""
+    blocks = []
+    i, start, depth, length = 0, 0, 0, len(css)
+    prelude = None
+    while i < length:
+        ch = css[i]
+        if ch == "\\":
+            # 이스케이프한 문자(\{, \" 등)는 구문으로 보지 않음
+            i += 2
+            continue
+        if ch in "\"'":
+            i = _skip_string(css, i)
+            continue
+        if ch == "/" and css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            i = length if end < 0 else end + 2
+            if depth == 0:
+                start = i
+            continue
+        if ch == "{":
+            if depth == 0:
+                prelude = css[start:i].strip()
+                start = i + 1
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[start:i]))
+                start = i + 1
+        elif ch == ";" and depth == 0:
+            blocks.append((css[start:i].strip(), None))
+            start = i + 1
+        i += 1
+    return blocks
+
+
+def selector_used(selector, used):
+    """선택자에 쓰인 클래스가 모두 사용 중이면 True (클래스 없는 기본 선택자 포함)"""
+    return all(_unescape(name) in used for name in SELECTOR_CLASS_RE.findall(selector))
+
+
+def purge_blocks(blocks, used):
+    """사용하지 않는 규칙을 제거한 CSS 문자열"""
+    parts = []
+    for prelude, body in blocks:
+        if body is None:
+            parts.append(f"{prelude};")
+        elif prelude.startswith("@media") or prelude.startswith("@supports"):
+            inner = purge_blocks(parse_blocks(body), used)
+            if inner:
+                parts.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            # @keyframes/@font-face 등은 그대로 두고 keyframes는 아래에서 정리
+            parts.append(f"{prelude}{{{body}}}")
+        else:
+            selectors = [sel for sel in _split_selectors(prelude) if selector_used(sel, used)]
+            if selectors:
+                parts.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(parts)
+
+
+def _split_selectors(prelude):
+    """괄호 안의 쉼표(:not(a,b) 등)는 무시하고 선택자 목록 분리"""
+    selectors, depth, start = [], 0, 0
+    for i, ch in enumerate(prelude):
+        if ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+    selectors.append(prelude[start:].strip())
+    return [sel for sel in selectors if sel]
+
+
+def drop_unused_keyframes(css):
+    """남은 규칙에서 참조하지 않는 @keyframes 제거"""
+    blocks = parse_blocks(css)
+    names = {match for prelude, _ in blocks if prelude for match in KEYFRAMES_RE.findall(prelude)}
+    referenced = set()
+    for prelude, body in blocks:
+        if body is not None and not KEYFRAMES_RE.match(prelude or ""):
+            referenced.update(name for name in names if name in body)
+    kept = []
+    for prelude, body in blocks:
+        match = KEYFRAMES_RE.match(prelude or "")
+        if match and match.group(1) not in referenced:
+            continue
+        kept.append(f"{prelude};" if body is None else f"{prelude}{{{body}}}")
+    return "".join(kept)
+
+
+def purge_css(css, used):
+    """사용 중인 클래스만 남긴 CSS"""
+    return drop_unused_keyframes(purge_blocks(parse_blocks(css), used))
+
+
+def rewrite_stylesheet_link(html, href=SITE_CSS):
+    """Tailwind CDN <link>를 자체 호스팅 CSS로 교체"""
+    return TAILWIND_LINK_RE.sub(lambda m: f"{m.group(1)}{href}{m.group(2)}", html)
+
+
+def build_site_css(vendor_css, html_files, output_file):
+    """HTML에서 쓰인 클래스만 남긴 site.css 생성"""
+    used = collect_classes(html_files)
+    purged = purge_css(vendor_css, used)
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(f"/*! tailwindcss v{TAILWIND_VERSION} (purged), modern-normalize | MIT License */\n"
+                           f"{purged}\n",
+                           encoding='utf-8')
+    print(f"  🎨 site.css: {len(vendor_css):,} → {output_file.stat().st_size:,} bytes "
+          f"(클래스 {len(used)}개)")
+    return output_file
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Search Index
+슬라이드 IR과 docs/*.md 본문으로 미리 만드는 한글 전문 검색 역색인 (gzip JSON 한 파일)
+
+- 토큰: NFC 정규화 후 한글은 음절 bigram(한 음절 낱말은 그 음절), 영문/숫자는 소문자 낱말
+- 색인: {"docs": [[제목, 링크, 요약], ...], "terms": {토큰: 문서 번호 차이값 목록}}
+index.html의 검색 상자는 처음 쓸 때 이 파일만 내려받아 브라우저 안에서 바로 검색합니다.
+"""
+
+import gzip
+import json
+import re
+import unicodedata
+from collections import defaultdict
+from pathlib import Path
+
+# 토큰 규칙이나 색인 형식이 바뀌면 올림 (검색 스크립트와 함께)
+INDEX_VERSION = 1
+SEARCH_INDEX = "search_index.json.gz"
+SNIPPET_LENGTH = 90
+MAX_RESULTS = 20
+
+TOKEN_RE = re.compile(r"[가-힣]+|[a-z0-9]+")
+MD_HEADING_RE = re.compile(r"^#\s+(.+?)\s*#*\s*$", re.MULTILINE)
+MD_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+MD_MARKUP_RE = re.compile(r"^\s*(?:[-+*]|\d+\.)\s+|[#*_>`|~]+", re.MULTILINE)
+
+
+def normalize(text):
+    """NFC 정규화 + 소문자 (macOS에서 저장한 NFD 한글도 같은 음절이 됨)"""
+    return unicodedata.normalize("NFC", text).lower()
+
+
+def tokenize(text):
+    """검색 토큰 집합 (검색 스크립트의 tokenize와 같은 규칙)"""
+    tokens = set()
+    for run in TOKEN_RE.findall(normalize(text)):
+        if "가" <= run[0] <= "힣":
+            if len(run) == 1:
+                tokens.add(run)
+            tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.add(run)
+    return tokens
+
+
+def snippet(text, length=SNIPPET_LENGTH):
+    """검색 결과에 보여 줄 본문 앞부분"""
+    text = " ".join(text.split())
+    return text if len(text) <= length else text[:length].rstrip() + "…"
+
+
+def markdown_text(md_text):
+    """마크다운 기호를 뺀 본문 (링크는 글자만 남김)"""
+    return " ".join(MD_MARKUP_RE.sub(" ", MD_LINK_RE.sub(r"\1", md_text)).split())
+
+
+def slide_documents(deck):
+    """슬라이드마다 검색 문서 하나 (IR의 제목, 소제목, 항목, 문단)"""
+    for i, slide in enumerate(deck["slides"], start=1):
+        ir = slide["ir"]
+        parts = [ir["subtitle"] or ""]
+        for section in ir["sections"]:
+            parts += [section["heading"], *section["items"]]
+        parts += ir["paragraphs"]
+        yield {"title": slide["title"], "href": f"{i:02d}_{slide['id']}.html",
+               "text": " ".join(part for part in parts if part)}
+
+
+def doc_documents(docs_dir):
+    """docs/*.md의 장마다 검색 문서 하나 (링크는 변환된 HTML 페이지)"""
+    from build_pdf import split_chapters
+
+    for md_file in sorted(Path(docs_dir).glob("*.md")):
+        md_text = md_file.read_text(encoding='utf-8')
+        match = MD_HEADING_RE.search(md_text)
+        doc_title = match.group(1) if match else md_file.stem
+        for title, chapter, _ in split_chapters(md_text):
+            yield {"title": f"{doc_title} › {title}" if title else doc_title,
+                   "href": f"{md_file.stem}.html", "text": markdown_text(chapter)}
+
+
+def build_index(documents):
+    """문서 목록으로 역색인 사전 생성 (토큰은 정렬, 문서 번호는 차이값으로 저장)"""
+    docs = []
+    postings = defaultdict(list)
+    for number, document in enumerate(documents):
+        title = unicodedata.normalize("NFC", document["title"])
+        docs.append([title, document["href"], snippet(unicodedata.normalize("NFC", document["text"]))])
+        for token in tokenize(f'{title} {document["text"]}'):
+            postings[token].append(number)
+
+    terms = {}
+    for token in sorted(postings):
+        numbers = postings[token]
+        terms[token] = [numbers[0]] + [b - a for a, b in zip(numbers, numbers[1:])]
+    return {"version": INDEX_VERSION, "docs": docs, "terms": terms}
+
+
+def write_index(index, output_file):
+    """색인을 압축 JSON으로 저장하고 (원본 크기, 압축 크기) 반환 (같은 내용이면 같은 바이트)"""
+    data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    Path(output_file).write_bytes(compressed)
+    return len(data), len(compressed)
+
+
+# index.html 머리 아래에 넣는 검색 상자
+SEARCH_BOX = '''        <!-- 검색 -->
+        <div class="max-w-2xl mx-auto mb-12">
+            <label for="search-input" class="sr-only">슬라이드와 자료 검색</label>
+            <input id="search-input" type="search" autocomplete="off"
+                   placeholder="슬라이드와 자료 검색 (예: 탭 그룹, 구글 클래스룸)"
+                   class="w-full px-4 py-3 rounded-lg shadow-md border border-gray-200 focus:outline-none focus:ring-2 focus:ring-blue-400">
+            <ul id="search-results" class="mt-2 bg-white rounded-lg shadow-md divide-y" hidden></ul>
+        </div>
+
+'''
+
+# 검색 상자를 처음 쓸 때 색인을 한 번 받아 브라우저 안에서 검색하는 스크립트
+SEARCH_SCRIPT = '''    <script>
+        (function () {
+            const input = document.getElementById('search-input');
+            const list = document.getElementById('search-results');
+            if (!input || !list) return;
+            const MAX_RESULTS = %(max_results)d;
+            let index = null;
+            let loading = null;
+
+            // search_index.py의 tokenize와 같은 규칙 (NFC, 한글 음절 bigram, 영문/숫자 낱말)
+            function tokenize(text) {
+                const tokens = new Set();
+                (text.normalize('NFC').toLowerCase().match(/[가-힣]+|[a-z0-9]+/g) || []).forEach(run => {
+                    if (!/^[가-힣]/.test(run)) {
+                        tokens.add(run);
+                        return;
+                    }
+                    if (run.length === 1) tokens.add(run);
+                    for (let i = 0; i + 1 < run.length; i++) tokens.add(run.slice(i, i + 2));
+                });
+                return [...tokens];
+            }
+
+            function load() {
+                if (!loading) {
+                    loading = fetch('%(index_file)s')
+                        .then(response => {
+                            if (!response.ok) throw new Error(response.status);
+                            return response.arrayBuffer();
+                        })
+                        .then(buffer => {
+                            const bytes = new Uint8Array(buffer);
+                            // 서버가 이미 압축을 풀어 보냈으면 그대로 사용
+                            if (bytes[0] !== 0x1f || bytes[1] !== 0x8b) return new Response(buffer).json();
+                            const stream = new Blob([buffer]).stream().pipeThrough(new DecompressionStream('gzip'));
+                            return new Response(stream).json();
+                        })
+                        .then(data => {
+                            index = data;
+                            index.keys = Object.keys(data.terms);
+                            return index;
+                        })
+                        .catch(error => {
+                            // 실패한 요청은 기억하지 않고 다음 검색에서 다시 받음
+                            loading = null;
+                            throw error;
+                        });
+                }
+                return loading;
+            }
+
+            function postings(term) {
+                // 한 음절이나 영문은 입력 중인 낱말일 수 있으므로 그것으로 시작하는 토큰도 포함
+                const prefix = term.length === 1 || !/^[가-힣]/.test(term);
+                const keys = prefix ? index.keys.filter(key => key.startsWith(term)) : [term];
+                const ids = new Set();
+                keys.forEach(key => {
+                    let id = 0;
+                    (index.terms[key] || []).forEach(delta => ids.add(id += delta));
+                });
+                return ids;
+            }
+
+            function search(query) {
+                const terms = tokenize(query);
+                if (!terms.length) return [];
+                const scores = new Map();
+                terms.forEach(term => postings(term).forEach(id => scores.set(id, (scores.get(id) || 0) + 1)));
+                // 모든 토큰이 들어 있는 문서, 없으면 절반 이상 들어 있는 문서 (제목에 검색어가 있으면 앞으로)
+                let hits = [...scores].filter(([, score]) => score === terms.length);
+                if (!hits.length) hits = [...scores].filter(([, score]) => score * 2 >= terms.length);
+                const needle = query.normalize('NFC').toLowerCase().trim();
+                return hits
+                    .map(([id, score]) => [id, score + (index.docs[id][0].toLowerCase().includes(needle) ? terms.length : 0)])
+                    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+                    .slice(0, MAX_RESULTS)
+                    .map(([id]) => index.docs[id]);
+            }
+
+            function escape(text) {
+                return text.replace(/[&<>"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})[c]);
+            }
+
+            function show(html) {
+                list.innerHTML = html;
+                list.hidden = !html;
+            }
+
+            input.addEventListener('focus', () => load().catch(() => {}), { once: true });
+            input.addEventListener('input', () => {
+                const query = input.value;
+                if (!query.trim()) return show('');
+                load()
+                    .then(() => {
+                        if (input.value !== query) return;
+                        const results = search(query);
+                        show(results.length ? results.map(([title, href, text]) =>
+                            `<li><a href="${escape(href)}" class="block px-4 py-3 hover:bg-blue-50">` +
+                            `<span class="font-bold text-gray-800">${escape(title)}</span>` +
+                            `<span class="block text-sm text-gray-500">${escape(text)}</span></a></li>`).join('')
+                            : '<li class="px-4 py-3 text-gray-500">검색 결과가 없습니다.</li>');
+                    })
+                    .catch(() => show('<li class="px-4 py-3 text-gray-500">검색 색인을 불러오지 못했습니다.</li>'));
+            });
+        })();
+    </script>
+''' % {"max_results": MAX_RESULTS, "index_file": SEARCH_INDEX}
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Slide IR
+slides/*.html을 한 번 파싱해 만든 간결한 슬라이드 중간 표현(IR)과 파일 해시 기반 캐시
+
+IR은 인덱스, build_info.json, PPTX 생성이 함께 사용하므로 슬라이드 제목 등을
+구성 정보에 따로 적어 두지 않아도 HTML과 항상 같은 내용이 됩니다.
+"""
+
+import copy
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+from build_cache import DiskCache, content_key
+from optimize_images import class_widths, display_width
+
+# 파싱 규칙이나 IR 형식이 바뀌면 올려서 캐시 무효화
+IR_VERSION = "2"
+HEX_COLOR_RE = re.compile(r"#([0-9a-fA-F]{6}|[0-9a-fA-F]{3})\b")
+# 빈 슬라이드(HTML 파일이 없을 때)의 IR
+EMPTY_IR = {"version": IR_VERSION, "title": None, "subtitle": None, "sections": [],
+            "paragraphs": [], "images": [], "colors": []}
+
+
+def element_text(element):
+    """요소의 보이는 텍스트 (연속 공백은 하나로)"""
+    return " ".join(element.text_content().split())
+
+
+def css_colors(texts, limit=8):
+    """CSS 텍스트에 나오는 색상을 많이 쓰인 순서로 (#rrggbb 소문자)"""
+    counts = Counter()
+    for text in texts:
+        for value in HEX_COLOR_RE.findall(text):
+            if len(value) == 3:
+                value = "".join(c * 2 for c in value)
+            counts[f"#{value.lower()}"] += 1
+    return [color for color, _ in counts.most_common(limit)]
+
+
+def parse_slide(html):
+    """슬라이드 HTML(bytes 또는 str)을 IR 사전으로 변환
+
+    - title: 첫 h1, subtitle: class에 subtitle이 있는 첫 제목
+    - sections: h2/h3마다 하나 (같은 상자 안의 목록 항목 items, 첫 설명 문단 text)
+    - paragraphs: 모든 문단, images: img의 src/alt와 표시 폭(CSS px), colors: 스타일에 쓰인 색상
+    """
+    import lxml.html
+
+    root = lxml.html.fromstring(html)
+    widths = class_widths(html.decode('utf-8') if isinstance(html, bytes) else html)
+    # <br>로 나눈 제목이 붙어 버리지 않도록 공백으로 바꿈
+    for br in root.iter("br"):
+        br.tail = " " + (br.tail or "")
+
+    title = subtitle = None
+    sections, paragraphs, images = [], [], []
+    current = current_box = None
+    body = root.find("body")
+    for element in (body if body is not None else root).iter("h1", "h2", "h3", "li", "p", "img"):
+        tag = element.tag
+        if tag == "img":
+            images.append({"src": element.get("src", ""), "alt": element.get("alt", ""),
+                           "width": display_width(element.attrib, widths)})
+            continue
+        text = element_text(element)
+        if not text:
+            continue
+        if tag == "h1":
+            title = title or text
+        elif tag in ("h2", "h3"):
+            if subtitle is None and "subtitle" in element.get("class", "").split():
+                subtitle = text
+                continue
+            current = {"heading": text, "level": int(tag[1]), "items": [], "text": None}
+            current_box = element.getparent()
+            sections.append(current)
+        elif tag == "li":
+            if current is not None:
+                current["items"].append(text)
+        else:
+            paragraphs.append(text)
+            # 제목과 같은 상자 안의 첫 문단만 그 절의 설명으로 봄
+            if (current is not None and current["text"] is None and not current["items"]
+                    and current_box is not None and current_box in element.iterancestors()):
+                current["text"] = text
+
+    styles = [style.text or "" for style in root.iter("style")]
+    styles += [element.get("style") for element in root.iter() if element.get("style")]
+    return {
+        "version": IR_VERSION,
+        "title": title,
+        "subtitle": subtitle,
+        "sections": sections,
+        "paragraphs": paragraphs,
+        "images": images,
+        "colors": css_colors(styles),
+    }
+
+
+class SlideIRCache:
+    """파일 내용 해시를 키로 IR을 디스크에 저장하는 캐시
+
+    같은 프로세스 안에서는 메모리에도 보관하므로 내용이 같은 파일은 한 번만 파싱합니다.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache = DiskCache("slide_ir", cache_dir)
+        self.memory = {}
+        self.stats = Counter()
+
+    def load(self, path):
+        """슬라이드 파일 하나의 IR (파일이 없으면 빈 IR)"""
+        try:
+            data = Path(path).read_bytes()
+        except FileNotFoundError:
+            return copy.deepcopy(EMPTY_IR)
+        key = content_key(IR_VERSION, data)
+        ir = self.memory.get(key)
+        if ir is not None:
+            self.stats["memory"] += 1
+            return ir
+
+        cached = self.cache.get(key, ".json")
+        if cached is not None:
+            ir = json.loads(cached)
+            self.stats["cached"] += 1
+        else:
+            ir = parse_slide(data)
+            self.cache.put(key, json.dumps(ir, ensure_ascii=False).encode('utf-8'), ".json")
+            self.stats["parsed"] += 1
+        self.memory[key] = ir
+        return ir
+
+
+def default_items(ir):
+    """구성 정보에 항목이 없을 때 쓸 목록 (첫 목록, 없으면 h3 제목들)"""
+    for section in ir["sections"]:
+        if section["items"]:
+            return list(section["items"])
+    return [section["heading"] for section in ir["sections"] if section["level"] == 3]
+
+
+def resolve_slide(slide, ir):
+    """구성 정보의 슬라이드에 IR 값을 채운 사본 (구성 정보에 직접 적은 값이 우선)"""
+    resolved = {"id": slide["id"], "title": ir["title"] or slide["id"]}
+    resolved.update(copy.deepcopy(slide))
+    content = resolved.setdefault("content", {})
+    if slide.get("type") == "title":
+        content.setdefault("main_title", ir["title"] or resolved["title"])
+        content.setdefault("subtitle", (ir["subtitle"] or "").lstrip("—–- "))
+        content.setdefault("description", ir["paragraphs"][0] if ir["paragraphs"] else "")
+    else:
+        sections = ir["sections"]
+        content.setdefault("heading", sections[0]["heading"] if sections else "")
+        content.setdefault("items", default_items(ir))
+    resolved["ir"] = ir
+    return resolved
+
+
+def strip_ir(config):
+    """IR을 뺀 구성 정보 (slide_config.json 저장용)"""
+    return dict(config, slides=[{k: v for k, v in slide.items() if k != "ir"}
+                                for slide in config["slides"]])
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Font Subsetter
+자료에 실제로 쓰인 글자만 담은 Noto Sans KR WOFF2 서브셋과 @font-face CSS 생성
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from build_cache import DiskCache, content_key, file_digest
+
+FONT_FAMILY = "Noto Sans KR"
+FONT_WEIGHTS = (400, 700)
+FONT_CSS = "assets/fonts/noto-sans-kr.css"
+
+# 프로젝트 fonts/ 디렉토리를 먼저 찾고, 없으면 시스템에 설치된 Noto CJK(fonts-noto-cjk)를 사용
+PROJECT_FONT_FILES = {
+    400: ("NotoSansKR-Regular.otf", "NotoSansKR-Regular.ttf"),
+    700: ("NotoSansKR-Bold.otf", "NotoSansKR-Bold.ttf"),
+}
+SYSTEM_FONT_FILES = {
+    400: (
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/google-noto-cjk/NotoSansCJK-Regular.ttc",
+    ),
+    700: (
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc",
+        "/usr/share/fonts/noto-cjk/NotoSansCJK-Bold.ttc",
+        "/usr/share/fonts/google-noto-cjk/NotoSansCJK-Bold.ttc",
+    ),
+}
+
+# 문서에 없더라도 항상 포함할 기본 글자 (ASCII 출력 문자)
+BASE_CHARACTERS = "".join(chr(code) for code in range(0x20, 0x7f))
+
+GOOGLE_FONTS_LINK_RE = re.compile(
+    r"""(<link\b[^>]*?\bhref\s*=\s*["'])https://fonts\.googleapis\.com/css2?\?family=Noto\+Sans\+KR[^"']*(["'][^>]*>)""",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def collect_characters(files, strings=()):
+    """파일과 문자열에 쓰인 모든 글자 집합 (제어 문자 제외)"""
+    characters = set(BASE_CHARACTERS)
+    for path in files:
+        characters.update(Path(path).read_text(encoding='utf-8'))
+    for text in strings:
+        characters.update(text)
+    return {ch for ch in characters if ch.isprintable()}
+
+
+def charset_digest(characters):
+    """글자 집합의 해시 (서브셋 캐시 키)"""
+    return hashlib.sha256("".join(sorted(characters)).encode('utf-8')).hexdigest()
+
+
+def _collection_index(path):
+    """TTC 안에서 한국어(KR) 글꼴의 번호"""
+    from fontTools.ttLib import TTCollection
+
+    collection = TTCollection(str(path), lazy=True)
+    try:
+        for index, font in enumerate(collection.fonts):
+            names = {record.toUnicode() for record in font["name"].names if record.nameID in (1, 16)}
+            if any(" KR" in name for name in names):
+                return index
+    finally:
+        collection.close()
+    return None
+
+
+def find_source_fonts(project_dir):
+    """굵기별 원본 글꼴 {weight: (경로, TTC 번호)} (하나라도 없으면 None)"""
+    sources = {}
+    fonts_dir = Path(project_dir) / "fonts"
+    for weight in FONT_WEIGHTS:
+        for name in PROJECT_FONT_FILES[weight]:
+            if (fonts_dir / name).is_file():
+                sources[weight] = (fonts_dir / name, None)
+                break
+        else:
+            for candidate in SYSTEM_FONT_FILES[weight]:
+                if Path(candidate).is_file():
+                    index = _collection_index(candidate)
+                    if index is not None:
+                        sources[weight] = (Path(candidate), index)
+                        break
+        if weight not in sources:
+            return None
+    return sources
+
+
+def subset_font(source, font_number, characters):
+    """원본 글꼴에서 지정한 글자만 남긴 WOFF2 바이트"""
+    from io import BytesIO
+
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    font = TTFont(str(source), fontNumber=font_number if font_number is not None else -1,
+                  lazy=True)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text="".join(sorted(characters)))
+    subsetter.subset(font)
+    buffer = BytesIO()
+    font.flavor = "woff2"
+    font.save(buffer)
+    font.close()
+    return buffer.getvalue()
+
+
+def font_face_css(files):
+    """굵기별 WOFF2 파일을 가리키는 @font-face 규칙"""
+    rules = []
+    for weight, filename in sorted(files.items()):
+        rules.append(
+            "@font-face {\n"
+            f"  font-family: '{FONT_FAMILY}';\n"
+            "  font-style: normal;\n"
+            f"  font-weight: {weight};\n"
+            "  font-display: swap;\n"
+            f"  src: url('{filename}') format('woff2');\n"
+            "}\n"
+        )
+    return "".join(rules)
+
+
+def rewrite_font_link(html, href=FONT_CSS):
+    """Google Fonts의 Noto Sans KR <link>를 자체 호스팅 @font-face CSS로 교체"""
+    return GOOGLE_FONTS_LINK_RE.sub(lambda m: f"{m.group(1)}{href}{m.group(2)}", html)
+
+
+class FontSubsetter:
+    """글자 집합 해시로 캐시하는 Noto Sans KR 서브셋 생성기"""
+
+    def __init__(self, sources, output_dir, cache_dir=None):
+        import fontTools
+
+        self.sources = sources
+        self.output_dir = Path(output_dir)
+        self.cache = DiskCache("fonts", cache_dir)
+        self.fonttools_version = fontTools.version
+
+    def build(self, characters):
+        """굵기별 서브셋과 CSS를 생성하고 출력 파일 목록 반환"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        digest = charset_digest(characters)
+        outputs, files = [], {}
+        for weight in FONT_WEIGHTS:
+            source, font_number = self.sources[weight]
+            key = content_key(digest, file_digest(source), json.dumps(font_number),
+                              str(weight), self.fonttools_version)
+            data = self.cache.get(key, ".woff2")
+            if data is None:
+                print(f"  🔤 {weight} 서브셋 생성 중 (글자 {len(characters):,}개)...")
+                data = subset_font(source, font_number, characters)
+                self.cache.put(key, data, ".woff2")
+            filename = f"NotoSansKR-{weight}.{key[:10]}.woff2"
+            target = self.output_dir / filename
+            if not target.exists() or target.stat().st_size != len(data):
+                target.write_bytes(data)
+            files[weight] = filename
+            outputs.append(target)
+            print(f"  🔤 {filename}: {source.stat().st_size:,} → {len(data):,} bytes")
+
+        css_file = self.output_dir / Path(FONT_CSS).name
+        css_file.write_text(font_face_css(files), encoding='utf-8')
+        outputs.append(css_file)
+        return outputs
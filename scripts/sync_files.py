@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Chrome Education File Sync
+변경된 파일만 복사하는 동기화 계층 (reflink → 하드 링크 → 복사 순으로 시도)
+"""
+
+import json
+import os
+import shutil
+import threading
+from collections import Counter
+from pathlib import Path
+
+from build_cache import file_digest
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# linux/fs.h: _IOW(0x94, 9, int) — 같은 파일 시스템(btrfs, xfs 등)에서 데이터 블록을 공유하는 복제
+FICLONE = 0x40049409
+# sync_files가 옮긴 파일 이름을 기록하는 빌드 캐시 하위 디렉토리
+SYNC_RECORD_DIR = "sync"
+
+
+def is_synced(src, dst, linked=True):
+    """dst가 src와 같은 내용인지 확인 (크기/수정 시각이 같으면 해시 생략)
+
+    linked=False이면 src에 하드 링크된 dst는 동기화되지 않은 것으로 보고 복사본으로 바꾸게 합니다.
+    """
+    try:
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        return False
+    src_stat = src.stat()
+    if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+        return linked
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return True
+    if file_digest(src) != file_digest(dst):
+        return False
+    # 내용이 같으면 수정 시각만 맞춰 다음 비교에서 해시를 생략
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return True
+
+
+def _reflink(src, dst):
+    """FICLONE ioctl로 복제 (지원하지 않는 파일 시스템이면 False)"""
+    if fcntl is None:
+        return False
+    try:
+        with open(src, 'rb') as s, open(dst, 'wb') as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _hardlink(src, dst):
+    """하드 링크 생성 (다른 파일 시스템 등으로 불가능하면 False)"""
+    try:
+        os.link(src, dst)
+    except (OSError, NotImplementedError):
+        return False
+    return True
+
+
+class FileSync:
+    """원본과 달라진 파일만 출력 디렉토리로 옮기는 동기화기
+
+    hardlink=True이면 reflink가 안 될 때 하드 링크를 사용합니다. 하드 링크된 출력 파일은
+    원본과 같은 파일이므로 출력 쪽을 제자리에서 수정하면 안 됩니다. 원본을 제자리에서 고치면
+    출력도 함께 바뀌어 "변경 없음"으로 보고되므로, 편집기로 고치는 슬라이드/문서 파일을 옮기는
+    sync_files는 하드 링크를 쓰지 않고 reflink나 복사만 사용합니다.
+    """
+
+    def __init__(self, hardlink=True):
+        self.hardlink = hardlink
+        self.stats = Counter()
+        self._lock = threading.Lock()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def sync_file(self, src, dst, hardlink=None):
+        """파일 하나를 동기화하고 사용한 방식 반환 ("unchanged", "reflink", "hardlink", "copy")
+
+        hardlink를 지정하면 이 파일에 한해 self.hardlink 대신 사용합니다.
+        """
+        src, dst = Path(src), Path(dst)
+        hardlink = self.hardlink if hardlink is None else hardlink
+        if is_synced(src, dst, linked=hardlink):
+            self._count("unchanged")
+            return "unchanged"
+
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.unlink(missing_ok=True)
+        if _reflink(src, tmp):
+            method = "reflink"
+        elif hardlink and _hardlink(src, tmp):
+            method = "hardlink"
+        else:
+            shutil.copy2(src, tmp)
+            method = "copy"
+        os.replace(tmp, dst)
+        # tmp와 dst가 이미 같은 파일(하드 링크)이면 rename이 아무것도 하지 않으므로 정리
+        tmp.unlink(missing_ok=True)
+        self._count(method)
+        return method
+
+    def sync_files(self, sources, dst_dir, record=None):
+        """파일들을 dst_dir 바로 아래로 복사(reflink)하고 출력 경로 목록 반환
+
+        dst_dir에는 다른 단계가 만든 파일도 있으므로, 지난번에 옮긴 파일의 이름과 내용 해시를
+        record(JSON)에 기록해 두고 그중 원본이 사라졌으며 기록한 내용 그대로인 파일만 삭제합니다.
+        (다른 단계가 같은 이름으로 다시 쓴 파일은 남김) 이름이 같은 원본이 둘 이상이면 서로
+        덮어쓰므로 ValueError를 발생시킵니다.
+        """
+        dst_dir = Path(dst_dir)
+        names = {}
+        for src in sources:
+            name = Path(src).name
+            if name in names:
+                raise ValueError(f"이름이 같은 파일을 {dst_dir}에 함께 옮길 수 없습니다: "
+                                 f"{names[name]}, {src}")
+            names[name] = src
+
+        previous = {}
+        if record is not None:
+            record = Path(record)
+            try:
+                previous = json.loads(record.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                pass
+            if not isinstance(previous, dict):
+                # 이름만 기록하던 예전 형식은 내용을 확인할 수 없으므로 아무것도 삭제하지 않음
+                previous = {}
+
+        outputs = []
+        current = {}
+        for name, src in names.items():
+            dst = dst_dir / name
+            method = self.sync_file(src, dst, hardlink=False)
+            outputs.append(dst)
+            if record is not None:
+                # 그대로인 파일은 지난번 해시를 재사용해 매번 전체를 읽지 않음
+                current[name] = (previous[name] if method == "unchanged" and name in previous
+                                 else file_digest(dst))
+
+        if record is not None:
+            for name in sorted(set(previous) - set(current)):
+                stale = dst_dir / name
+                if stale.is_file() and file_digest(stale) == previous[name]:
+                    stale.unlink()
+                    self._count("removed")
+            record.parent.mkdir(parents=True, exist_ok=True)
+            record.write_text(json.dumps(dict(sorted(current.items())), ensure_ascii=False),
+                              encoding='utf-8')
+        return outputs
+
+    def sync_tree(self, src_dir, dst_dir):
+        """디렉토리 전체를 동기화 (원본에서 사라진 파일만 dst_dir에서 삭제)"""
+        src_dir, dst_dir = Path(src_dir), Path(dst_dir)
+        outputs = []
+        for src in sorted(src_dir.rglob("*")):
+            if src.is_file():
+                dst = dst_dir / src.relative_to(src_dir)
+                self.sync_file(src, dst)
+                outputs.append(dst)
+
+        if dst_dir.exists():
+            expected = set(outputs)
+            for dst in sorted(dst_dir.rglob("*"), reverse=True):
+                if dst.is_file() and dst not in expected:
+                    dst.unlink()
+                    self._count("removed")
+                elif dst.is_dir() and not any(dst.iterdir()):
+                    dst.rmdir()
+        return outputs
+
+    def summary(self):
+        """동기화 결과 한 줄 요약"""
+        labels = [("copy", "복사"), ("reflink", "reflink"), ("hardlink", "하드 링크"),
+                  ("unchanged", "변경 없음"), ("removed", "삭제")]
+        return ", ".join(f"{label} {self.stats[key]}개" for key, label in labels if self.stats[key])
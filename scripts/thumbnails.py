@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Chrome Education Slide Thumbnails
+슬라이드마다 작은 미리보기 이미지(WebP)를 만들어 index.html 카드에 넣는 빌드 단계
+
+- 렌더링: wkhtmltoimage(wkhtmltopdf 패키지에 포함)로 1280×720 화면을 PNG로 찍은 뒤 Pillow로 축소
+- 캐시: 슬라이드 HTML과 참조하는 이미지 파일의 해시가 키이므로 바뀐 슬라이드만 다시 렌더링
+- 여러 슬라이드를 스레드 풀에서 동시에 렌더링 (렌더링은 외부 프로세스에서 실행)
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import Counter
+from pathlib import Path
+
+from build_cache import DiskCache, content_key, file_digest
+from optimize_images import IMG_TAG_RE, PIXEL_DENSITIES, SLIDE_WIDTH, image_name, parse_attributes
+
+RENDERER = "wkhtmltoimage"
+SLIDE_HEIGHT = 720
+# 카드에 표시하는 폭 (1x, 2x 변형을 만들고 srcset으로 연결)
+THUMBNAIL_WIDTH = 400
+THUMBNAIL_HEIGHT = THUMBNAIL_WIDTH * SLIDE_HEIGHT // SLIDE_WIDTH
+THUMBNAIL_DIR = "assets/thumbnails"
+THUMBNAIL_MANIFEST = "thumbnails.json"
+# 카드 격자(1/2/3열)에서 이미지가 차지하는 폭
+THUMBNAIL_SIZES = "(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw"
+# 렌더링/인코딩 설정 (캐시 키에 포함되므로 바꾸면 다시 렌더링됨)
+RENDER_OPTIONS = [
+    "--format", "png", "--width", str(SLIDE_WIDTH), "--height", str(SLIDE_HEIGHT),
+    "--enable-local-file-access", "--load-error-handling", "ignore",
+    "--load-media-error-handling", "ignore", "--javascript-delay", "500",
+]
+ENCODING = {"quality": 75, "method": 6}
+RENDER_TIMEOUT = 120
+
+
+def renderer_available():
+    """wkhtmltoimage가 설치되어 있는지 확인"""
+    return shutil.which(RENDERER) is not None
+
+
+def slide_images(html, images_dir):
+    """슬라이드가 참조하는 이미지 중 slides/images에 있는 파일 {src: 경로}"""
+    images = {}
+    for tag in IMG_TAG_RE.findall(html):
+        src = parse_attributes(tag).get("src")
+        name = image_name(src)
+        if name and (Path(images_dir) / name).is_file():
+            images[src] = Path(images_dir) / name
+    return images
+
+
+def local_html(html, images):
+    """이미지 src를 절대 file:// 주소로 바꾼 HTML (임시 디렉토리에서 렌더링해도 이미지가 보이도록)"""
+    for src, path in images.items():
+        uri = path.resolve().as_uri()
+        html = html.replace(f'"{src}"', f'"{uri}"').replace(f"'{src}'", f"'{uri}'")
+    return html
+
+
+def render_png(html):
+    """HTML을 슬라이드 크기의 PNG 바이트로 렌더링"""
+    # 배포판 패키지의 wkhtmltoimage는 X 서버 없이 Qt offscreen 플랫폼으로 실행 가능
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    with tempfile.TemporaryDirectory(prefix="chrome_edu_thumb_") as tmp:
+        source, target = Path(tmp) / "slide.html", Path(tmp) / "slide.png"
+        source.write_text(html, encoding='utf-8')
+        subprocess.run([RENDERER, "--quiet", *RENDER_OPTIONS, str(source), str(target)],
+                       check=True, capture_output=True, env=env, timeout=RENDER_TIMEOUT)
+        return target.read_bytes()
+
+
+def encode_webp(png, width):
+    """PNG를 지정한 폭의 16:9 WebP로 축소 (페이지가 더 길면 위쪽 한 화면만)"""
+    from io import BytesIO
+
+    from PIL import Image
+
+    with Image.open(BytesIO(png)) as image:
+        image = image.convert("RGB")
+        height = round(image.width * SLIDE_HEIGHT / SLIDE_WIDTH)
+        if image.height > height:
+            image = image.crop((0, 0, image.width, height))
+        image = image.resize((width, round(width * SLIDE_HEIGHT / SLIDE_WIDTH)), Image.LANCZOS)
+        buffer = BytesIO()
+        image.save(buffer, format="WEBP", **ENCODING)
+        return buffer.getvalue()
+
+
+class ThumbnailRenderer:
+    """슬라이드 미리보기를 병렬로 렌더링하고 HTML + 이미지 해시로 캐시
+
+    캐시 키에는 wkhtmltoimage 버전을 넣지 않으므로, 렌더러가 없는 환경에서도
+    이미 캐시된 미리보기는 그대로 사용합니다.
+    """
+
+    def __init__(self, slides_dir, output_dir, cache_dir=None, jobs=1):
+        import PIL
+
+        self.slides_dir = Path(slides_dir)
+        self.images_dir = self.slides_dir / "images"
+        self.output_dir = Path(output_dir)
+        self.cache = DiskCache("thumbnails", cache_dir)
+        self.jobs = max(1, jobs or 1)
+        self.available = renderer_available()
+        self.pil_version = PIL.__version__
+        self.stats = Counter()
+        self._lock = threading.Lock()
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def widths(self):
+        return [THUMBNAIL_WIDTH * density for density in PIXEL_DENSITIES]
+
+    def slide_key(self, html, images):
+        """슬라이드 HTML, 참조 이미지 내용, 렌더링 설정의 해시"""
+        parts = [json.dumps(RENDER_OPTIONS), json.dumps(ENCODING, sort_keys=True), self.pil_version,
+                 html.encode('utf-8')]
+        for src in sorted(images):
+            parts += [src, file_digest(images[src])]
+        return content_key(*parts)
+
+    def thumbnail(self, slide_id):
+        """슬라이드 하나의 미리보기 변형 (캐시에 없고 렌더러가 없거나 렌더링에 실패하면 None)"""
+        html = (self.slides_dir / f"{slide_id}.html").read_text(encoding='utf-8')
+        images = slide_images(html, self.images_dir)
+        key = self.slide_key(html, images)
+        variants = {width: self.cache.get(key, f".{width}w.webp") for width in self.widths()}
+        if any(data is None for data in variants.values()):
+            if not self.available:
+                self.count("missing")
+                return None
+            try:
+                png = render_png(local_html(html, images))
+            except (OSError, subprocess.SubprocessError) as e:
+                # 미리보기는 선택 기능이므로 실패한 슬라이드만 글자 카드로 두고 빌드는 계속
+                lines = (getattr(e, "stderr", None) or b"").decode('utf-8', 'replace').strip().splitlines()
+                print(f"  ⚠️  {slide_id} 미리보기 렌더링 실패: {lines[-1] if lines else e}")
+                self.count("failed")
+                return None
+            for width in variants:
+                variants[width] = encode_webp(png, width)
+                self.cache.put(key, variants[width], f".{width}w.webp")
+            self.count("rendered")
+        else:
+            self.count("cached")
+
+        files = []
+        for width, data in variants.items():
+            filename = f"{slide_id}.{key[:10]}.{width}w.webp"
+            target = self.output_dir / filename
+            if not target.exists() or target.stat().st_size != len(data):
+                target.write_bytes(data)
+            files.append({"width": width, "file": filename, "bytes": len(data)})
+        return {"width": THUMBNAIL_WIDTH, "height": THUMBNAIL_HEIGHT, "variants": files}
+
+    def build(self, slide_ids):
+        """모든 슬라이드의 미리보기와 thumbnails.json 생성 (이전 빌드에서 남은 변형은 삭제)"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        slide_ids = list(slide_ids)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=min(self.jobs, max(1, len(slide_ids)))) as pool:
+            entries = dict(zip(slide_ids, pool.map(self.thumbnail, slide_ids)))
+        manifest = {slide_id: entry for slide_id, entry in entries.items() if entry is not None}
+
+        # 내용이 같으면 다시 쓰지 않음 (인덱스 노드의 입력이므로 수정 시각 유지)
+        manifest_file = self.output_dir / THUMBNAIL_MANIFEST
+        data = json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True)
+        if not manifest_file.is_file() or manifest_file.read_text(encoding='utf-8') != data:
+            manifest_file.write_text(data, encoding='utf-8')
+
+        outputs = [manifest_file]
+        outputs += [self.output_dir / variant["file"]
+                    for entry in manifest.values() for variant in entry["variants"]]
+        for stale in self.output_dir.glob("*.webp"):
+            if stale not in outputs:
+                stale.unlink()
+        return outputs
+
+
+def load_thumbnail_manifest(output_dir):
+    """thumbnails.json 로드 (미리보기 단계가 실행되지 않았으면 빈 사전)"""
+    try:
+        with open(Path(output_dir) / THUMBNAIL_DIR / THUMBNAIL_MANIFEST, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def thumbnail_html(entry, alt):
+    """인덱스 카드에 넣을 지연 로딩 미리보기 img 태그 (entry가 없으면 빈 문자열)"""
+    if not entry:
+        return ""
+    variants = sorted(entry["variants"], key=lambda variant: variant["width"])
+    srcset = ", ".join(f"{THUMBNAIL_DIR}/{variant['file']} {variant['width']}w" for variant in variants)
+    return (f'                <img src="{THUMBNAIL_DIR}/{variants[0]["file"]}" srcset="{srcset}" '
+            f'sizes="{THUMBNAIL_SIZES}" width="{entry["width"]}" height="{entry["height"]}" '
+            f'loading="lazy" decoding="async" alt="{alt}" class="w-full h-auto border-b">\n')
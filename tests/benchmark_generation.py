@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+생성 단계별 벤치마크 스크립트
+
+실제 교육 자료와 합성 덱(100/1,000/10,000 슬라이드), 크기를 늘린 마크다운 문서로
+각 생성 단계의 실행 시간을 측정해 JSON으로 저장하고, 기준 결과와 비교해 느려진 단계를 찾습니다.
+워크북 PDF는 설치된 엔진(WeasyPrint, pandoc + xelatex)끼리 비교합니다.
+인덱스 생성처럼 슬라이드 수에 선형이어야 하는 단계는 크기별 항목당 시간도 비교해 보고합니다.
+PPTX는 텍스트 스타일을 템플릿에 정의한 방식과 문단마다 지정한 방식의 슬라이드 XML 크기, 저장 시간을 비교합니다.
+
+사용법:
+    python3 tests/benchmark_generation.py                                   # 측정 후 저장
+    python3 tests/benchmark_generation.py --sizes 100,1000 --repeat 5
+    python3 tests/benchmark_generation.py --baseline baseline.json --threshold 1.3
+    python3 tests/benchmark_generation.py --pdf-engines weasyprint,xelatex --repeat 3
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR / "scripts"))
+
+from build_pdf import PDF_ENGINES  # noqa: E402
+from generate_slides import ChromeEducationSlidesGenerator, convert_markdown_to_html  # noqa: E402
+
+DEFAULT_SIZES = (100, 1000, 10000)
+# python-pptx 저장은 슬라이드 수에 비해 빠르게 느려지므로(1,000장 ≈ 8초) 10,000장은 --pptx-sizes로 지정
+DEFAULT_PPTX_SIZES = (100, 1000)
+MARKDOWN_SCALES = (1, 10, 100)
+RESULTS_VERSION = 1
+# 기준보다 이 배수 이상 느려지면 회귀로 판단 (아주 짧은 측정값은 ABSOLUTE_SLACK 만큼 여유)
+DEFAULT_THRESHOLD = 1.3
+ABSOLUTE_SLACK = 0.005
+# 합성 덱 크기에 대해 선형으로 늘어나야 하는 단계와, 가장 작은 덱 대비 허용하는 항목당 시간 배수
+LINEAR_STAGES = ("generate_indexes", "generate_presentation_index", "generate_build_info")
+LINEAR_LIMIT = 2.0
+# PPTX 텍스트 스타일 방식: 템플릿에 한 번 정의하고 다른 값만 지정(theme) / 모든 문단에 직접 지정(per_run)
+PPTX_STYLE_MODES = (("theme", True), ("per_run", False))
+
+
+def measure(func, repeat, setup=None):
+    """func 실행 시간(초) 목록. setup은 매 실행 전에 호출되며 측정에서 제외"""
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+def synthetic_config(base_config, count):
+    """실제 슬라이드 구성을 반복해 count개 슬라이드를 가진 구성 생성"""
+    slides = []
+    for i in range(count):
+        slide = dict(base_config["slides"][i % len(base_config["slides"])])
+        slide["id"] = f"slide_{i:05d}"
+        slide["title"] = f"{slide['title']} #{i + 1}"
+        slides.append(slide)
+    return dict(base_config, slides=slides)
+
+
+def create_project(base_generator, config):
+    """합성 구성에 맞는 slides/, docs/ 를 가진 임시 프로젝트 디렉토리 생성"""
+    project_dir = Path(tempfile.mkdtemp(prefix="chrome_edu_bench_"))
+    slides_dir = project_dir / "slides"
+    slides_dir.mkdir()
+    sources = sorted(base_generator.slides_dir.glob("*.html"))
+    for i, slide in enumerate(config["slides"]):
+        shutil.copyfile(sources[i % len(sources)], slides_dir / f"{slide['id']}.html")
+    shutil.copytree(base_generator.slides_dir / "images", slides_dir / "images")
+    shutil.copytree(base_generator.project_dir / "docs", project_dir / "docs")
+    return project_dir
+
+
+def make_generator(project_dir, config):
+    """get_slide_config가 주어진 구성을 반환하는 생성기"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator = ChromeEducationSlidesGenerator(project_dir)
+    generator.get_slide_config = lambda: config
+    return generator
+
+
+class BenchmarkRunner:
+    def __init__(self, sizes, repeat, pptx_sizes, pdf_engines=PDF_ENGINES):
+        self.sizes = sizes
+        self.repeat = repeat
+        self.pptx_sizes = pptx_sizes
+        self.pdf_engines = pdf_engines
+        self.results = []
+        self.pptx_styles = []
+
+    def record(self, name, size, items, timings):
+        median = statistics.median(timings)
+        result = {
+            "name": name,
+            "size": size,
+            "items": items,
+            "runs": len(timings),
+            "median_s": round(median, 6),
+            "min_s": round(min(timings), 6),
+            "per_item_us": round(median / max(items, 1) * 1e6, 3),
+        }
+        self.results.append(result)
+        print(f"  ⏱️  {name:<32} {str(size):>6}: {median * 1000:10.2f} ms "
+              f"({result['per_item_us']:,.1f} µs/항목)")
+
+    def bench_markdown(self):
+        print("📄 convert_markdown_to_html")
+        corpus = "\n\n".join(p.read_text(encoding='utf-8')
+                             for p in sorted((PROJECT_DIR / "docs").glob("*.md")))
+        for scale in MARKDOWN_SCALES:
+            text = "\n\n".join([corpus] * scale)
+            timings = measure(lambda: convert_markdown_to_html(text), self.repeat)
+            self.record("convert_markdown_to_html", f"x{scale}", len(text.encode('utf-8')), timings)
+
+    def bench_pdf(self, generator):
+        """워크북 PDF를 엔진별로 생성해 비교 (설치되지 않은 엔진은 건너뜀)
+
+        cold: 조각 캐시가 빈 상태의 전체 렌더링, 1장 변경: 마지막 장만 고친 뒤의 재빌드
+        """
+        from build_pdf import WorkbookPDF, engine_available
+
+        print("📕 워크북 PDF 엔진 비교")
+        render_markdown = generator.get_markdown_converter().render
+        original = (PROJECT_DIR / "docs" / "chrome_edu_workbook.md").read_text(encoding='utf-8')
+        with tempfile.TemporaryDirectory(prefix="chrome_edu_pdf_") as tmp:
+            tmp = Path(tmp)
+            workbook = tmp / "chrome_edu_workbook.md"
+            cache_dir = tmp / "cache"
+            edits = iter(range(1_000_000))
+
+            def cold():
+                shutil.rmtree(cache_dir, ignore_errors=True)
+                workbook.write_text(original, encoding='utf-8')
+
+            def edit_last_chapter():
+                workbook.write_text(f"{original}\n\n수정 {next(edits)}\n", encoding='utf-8')
+
+            for engine in self.pdf_engines:
+                if not engine_available(engine):
+                    print(f"  ⏭️  {engine}: 설치되어 있지 않아 건너뜀")
+                    continue
+                pdf_file = tmp / f"{engine}.pdf"
+
+                def build():
+                    WorkbookPDF(engine, cache_dir, jobs=os.cpu_count() or 1,
+                                render_markdown=render_markdown).build(
+                        workbook, pdf_file, "워크북", "벤치마크", datetime.now())
+
+                try:
+                    self.record(f"pdf.{engine} (cold)", "workbook", len(original),
+                                measure(build, self.repeat, setup=cold))
+                    self.record(f"pdf.{engine} (1장 변경)", "workbook", len(original),
+                                measure(build, self.repeat, setup=edit_last_chapter))
+                except Exception as e:
+                    print(f"  ⚠️  {engine}: {e}")
+
+    def bench_deck(self, label, generator):
+        """한 덱(실제 또는 합성)에 대해 HTML 생성 단계 측정"""
+        config = generator.get_slide_config()
+        count = len(config["slides"])
+        output_dir = generator.output_dir
+        # 슬라이드 HTML 파싱(IR)은 한 번만 일어나므로 측정 전에 끝내 둠
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.get_deck()
+
+        def reset_output():
+            shutil.rmtree(output_dir, ignore_errors=True)
+            output_dir.mkdir()
+
+        self.record("generate_indexes", label, count,
+                    measure(generator.generate_indexes, self.repeat))
+        self.record("generate_presentation_index", label, count,
+                    measure(generator.generate_presentation_index, self.repeat))
+        self.record("generate_build_info", label, count,
+                    measure(generator.generate_build_info, self.repeat))
+        self.record("copy_existing_slides (cold)", label, count,
+                    measure(generator.copy_existing_slides, self.repeat, setup=reset_output))
+        self.record("copy_existing_slides (warm)", label, count,
+                    measure(generator.copy_existing_slides, self.repeat))
+
+    def bench_pptx(self, label, project_dir, config):
+        """PPTX 생성 시간과, 텍스트 스타일 방식별 슬라이드 XML 크기와 저장 시간 비교"""
+        from generate_pptx import ChromeEducationPPTXGenerator
+
+        logging.getLogger().setLevel(logging.WARNING)
+        count = len(config["slides"])
+        for mode, theme_styles in PPTX_STYLE_MODES:
+            with contextlib.redirect_stdout(io.StringIO()):
+                generator = ChromeEducationPPTXGenerator(project_dir, theme_styles=theme_styles)
+            if theme_styles:
+                def fresh_deck():
+                    # 매번 빈 프레젠테이션에서 시작 (같은 prs에 슬라이드가 쌓이지 않도록)
+                    # 저장 위치는 임시 프로젝트의 output/이며 지난 반복의 파일은 삭제
+                    generator.new_presentation()
+                    for previous in generator.output_dir.glob("*.pptx"):
+                        previous.unlink()
+
+                self.record("pptx.generate_presentation", label, count,
+                            measure(lambda: generator.generate_presentation(config), self.repeat,
+                                    setup=fresh_deck))
+            # 같은 덱을 새로 렌더링한 뒤 슬라이드 XML 크기와 prs.save 시간만 측정
+            generator.new_presentation()
+            generator.render_deck(config, log_level=logging.DEBUG)
+            xml_bytes = sum(len(slide.part.blob) for slide in generator.prs.slides)
+            self.record(f"pptx.prs.save ({mode})", label, count,
+                        measure(lambda: generator.prs.save(io.BytesIO()), self.repeat))
+            self.pptx_styles.append({"size": label, "mode": mode, "slide_xml_bytes": xml_bytes,
+                                     "save_s": self.results[-1]["median_s"]})
+
+    def run(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            base = ChromeEducationSlidesGenerator(PROJECT_DIR)
+        real_config = base.get_deck()
+
+        self.bench_markdown()
+        self.bench_pdf(base)
+
+        decks = [("real", real_config)] + [(n, synthetic_config(real_config, n)) for n in self.sizes]
+        for label, config in decks:
+            print(f"🧪 덱: {label} (슬라이드 {len(config['slides']):,}개)")
+            project_dir = create_project(base, config)
+            try:
+                self.bench_deck(label, make_generator(project_dir, config))
+                if label == "real" or label in self.pptx_sizes:
+                    self.bench_pptx(label, project_dir, config)
+            finally:
+                shutil.rmtree(project_dir, ignore_errors=True)
+        return self.results
+
+
+def compare(results, baseline, threshold):
+    """기준 결과보다 threshold배 넘게 느려진 항목 목록"""
+    previous = {(r["name"], str(r["size"])): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get((result["name"], str(result["size"])))
+        if not before:
+            continue
+        limit = before["median_s"] * threshold + ABSOLUTE_SLACK
+        if result["median_s"] > limit:
+            regressions.append({
+                "name": result["name"],
+                "size": result["size"],
+                "baseline_s": before["median_s"],
+                "median_s": result["median_s"],
+                "ratio": round(result["median_s"] / before["median_s"], 2),
+            })
+    return regressions
+
+
+def scaling(results, stages=LINEAR_STAGES, limit=LINEAR_LIMIT):
+    """합성 덱 크기별 항목당 시간 비교 (가장 작은 덱 대비 limit배를 넘으면 선형이 아님)"""
+    report = []
+    for stage in stages:
+        points = sorted((r["size"], r["per_item_us"]) for r in results
+                        if r["name"] == stage and isinstance(r["size"], int))
+        if len(points) < 2:
+            continue
+        (smallest, base), (largest, last) = points[0], points[-1]
+        ratio = round(last / base, 2) if base else None
+        report.append({
+            "name": stage,
+            "sizes": [size for size, _ in points],
+            "per_item_us": [value for _, value in points],
+            "ratio": ratio,
+            "linear": ratio is not None and ratio <= limit,
+        })
+        mark = "✅" if report[-1]["linear"] else "⚠️ "
+        print(f"  {mark} {stage:<32} {smallest:,} → {largest:,}: 항목당 x{ratio}")
+    return report
+
+
+def pptx_style_report(entries):
+    """덱 크기별로 theme 방식이 per_run 방식보다 줄인 슬라이드 XML 크기와 저장 시간"""
+    report = []
+    by_size = {}
+    for entry in entries:
+        by_size.setdefault(entry["size"], {})[entry["mode"]] = entry
+    for size, modes in by_size.items():
+        theme, per_run = modes.get("theme"), modes.get("per_run")
+        if not theme or not per_run:
+            continue
+        item = {
+            "size": size,
+            "slide_xml_bytes": {"theme": theme["slide_xml_bytes"], "per_run": per_run["slide_xml_bytes"]},
+            "save_s": {"theme": theme["save_s"], "per_run": per_run["save_s"]},
+            "xml_reduction": round(1 - theme["slide_xml_bytes"] / per_run["slide_xml_bytes"], 3),
+            "save_reduction": round(1 - theme["save_s"] / per_run["save_s"], 3) if per_run["save_s"] else None,
+        }
+        report.append(item)
+        save = f"{-item['save_reduction'] * 100:+.1f}%" if item["save_reduction"] is not None else "-"
+        print(f"  🎨 {str(size):>6}: 슬라이드 XML {per_run['slide_xml_bytes']:,} → {theme['slide_xml_bytes']:,} bytes "
+              f"({-item['xml_reduction'] * 100:+.1f}%), 저장 {per_run['save_s'] * 1000:.1f} → "
+              f"{theme['save_s'] * 1000:.1f} ms ({save})")
+    return report
+
+
+def parse_sizes(value):
+    return tuple(int(size) for size in value.split(",") if size.strip())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="생성 단계별 벤치마크")
+    parser.add_argument("--sizes", type=parse_sizes, default=DEFAULT_SIZES,
+                        help="합성 덱 슬라이드 수 (기본값: 100,1000,10000)")
+    parser.add_argument("--pptx-sizes", type=parse_sizes, default=DEFAULT_PPTX_SIZES,
+                        help="PPTX 생성을 측정할 합성 덱 크기 (기본값: 100,1000)")
+    parser.add_argument("--pdf-engines", type=lambda value: tuple(e for e in value.split(",") if e),
+                        default=PDF_ENGINES, help="비교할 PDF 엔진 (기본값: weasyprint,xelatex)")
+    parser.add_argument("--repeat", type=int, default=3, help="항목별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--output", type=Path, default=PROJECT_DIR / "output" / "benchmark_results.json",
+                        help="결과 JSON 경로")
+    parser.add_argument("--baseline", type=Path, default=None, help="비교할 기준 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="회귀로 판단할 배수 (기본값: 1.3)")
+    args = parser.parse_args(argv)
+
+    print("🚀 생성 단계 벤치마크 시작")
+    runner = BenchmarkRunner(args.sizes, args.repeat, args.pptx_sizes, args.pdf_engines)
+    results = runner.run()
+
+    report = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "threshold": args.threshold,
+        "results": results,
+    }
+
+    print("📈 크기별 확장성 (항목당 시간)")
+    report["scaling"] = scaling(results)
+
+    print("🎨 PPTX 텍스트 스타일 (문단별 서식 → 템플릿 스타일)")
+    report["pptx_styles"] = pptx_style_report(runner.pptx_styles)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        report["baseline"] = str(args.baseline)
+        report["regressions"] = regressions
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"💾 결과 저장: {args.output}")
+
+    if regressions:
+        print(f"❌ 성능 회귀 {len(regressions)}건 (기준 대비 {args.threshold}배 초과):")
+        for item in regressions:
+            print(f"  - {item['name']} [{item['size']}]: {item['baseline_s'] * 1000:.2f} ms → "
+                  f"{item['median_s'] * 1000:.2f} ms (x{item['ratio']})")
+        return 1
+    if args.baseline:
+        print("✅ 성능 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
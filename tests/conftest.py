@@ -0,0 +1,9 @@
+"""pytest 설정: scripts/ 모듈을 테스트에서 바로 import"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+# 모듈 수준에서 바로 실행되는 수동 확인용 스크립트는 수집하지 않음
+collect_ignore = ["test_pptx.py", "simple_pptx_test.py", "benchmark_generation.py"]
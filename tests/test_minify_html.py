@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+HTML 최소화 도구 테스트
+
+사용법:
+    python3 -m pytest tests/test_minify_html.py
+"""
+
+import pytest
+
+from minify_html import minify_css, minify_html, minify_js
+
+
+def test_js_keeps_slashes_inside_strings_and_regex():
+    script = """
+        const url = 'http://example.com//path';
+        const pattern = /\\/\\/+/g;
+        const text = "a // b";
+    """
+    assert minify_js(script) == (
+        "const url = 'http://example.com//path';\n"
+        "const pattern = /\\/\\/+/g;\n"
+        'const text = "a // b";'
+    )
+
+
+def test_js_removes_line_comments_and_blank_lines():
+    script = "\n  // 설명\n  let a = 1;\n\n    // 또 설명\n  a += 1;\n"
+    assert minify_js(script) == "let a = 1;\na += 1;"
+
+
+@pytest.mark.parametrize("script", [
+    "const html = `\n  <li>  ${name}  </li>\n`;",
+    "const s = 'a\\\n    b';",
+])
+def test_js_multiline_strings_untouched(script):
+    assert minify_js(script) == script
+
+
+def test_css_child_combinator_and_pseudo_class():
+    assert minify_css("a:hover > b { color: red ; }") == "a:hover>b{color:red}"
+
+
+def test_css_descendant_space_before_pseudo_class_kept():
+    assert minify_css("nav  :focus { outline: none; }") == "nav :focus{outline:none}"
+
+
+def test_css_calc_spacing_kept():
+    css = "div { width: calc(100% - 2 * 10px); }"
+    assert minify_css(css) == "div{width:calc(100% - 2 * 10px)}"
+
+
+def test_css_comments_removed_strings_kept():
+    css = '/* 주석 */ a::after { content: "  /* x */ { } "; }'
+    assert minify_css(css) == 'a::after{content:"  /* x */ { } "}'
+
+
+def test_pre_and_textarea_whitespace_preserved():
+    html = ("<div>\n  <pre class=\"code\">  line 1\n\n    line 2  </pre>\n"
+            "  <textarea  rows=\"3\">  a\n   b </textarea>\n</div>")
+    assert minify_html(html) == (
+        "<div><pre class=\"code\">  line 1\n\n    line 2  </pre>"
+        "<textarea  rows=\"3\">  a\n   b </textarea></div>"
+    )
+
+
+def test_inline_whitespace_and_non_ascii_spaces_kept():
+    html = "<p>\n  크롬 <b>탭</b>   <i>그룹</i> 끝\n</p>"
+    assert minify_html(html) == "<p>크롬 <b>탭</b> <i>그룹</i> 끝</p>"
+
+
+def test_comments_removed_conditional_comments_kept():
+    html = "<body>\n<!-- 메모 -->\n<!--[if IE]><p>IE</p><![endif]-->\n</body>"
+    assert minify_html(html) == "<body><!--[if IE]><p>IE</p><![endif]--></body>"
+
+
+def test_inline_style_and_script_minified():
+    html = ("<head>\n<style>\n  a > b { color: red ; }\n</style>\n"
+            "<script>\n  // 주석\n  go('http://x');\n</script>\n</head>")
+    assert minify_html(html) == (
+        "<head><style>a>b{color:red}</style><script>go('http://x');</script></head>"
+    )
+
+
+SAMPLE_PAGE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>  크롬 교육  </title>
+    <style>
+        .card:hover > .title { width: calc(100% - 1rem) ; }
+        /* 주석 */
+    </style>
+</head>
+<body>
+    <!-- 내비게이션 -->
+    <nav class="flex   gap-2">
+        <a href="#"  class="px-4">이전</a> <a href="#">다음</a>
+    </nav>
+    <pre>  코드\n    들여쓰기  </pre>
+    <textarea>  입력  </textarea>
+    <script>
+        // 검색
+        const re = /\\/\\//;
+        fetch('https://example.com/search_index.json');
+        const item = `<li class="block">${name}</li>`;
+    </script>
+</body>
+</html>
+"""
+
+
+def test_minify_is_idempotent():
+    once = minify_html(SAMPLE_PAGE)
+    assert minify_html(once) == once
+    assert len(once) < len(SAMPLE_PAGE)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+라이브러리 스크립트 정리 테스트
+
+사용법:
+    python3 -m pytest tests/test_prune_scripts.py
+"""
+
+import pytest
+
+from prune_scripts import library_usage, prune_scripts
+
+PAGE = """<head>
+<script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+</head>
+<body><canvas id="chart"></canvas>
+<script>%s</script>
+</body>"""
+
+
+@pytest.mark.parametrize("code", [
+    "document.addEventListener('DOMContentLoaded', function () { new Chart(ctx, {}); });",
+    "window.addEventListener(\"load\", () => { const s = '}'; /* } */ new Chart(ctx, {}); });",
+    "window.onload = async function init() {\n  // }\n  new Chart(ctx, {});\n};",
+])
+def test_usage_inside_handler_deferred(code):
+    assert library_usage(PAGE % code)["chart.js"] == "deferred"
+    html, report = prune_scripts(PAGE % code)
+    assert report["deferred"] == ["chart.js"]
+    assert 'chart.js" defer></script>' in html
+
+
+@pytest.mark.parametrize("code", [
+    # 핸들러 밖에서도 사용
+    "document.addEventListener('DOMContentLoaded', () => { new Chart(a, {}); });\nChart.defaults.color = '#333';",
+    # 핸들러 밖에 정의한 함수를 이름으로 넘김
+    "function draw() { new Chart(ctx, {}); }\ndocument.addEventListener('DOMContentLoaded', draw);",
+    # 이벤트 이름이 주석에만 있음
+    "// DOMContentLoaded 이후에 실행\nnew Chart(ctx, {});",
+    # 이미지의 load는 defer 스크립트보다 먼저 올 수 있음
+    "img.addEventListener('load', () => { new Chart(ctx, {}); });",
+    # 핸들러 본문이 닫히지 않음
+    "document.addEventListener('DOMContentLoaded', () => { new Chart(ctx, {});",
+])
+def test_usage_outside_handler_kept_sync(code):
+    assert library_usage(PAGE % code)["chart.js"] == "sync"
+    html, report = prune_scripts(PAGE % code)
+    assert report["deferred"] == []
+    assert 'chart.js"></script>' in html
+
+
+def test_unused_library_removed():
+    html, report = prune_scripts(PAGE % "console.log('차트 없음');")
+    assert report["removed"] == ["chart.js"]
+    assert "chart.js" not in html
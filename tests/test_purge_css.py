@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+사용하지 않는 Tailwind 규칙 제거 테스트
+
+사용법:
+    python3 -m pytest tests/test_purge_css.py
+"""
+
+from page_templates import pager_html
+from purge_css import collect_classes, parse_blocks, purge_css, selector_used
+from search_index import SEARCH_BOX, SEARCH_SCRIPT
+
+VENDOR_CSS = r"""/*! tailwindcss { not a rule } */
+*,::after{box-sizing:border-box}
+.content-\[\"\}\"\]::after{content:"}"}
+.block{display:block}
+.hidden{display:none}
+.px-4{padding-left:1rem;padding-right:1rem}
+.py-3{padding-top:.75rem;padding-bottom:.75rem}
+.text-gray-500{color:#6b7280}
+.sr-only{position:absolute;width:1px}
+.hover\:bg-blue-50:hover{background-color:#eff6ff}
+.focus\:ring-2:focus{box-shadow:0 0 0 2px}
+.w-1\/2{width:50%}
+.animate-spin{animation:spin 1s linear infinite}
+.animate-ping{animation:ping 1s infinite}
+@keyframes spin{to{transform:rotate(360deg)}}
+@keyframes ping{75%,to{transform:scale(2);opacity:0}}
+@media (min-width:640px){.sm\:grid-cols-2{grid-template-columns:repeat(2,1fr)}.sm\:flex{display:flex}
+@supports (display:grid){.sm\:grid{display:grid}}}
+@media (min-width:1024px){.lg\:hidden{display:none}}
+@charset "UTF-8";
+"""
+
+
+def test_parse_blocks_nested_media():
+    blocks = parse_blocks("a{color:red}@media (min-width:640px){.sm\\:flex{display:flex}@supports (x:y){.b{c:d}}}")
+    assert blocks == [
+        ("a", "color:red"),
+        ("@media (min-width:640px)", ".sm\\:flex{display:flex}@supports (x:y){.b{c:d}}"),
+    ]
+    assert parse_blocks(blocks[1][1]) == [(".sm\\:flex", "display:flex"), ("@supports (x:y)", ".b{c:d}")]
+
+
+def test_parse_blocks_skips_comments_and_strings_with_braces():
+    blocks = parse_blocks('/* { */ a::after{content:"}{"} @import "x;y"; b{c:d}')
+    assert blocks == [("a::after", 'content:"}{"'), ('@import "x;y"', None), ("b", "c:d")]
+    assert parse_blocks('.a\\{b\\"{c:d}') == [('.a\\{b\\"', "c:d")]
+
+
+def test_selector_used_unescapes_class_names():
+    used = {"hover:bg-blue-50", "w-1/2"}
+    assert selector_used(".hover\\:bg-blue-50:hover", used)
+    assert selector_used(".w-1\\/2", used)
+    assert selector_used("*,::after", set())
+    assert not selector_used(".px-4 .py-3", {"px-4"})
+
+
+def test_purge_keeps_used_rules_only():
+    css = purge_css(VENDOR_CSS, {"block", "sm:flex", "animate-spin"})
+    assert ".block{display:block}" in css
+    assert "@media (min-width:640px){.sm\\:flex{display:flex}}" in css
+    assert "*,::after{box-sizing:border-box}" in css
+    assert '@charset "UTF-8";' in css
+    for unused in (".hidden", ".px-4", "sm\\:grid", "lg\\:hidden", "content-"):
+        assert unused not in css
+    # 비게 된 @media는 통째로 삭제
+    assert "1024px" not in css
+
+
+def test_purge_drops_unused_keyframes():
+    css = purge_css(VENDOR_CSS, {"animate-spin"})
+    assert "@keyframes spin" in css
+    assert "@keyframes ping" not in css
+
+
+def test_search_and_pager_classes_survive(tmp_path):
+    """검색 결과와 페이지 이동 막대의 클래스 (스크립트가 만드는 HTML 포함)가 남는지 확인"""
+    page = tmp_path / "index.html"
+    names = [f"index_{i}.html" for i in range(1, 11)]
+    page.write_text(f"<body>{SEARCH_BOX}{pager_html(names, 5)}{SEARCH_SCRIPT}</body>", encoding='utf-8')
+    used = collect_classes([page])
+
+    for name in ("block", "px-4", "py-3", "text-gray-500", "sr-only", "hover:bg-blue-50", "focus:ring-2"):
+        assert name in used
+    css = purge_css(VENDOR_CSS, used)
+    assert ".hover\\:bg-blue-50:hover{background-color:#eff6ff}" in css
+    assert ".focus\\:ring-2:focus{box-shadow:0 0 0 2px}" in css
+    assert ".text-gray-500{color:#6b7280}" in css
+    assert ".hidden" not in css
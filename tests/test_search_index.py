@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+검색 색인 테스트
+
+사용법:
+    python3 -m pytest tests/test_search_index.py
+"""
+
+import json
+import re
+import shutil
+import subprocess
+import unicodedata
+
+import pytest
+
+from search_index import SEARCH_SCRIPT, build_index, snippet, tokenize
+
+
+def test_hangul_runs_become_bigrams():
+    assert tokenize("탭그룹") == {"탭그", "그룹"}
+    assert tokenize("크롬 확장프로그램") == {"크롬", "확장", "장프", "프로", "로그", "그램"}
+
+
+def test_single_syllable_kept():
+    assert tokenize("탭 관리") == {"탭", "관리"}
+
+
+def test_mixed_latin_lowercased_and_split_from_hangul():
+    assert tokenize("Chrome확장 Google Classroom 2024") == {
+        "chrome", "확장", "google", "classroom", "2024"}
+
+
+def test_nfd_input_normalized():
+    decomposed = unicodedata.normalize("NFD", "북마크")
+    assert decomposed != "북마크"
+    assert tokenize(decomposed) == {"북마", "마크"}
+
+
+def test_punctuation_and_symbols_ignored():
+    assert tokenize("— · ! ?") == set()
+    assert tokenize("Ctrl+Shift+T") == {"ctrl", "shift", "t"}
+
+
+def test_build_index_delta_postings():
+    documents = [
+        {"title": "탭 그룹", "href": "01_tabs.html", "text": "크롬 탭 정리"},
+        {"title": "북마크", "href": "02_bookmarks.html", "text": "Chrome 북마크"},
+        {"title": "탭 검색", "href": "03_search.html", "text": "chrome 탭 검색"},
+    ]
+    index = build_index(documents)
+
+    assert index["docs"][1] == ["북마크", "02_bookmarks.html", "Chrome 북마크"]
+    assert list(index["terms"]) == sorted(index["terms"])
+    # 문서 번호 0, 2 → [0, 2], 1, 2 → [1, 1]
+    assert index["terms"]["탭"] == [0, 2]
+    assert index["terms"]["chrome"] == [1, 1]
+    assert index["terms"]["북마"] == [1]
+
+
+def test_build_index_is_deterministic():
+    documents = [{"title": f"슬라이드 {i}", "href": f"{i:02d}.html", "text": "구글 클래스룸"}
+                 for i in range(5)]
+    assert json.dumps(build_index(documents)) == json.dumps(build_index(iter(documents)))
+
+
+def test_snippet_truncated():
+    assert snippet("가" * 10, length=20) == "가" * 10
+    assert snippet("가나다 " * 10, length=8) == "가나다 가나다…"
+
+
+@pytest.mark.skipif(not shutil.which("node"), reason="node 없음")
+def test_browser_tokenize_matches_python():
+    """검색 스크립트의 tokenize가 색인과 같은 토큰을 만드는지 확인"""
+    function = re.search(r"function tokenize\(text\) \{.*?\n            \}\n", SEARCH_SCRIPT, re.DOTALL).group(0)
+    samples = ["탭그룹", "탭 관리", "Chrome확장 Google 2024", unicodedata.normalize("NFD", "북마크"), "!?"]
+    program = function + f"console.log(JSON.stringify({json.dumps(samples)}.map(s => tokenize(s).sort())));"
+    result = subprocess.run(["node", "-e", program], capture_output=True, text=True, check=True)
+    assert json.loads(result.stdout) == [sorted(tokenize(sample)) for sample in samples]
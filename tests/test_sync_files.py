@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+파일 동기화 테스트
+
+사용법:
+    python3 -m pytest tests/test_sync_files.py
+"""
+
+import json
+
+import pytest
+
+from sync_files import FileSync
+
+
+@pytest.fixture
+def sources(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for name, text in (("a.md", "가"), ("b.md", "나")):
+        (src / name).write_text(text, encoding='utf-8')
+    return src
+
+
+def test_duplicate_basenames_refused(tmp_path, sources):
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "a.md").write_text("다", encoding='utf-8')
+    with pytest.raises(ValueError, match="a.md"):
+        FileSync().sync_files([sources / "a.md", other / "a.md"], tmp_path / "out")
+    assert not (tmp_path / "out").exists()
+
+
+def test_stale_copy_removed(tmp_path, sources):
+    out, record = tmp_path / "out", tmp_path / "sync.json"
+    FileSync().sync_files([sources / "a.md", sources / "b.md"], out, record=record)
+    assert set(json.loads(record.read_text(encoding='utf-8'))) == {"a.md", "b.md"}
+
+    sync = FileSync()
+    sync.sync_files([sources / "a.md"], out, record=record)
+    assert sorted(p.name for p in out.iterdir()) == ["a.md"]
+    assert sync.stats["removed"] == 1
+
+
+def test_file_rewritten_by_other_step_kept(tmp_path, sources):
+    out, record = tmp_path / "out", tmp_path / "sync.json"
+    FileSync().sync_files([sources / "a.md", sources / "b.md"], out, record=record)
+    (out / "b.md").write_text("다른 단계가 만든 파일", encoding='utf-8')
+
+    FileSync().sync_files([sources / "a.md"], out, record=record)
+    assert (out / "b.md").read_text(encoding='utf-8') == "다른 단계가 만든 파일"
+    assert json.loads(record.read_text(encoding='utf-8')).keys() == {"a.md"}
+
+
+def test_old_name_list_record_deletes_nothing(tmp_path, sources):
+    out, record = tmp_path / "out", tmp_path / "sync.json"
+    out.mkdir()
+    (out / "old.md").write_text("예전", encoding='utf-8')
+    record.write_text(json.dumps(["old.md"]), encoding='utf-8')
+
+    FileSync().sync_files([sources / "a.md"], out, record=record)
+    assert (out / "old.md").exists()